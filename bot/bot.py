@@ -1,13 +1,14 @@
 import os
 import discord
-from discord.ext import commands, tasks
+from discord.ext import commands
 from discord import app_commands
 from dotenv import load_dotenv
 import asyncio
 from datetime import datetime, timedelta
+import logging
 import seek_jobs_monitor as seek
-import sys
-from io import StringIO
+from ratelimit import rate_limiter, PRIORITY_JOBS, PRIORITY_USER
+from logs import log_pipeline, DiscordSink
 import random
 import aiosqlite
 import signal
@@ -16,27 +17,26 @@ import openai
 import json
 import time
 import re
+import heapq
 
 # Load environment variables
 load_dotenv()
 
+logger = logging.getLogger('seekret.bot')
+
 # Bot configuration
 DISCORD_TOKEN = os.getenv('DISCORD_BOT_TOKEN')
 JOBS_CHANNEL_ID = int(os.getenv('DISCORD_JOBS_CHANNEL_ID', '0'))
 LOGS_CHANNEL_ID = int(os.getenv('DISCORD_LOGS_CHANNEL_ID', '0'))
 SAVED_JOBS_CHANNEL_ID = int(os.getenv('DISCORD_SAVED_JOBS_CHANNEL_ID', '0'))
+POST_CONCURRENCY = int(os.getenv('POST_CONCURRENCY', '3'))  # Job posts sent to a channel at once (1 keeps strict order)
 
 # OpenAI API Configuration
 OPENAI_API_KEY = os.getenv('OPENAI_API_KEY')
 OPENAI_MODEL = os.getenv('OPENAI_MODEL', 'gpt-4o')
 
 # Initialize OpenAI client if key exists
-if OPENAI_API_KEY:
-    openai_client = openai.OpenAI(api_key=OPENAI_API_KEY)
-    print("✓ OpenAI client initialized")
-else:
-    openai_client = None
-    print("⚠ OpenAI API key not found, AI features will not be available")
+openai_client = openai.OpenAI(api_key=OPENAI_API_KEY) if OPENAI_API_KEY else None
 
 # Global flag for shutdown
 shutdown_flag = False
@@ -45,35 +45,6 @@ shutdown_event = None  # Will be initialized in main()
 # Global bot instance for job posting
 bot_instance = None
 
-# Database connection pool
-class DatabasePool:
-    def __init__(self):
-        self._pool = []
-        self._pool_lock = asyncio.Lock()
-        self._max_size = 5  # Maximum number of connections to keep in pool
-
-    async def get_connection(self):
-        async with self._pool_lock:
-            if self._pool:
-                return self._pool.pop()
-            return await aiosqlite.connect(seek.DATABASE_PATH)
-
-    async def release_connection(self, conn):
-        async with self._pool_lock:
-            if len(self._pool) < self._max_size:
-                self._pool.append(conn)
-            else:
-                await conn.close()
-
-    async def cleanup(self):
-        async with self._pool_lock:
-            while self._pool:
-                conn = self._pool.pop()
-                await conn.close()
-
-# Global database pool instance
-db_pool = DatabasePool()
-
 # Cache for job data
 @lru_cache(maxsize=1000)
 def get_job_cache_key(job_id: str, user_id: str = None):
@@ -84,47 +55,42 @@ async def get_cached_job_data(job_id: str, user_id: str = None):
     """Get job data with caching"""
     cache_key = get_job_cache_key(job_id, user_id)
     
-    # Try to get a connection from the pool
-    conn = await db_pool.get_connection()
     try:
-        conn.row_factory = aiosqlite.Row
-        async with conn.execute(
-            '''
-            SELECT j.*, sj.user_id, sj.status, sj.saved_date
-            FROM jobs j
-            LEFT JOIN saved_jobs sj ON j.id = sj.job_id AND sj.user_id = ?
-            WHERE j.id = ?
-            ''',
-            (user_id, job_id) if user_id else (None, job_id)
-        ) as cursor:
-            job_data = await cursor.fetchone()
+        async with seek.database.reader() as conn:
+            conn.row_factory = aiosqlite.Row
+            async with conn.execute(
+                '''
+                SELECT j.*, sj.user_id, sj.status, sj.saved_date
+                FROM jobs j
+                LEFT JOIN saved_jobs sj ON j.id = sj.job_id AND sj.user_id = ?
+                WHERE j.id = ?
+                ''',
+                (user_id, job_id) if user_id else (None, job_id)
+            ) as cursor:
+                job_data = await cursor.fetchone()
             
-            # Check if job data is valid
-            if not job_data:
-                print(f"⚠ Warning: No job data found for job_id: {job_id}")
-                return None
+                # Check if job data is valid
+                if not job_data:
+                    logger.warning(f"⚠ Warning: No job data found for job_id: {job_id}")
+                    return None
                 
-            # Convert to dict and check all required fields are present
-            job_dict = dict(job_data)
+                # Convert to dict and check all required fields are present
+                job_dict = dict(job_data)
             
-            # Ensure critical fields are not None
-            required_fields = ['title', 'company', 'description']
-            for field in required_fields:
-                if field not in job_dict or job_dict[field] is None:
-                    job_dict[field] = f"Unknown {field}"
+                # Ensure critical fields are not None
+                required_fields = ['title', 'company', 'description']
+                for field in required_fields:
+                    if field not in job_dict or job_dict[field] is None:
+                        job_dict[field] = f"Unknown {field}"
                     
-            # Ensure bullet_points is valid JSON or empty list
-            if 'bullet_points' not in job_dict or not job_dict['bullet_points']:
-                job_dict['bullet_points'] = '[]'
+                # Ensure bullet_points is valid JSON or empty list
+                if 'bullet_points' not in job_dict or not job_dict['bullet_points']:
+                    job_dict['bullet_points'] = '[]'
                 
-            return job_dict
+                return job_dict
     except Exception as e:
-        print(f"Error retrieving job data: {str(e)}")
-        import traceback
-        print(traceback.format_exc())
+        logger.exception(f"Error retrieving job data: {str(e)}")
         return None
-    finally:
-        await db_pool.release_connection(conn)
 
 # Reminder messages
 REMINDER_MESSAGES = [
@@ -135,25 +101,38 @@ REMINDER_MESSAGES = [
     "This job caught your eye earlier. Why not take the next step and apply? 🎯"
 ]
 
+# Saved jobs are kept per user, so several users can save the same job
+SAVED_JOBS_TABLE_SQL = '''
+    CREATE TABLE IF NOT EXISTS {name} (
+        job_id TEXT NOT NULL,
+        user_id TEXT NOT NULL,
+        saved_date TEXT,
+        last_reminder_date TEXT,
+        reminder_count INTEGER DEFAULT 0,
+        status TEXT DEFAULT 'saved',
+        message_id TEXT,
+        ai_compatibility_score REAL,
+        ai_compatibility_details TEXT,
+        last_analyzed_date TEXT,
+        saved_ts INTEGER,
+        last_reminder_ts INTEGER,
+        next_reminder_ts INTEGER,
+        PRIMARY KEY (user_id, job_id),
+        FOREIGN KEY (job_id) REFERENCES jobs (id)
+    )
+'''
+SAVED_JOBS_COLUMNS = (
+    'job_id', 'user_id', 'saved_date', 'last_reminder_date', 'reminder_count', 'status',
+    'message_id', 'ai_compatibility_score', 'ai_compatibility_details', 'last_analyzed_date',
+    'saved_ts', 'last_reminder_ts', 'next_reminder_ts'
+)
+SAVED_JOBS_PAGE_SIZE = 10  # Saved jobs shown per page of /saved
+
 async def setup_saved_jobs_table():
     """Initialize the saved jobs table in the database."""
-    async with seek.aiosqlite.connect(seek.DATABASE_PATH) as db:
+    async with seek.database.writer() as db:
         # Create saved jobs table with additional fields for compatibility
-        await db.execute('''
-            CREATE TABLE IF NOT EXISTS saved_jobs (
-                job_id TEXT PRIMARY KEY,
-                user_id TEXT,
-                saved_date TEXT,
-                last_reminder_date TEXT,
-                reminder_count INTEGER DEFAULT 0,
-                status TEXT DEFAULT 'saved',
-                message_id TEXT,
-                ai_compatibility_score REAL,
-                ai_compatibility_details TEXT,
-                last_analyzed_date TEXT,
-                FOREIGN KEY (job_id) REFERENCES jobs (id)
-            )
-        ''')
+        await db.execute(SAVED_JOBS_TABLE_SQL.format(name='saved_jobs'))
         
         # Create user resumes table
         await db.execute('''
@@ -170,13 +149,15 @@ async def setup_saved_jobs_table():
         
         # Run migrations for saved_jobs table
         await migrate_saved_jobs_table(db)
+        await create_saved_jobs_indexes(db)
         
-    print("✓ Saved jobs and resumes tables initialized")
+    await reminder_scheduler.load()
+    logger.info(f"✓ Saved jobs and resumes tables initialized ({len(reminder_scheduler)} reminders scheduled)")
 
 async def migrate_saved_jobs_table(db):
     """Check for and apply migrations to the saved_jobs table."""
     try:
-        print("🔄 Checking for saved_jobs table migrations...")
+        logger.info("🔄 Checking for saved_jobs table migrations...")
         
         # Get current table schema
         async with db.execute("PRAGMA table_info(saved_jobs)") as cursor:
@@ -188,7 +169,10 @@ async def migrate_saved_jobs_table(db):
         expected_columns = {
             "ai_compatibility_score": "REAL",
             "ai_compatibility_details": "TEXT",
-            "last_analyzed_date": "TEXT"
+            "last_analyzed_date": "TEXT",
+            "saved_ts": "INTEGER",
+            "last_reminder_ts": "INTEGER",
+            "next_reminder_ts": "INTEGER"
         }
         
         for col_name, col_type in expected_columns.items():
@@ -197,134 +181,764 @@ async def migrate_saved_jobs_table(db):
         
         # Add any missing columns
         for col_name, col_type in missing_columns:
-            print(f"➕ Adding missing column to saved_jobs: {col_name}")
+            logger.info(f"➕ Adding missing column to saved_jobs: {col_name}")
             await db.execute(f"ALTER TABLE saved_jobs ADD COLUMN {col_name} {col_type}")
         
         if missing_columns:
             await db.commit()
-            print(f"✅ Added {len(missing_columns)} missing columns to saved_jobs table")
-        else:
-            print("✓ No saved_jobs table migrations needed")
+            logger.info(f"✅ Added {len(missing_columns)} missing columns to saved_jobs table")
+        
+        # Tables created before saved jobs were per user are keyed on job_id alone
+        primary_key = [column[1] for column in sorted(columns, key=lambda column: column[5]) if column[5]]
+        if primary_key != ['user_id', 'job_id']:
+            await rebuild_saved_jobs_table(db)
+        elif not missing_columns:
+            logger.info("✓ No saved_jobs table migrations needed")
             
     except Exception as e:
-        print(f"⚠️ Error during saved_jobs table migration: {str(e)}")
+        logger.warning(f"⚠️ Error during saved_jobs table migration: {str(e)}")
         # Don't raise exception to allow app to continue with partial functionality
 
+async def rebuild_saved_jobs_table(db):
+    """Copy saved_jobs into a table keyed on (user_id, job_id).
+    
+    SQLite cannot change a primary key in place, so the rows move to a new
+    table that then replaces the old one, all in one transaction.
+    """
+    logger.info("🔄 Rebuilding saved_jobs with a per-user key...")
+    columns = ', '.join(SAVED_JOBS_COLUMNS)
+    try:
+        if db.in_transaction:
+            await db.commit()
+        await db.execute('DROP TABLE IF EXISTS saved_jobs_rebuild')
+        await db.execute('BEGIN')
+        await db.execute(SAVED_JOBS_TABLE_SQL.format(name='saved_jobs_rebuild'))
+        await db.execute(f'''
+            INSERT OR IGNORE INTO saved_jobs_rebuild ({columns})
+            SELECT {columns} FROM saved_jobs WHERE user_id IS NOT NULL AND job_id IS NOT NULL
+        ''')
+        await db.execute('DROP TABLE saved_jobs')
+        await db.execute('ALTER TABLE saved_jobs_rebuild RENAME TO saved_jobs')
+        await db.commit()
+    except Exception:
+        await db.rollback()
+        raise
+    logger.info("✅ saved_jobs is now keyed by user and job")
+
+async def create_saved_jobs_indexes(db):
+    """Backfill epoch timestamps and create the saved_jobs indexes."""
+    # Saved job dates are stored as UTC 'YYYY-MM-DD HH:MM:SS' strings
+    await db.execute('''
+        UPDATE saved_jobs SET saved_ts = CAST(strftime('%s', saved_date) AS INTEGER)
+        WHERE saved_ts IS NULL AND saved_date IS NOT NULL
+    ''')
+    await db.execute('''
+        UPDATE saved_jobs SET last_reminder_ts = CAST(strftime('%s', last_reminder_date) AS INTEGER)
+        WHERE last_reminder_ts IS NULL AND last_reminder_date IS NOT NULL
+    ''')
+    # /saved pages on saved_ts, so rows without a save date sort last instead of dropping out
+    await db.execute('UPDATE saved_jobs SET saved_ts = 0 WHERE saved_ts IS NULL')
+    # Schedule the next reminder for saved jobs stored before reminders had due times
+    await db.execute('''
+        UPDATE saved_jobs SET next_reminder_ts = COALESCE(last_reminder_ts, saved_ts, CAST(strftime('%s', 'now') AS INTEGER)) + ?
+        WHERE next_reminder_ts IS NULL AND status = 'saved' AND reminder_count < ?
+    ''', (REMINDER_INTERVAL, REMINDER_MAX_COUNT))
+    await db.execute('DROP INDEX IF EXISTS idx_saved_jobs_reminders')
+    await db.execute('''
+        CREATE INDEX IF NOT EXISTS idx_saved_jobs_next_reminder
+        ON saved_jobs (next_reminder_ts) WHERE next_reminder_ts IS NOT NULL
+    ''')
+    await db.execute('CREATE INDEX IF NOT EXISTS idx_saved_jobs_message_id ON saved_jobs (message_id)')
+    await db.execute('''
+        CREATE INDEX IF NOT EXISTS idx_saved_jobs_user_status
+        ON saved_jobs (user_id, status, saved_ts, job_id)
+    ''')
+    await db.commit()
+
 async def save_job_for_user(job_id: str, user_id: str, message_id: str):
     """Save a job for a user and set up initial reminder."""
     try:
-        async with seek.aiosqlite.connect(seek.DATABASE_PATH) as db:
+        async with seek.database.writer() as db:
             # Store dates in UTC ISO format for consistency
             current_time = datetime.utcnow().strftime('%Y-%m-%d %H:%M:%S')
+            now = int(time.time())
+            # Saving again restarts the reminders but keeps any compatibility analysis
             await db.execute('''
-                INSERT OR REPLACE INTO saved_jobs 
-                (job_id, user_id, saved_date, last_reminder_date, reminder_count, status, message_id)
-                VALUES (?, ?, datetime(?), NULL, 0, 'saved', ?)
-            ''', (job_id, str(user_id), current_time, message_id))
+                INSERT INTO saved_jobs 
+                (job_id, user_id, saved_date, last_reminder_date, reminder_count, status, message_id,
+                 saved_ts, last_reminder_ts, next_reminder_ts)
+                VALUES (?, ?, datetime(?), NULL, 0, 'saved', ?, ?, NULL, ?)
+                ON CONFLICT(user_id, job_id) DO UPDATE SET
+                    saved_date = excluded.saved_date, last_reminder_date = NULL, reminder_count = 0,
+                    status = 'saved', message_id = excluded.message_id, saved_ts = excluded.saved_ts,
+                    last_reminder_ts = NULL, next_reminder_ts = excluded.next_reminder_ts
+            ''', (job_id, str(user_id), current_time, message_id, now, now + REMINDER_INTERVAL))
             await db.commit()
+        reminder_scheduler.schedule(job_id, user_id, now + REMINDER_INTERVAL)
     except Exception as e:
-        print(f"Error saving job for user: {str(e)}")
+        logger.error(f"Error saving job for user: {str(e)}")
         raise
 
-async def check_saved_jobs_reminders():
-    """Check saved jobs and send reminders if needed."""
-    if not bot_instance:
-        print("⚠ Bot instance not available for reminders")
+async def get_saved_jobs_page(user_id, status='saved', after=None, page_size=SAVED_JOBS_PAGE_SIZE):
+    """Get one page of a user's saved jobs, newest first, and the cursor for the next page.
+    
+    Pages are keyset-paginated on (saved_ts, job_id): after is the last row
+    of the previous page, so every page is a range scan of
+    idx_saved_jobs_user_status however many jobs the user has saved.
+    The cursor is None on the last page.
+    """
+    keyset = 'AND (sj.saved_ts, sj.job_id) < (?, ?)' if after else ''
+    async with seek.database.reader() as db:
+        db.row_factory = aiosqlite.Row
+        async with db.execute(f'''
+            SELECT sj.job_id, sj.saved_ts, sj.reminder_count, sj.next_reminder_ts, sj.ai_compatibility_score,
+                   j.title, j.company, j.location, j.salary
+            FROM saved_jobs sj
+            JOIN jobs j ON j.id = sj.job_id
+            WHERE sj.user_id = ? AND sj.status = ? {keyset}
+            ORDER BY sj.saved_ts DESC, sj.job_id DESC
+            LIMIT ?
+        ''', (str(user_id), status, *(after or ()), page_size + 1)) as cursor:
+            rows = await cursor.fetchall()
+    if len(rows) > page_size:
+        rows = rows[:page_size]
+        return rows, (rows[-1]['saved_ts'], rows[-1]['job_id'])
+    return rows, None
+
+async def count_saved_jobs(user_id, status='saved'):
+    """Count a user's saved jobs with a status."""
+    async with seek.database.reader() as db:
+        async with db.execute(
+            'SELECT COUNT(*) FROM saved_jobs WHERE user_id = ? AND status = ?',
+            (str(user_id), status)
+        ) as cursor:
+            return (await cursor.fetchone())[0]
+
+# Bulk delete limits for /purge
+PURGE_BULK_LIMIT = 100  # Discord's limit on messages per bulk delete
+PURGE_BULK_MAX_AGE = 14 * 24 * 60 * 60 - 60 * 60  # Bulk deletes reject messages over 14 days old; keep an hour spare
+
+async def setup_job_messages_table():
+    """Initialize the table recording which message every posted job lives in."""
+    async with seek.database.writer() as db:
+        await db.execute('''
+            CREATE TABLE IF NOT EXISTS job_messages (
+                message_id INTEGER NOT NULL,
+                job_id TEXT NOT NULL,
+                channel_id INTEGER NOT NULL,
+                posted_ts INTEGER NOT NULL,
+                PRIMARY KEY (message_id, job_id)
+            )
+        ''')
+        await db.execute('CREATE INDEX IF NOT EXISTS idx_job_messages_channel ON job_messages (channel_id, job_id)')
+        await db.execute('CREATE INDEX IF NOT EXISTS idx_job_messages_job ON job_messages (job_id)')
+        await db.commit()
+    logger.info("✓ Job messages table initialized")
+
+async def record_job_messages(posts):
+    """Record where jobs were posted, given (job_id, message) pairs."""
+    rows = [
+        (message.id, job_id, message.channel.id, int(message.created_at.timestamp()))
+        for job_id, message in posts
+    ]
+    if not rows:
         return
-        
     try:
-        channel = bot_instance.get_channel(SAVED_JOBS_CHANNEL_ID)
-        if not channel:
-            print("⚠ Could not find saved jobs channel")
+        async with seek.database.writer() as db:
+            await db.executemany('''
+                INSERT OR REPLACE INTO job_messages (message_id, job_id, channel_id, posted_ts)
+                VALUES (?, ?, ?, ?)
+            ''', rows)
+    except Exception as e:
+        logger.warning(f"⚠ Error recording job messages: {str(e)}")
+
+async def index_channel_history(channel):
+    """Record the job posts already in a channel's history. Returns the number of messages found.
+    
+    Only needed once for posts made before job messages were recorded.
+    """
+    posts = []
+    messages = 0
+    async for message in channel.history(limit=None):
+        if message.author.id != bot_instance.user.id or not message.embeds:
+            continue
+        job_ids = set()
+        for embed in message.embeds:
+            job_ids.update(DIGEST_JOB_ID_PATTERN.findall(f"{embed.url or ''} {embed.description or ''}"))
+        if job_ids:
+            posts.extend((job_id, message) for job_id in job_ids)
+            messages += 1
+    await record_job_messages(posts)
+    return messages
+
+def purge_query(search_term):
+    """Turn a /purge term into an FTS5 phrase query, the last word matching as a prefix."""
+    terms = seek.SEARCH_TERM_PATTERN.findall(search_term.lower())
+    if not terms:
+        return None
+    return '"' + ' '.join(terms) + '"*'
+
+async def find_job_messages(channel_id, search_term):
+    """Find the messages in a channel whose jobs mention search_term.
+    
+    Returns the (message_id, posted_ts) of the messages to delete and the
+    number of digest messages left alone because they also list jobs that do
+    not match. Jobs are looked up through the jobs_fts index and joined to
+    the channel's posts through idx_job_messages_channel; without FTS5 the
+    job columns are scanned for the term instead.
+    """
+    if seek.search_available:
+        query = purge_query(search_term)
+        if query is None:
+            return [], 0
+        matched = '''
+            SELECT j.id FROM jobs_fts
+            JOIN jobs j ON j.rowid = jobs_fts.rowid
+            WHERE jobs_fts MATCH ?
+        '''
+        params = (query, channel_id)
+    else:
+        text = " || ' ' || ".join(f"COALESCE({column}, '')" for column in seek.SEARCH_COLUMNS)
+        matched = f'SELECT id FROM jobs WHERE instr(lower({text}), ?) > 0'
+        params = (search_term.lower(), channel_id)
+    
+    async with seek.database.reader() as db:
+        async with db.execute(f'''
+            WITH matched AS ({matched}),
+            hits AS (
+                SELECT DISTINCT m.message_id FROM job_messages m
+                JOIN matched ON matched.id = m.job_id
+                WHERE m.channel_id = ?
+            )
+            SELECT m.message_id, MIN(m.posted_ts), COUNT(*) = SUM(m.job_id IN (SELECT id FROM matched))
+            FROM hits
+            JOIN job_messages m ON m.message_id = hits.message_id
+            GROUP BY m.message_id
+        ''', params) as cursor:
+            rows = await cursor.fetchall()
+    messages = [(message_id, posted_ts) for message_id, posted_ts, whole in rows if whole]
+    return messages, len(rows) - len(messages)
+
+async def delete_channel_messages(channel, messages):
+    """Delete (message_id, posted_ts) messages from a channel and return the IDs that are gone.
+    
+    Messages young enough for Discord's bulk delete go in chunks of
+    PURGE_BULK_LIMIT; older ones, and chunks Discord rejects, are deleted one
+    at a time, paced by the rate limiter so a large purge never trips a 429.
+    """
+    route = f"delete:{channel.id}"
+    cutoff = time.time() - PURGE_BULK_MAX_AGE
+    recent = sorted(message_id for message_id, posted_ts in messages if posted_ts >= cutoff)
+    singles = sorted(message_id for message_id, posted_ts in messages if posted_ts < cutoff)
+    deleted = []
+    
+    for start in range(0, len(recent), PURGE_BULK_LIMIT):
+        chunk = recent[start:start + PURGE_BULK_LIMIT]
+        if len(chunk) < 2:
+            singles.extend(chunk)  # Bulk delete needs at least two messages
+            continue
+        await rate_limiter.acquire(route, PRIORITY_USER)
+        try:
+            await channel.delete_messages([discord.Object(id=message_id) for message_id in chunk])
+            deleted.extend(chunk)
+        except discord.errors.Forbidden:
+            raise
+        except discord.errors.HTTPException as e:
+            logger.warning(f"⚠ Bulk delete of {len(chunk)} messages failed, deleting them one by one: {str(e)}")
+            singles.extend(chunk)
+    
+    for message_id in singles:
+        await rate_limiter.acquire(route, PRIORITY_USER)
+        try:
+            await channel.get_partial_message(message_id).delete()
+            deleted.append(message_id)
+        except discord.errors.NotFound:
+            deleted.append(message_id)  # Already gone
+        except discord.errors.Forbidden:
+            raise
+        except discord.errors.HTTPException as e:
+            logger.warning(f"⚠ Could not delete message {message_id}: {str(e)}")
+    
+    if deleted:
+        async with seek.database.writer() as db:
+            await db.executemany('DELETE FROM job_messages WHERE message_id = ?', [(message_id,) for message_id in deleted])
+    return deleted
+
+# Per-user subscription settings
+MAX_SUBSCRIPTIONS_PER_USER = int(os.getenv('MAX_SUBSCRIPTIONS_PER_USER', '10'))
+
+TERM_PATTERN = re.compile(r"[a-z0-9][a-z0-9+#]*")
+
+def tokenize(text):
+    """Split text into lowercase search terms."""
+    return TERM_PATTERN.findall((text or '').lower())
+
+def split_terms(value):
+    """Split a comma-separated command option into lowercase terms."""
+    return [term.strip().lower() for term in (value or '').split(',') if term.strip()]
+
+def get_job_classifications(job):
+    """Get the lowercase classification and subclassification of a SEEK job."""
+    classification = (job.get('classifications') or [{}])[0]
+    return {
+        value.lower()
+        for value in (
+            classification.get('classification', {}).get('description'),
+            classification.get('subclassification', {}).get('description')
+        )
+        if value
+    }
+
+class SubscriptionIndex:
+    """Inverted index from job terms to the saved searches they could match.
+    
+    Each subscription is filed under a single facet: the first term of each
+    keyword, otherwise its classifications, otherwise its location terms.
+    Matching a job therefore only touches subscriptions that share one of the
+    job's terms; those candidates are then checked against every facet.
+    """
+    def __init__(self):
+        self._subscriptions = {}
+        self._keyword_index = {}
+        self._classification_index = {}
+        self._location_index = {}
+        self._wildcard = set()
+
+    def __len__(self):
+        return len(self._subscriptions)
+
+    def _postings(self, subscription):
+        """Get the (index, term) pairs a subscription is filed under."""
+        if subscription['keywords']:
+            terms = [tokenize(keyword) for keyword in subscription['keywords']]
+            return [(self._keyword_index, tokens[0]) for tokens in terms if tokens]
+        if subscription['classifications']:
+            return [(self._classification_index, value) for value in subscription['classifications']]
+        if subscription['locations']:
+            return [
+                (self._location_index, token)
+                for location in subscription['locations']
+                for token in tokenize(location)
+            ]
+        return []
+
+    def add(self, subscription):
+        self.remove(subscription['id'])
+        entry = dict(subscription)
+        entry['keyword_patterns'] = [
+            re.compile(rf"(?<!\w){re.escape(keyword)}(?!\w)")
+            for keyword in subscription['keywords']
+        ]
+        entry['location_terms'] = [set(tokenize(location)) for location in subscription['locations']]
+        self._subscriptions[entry['id']] = entry
+        
+        postings = self._postings(entry)
+        if not postings:
+            self._wildcard.add(entry['id'])
+        for index, term in postings:
+            index.setdefault(term, set()).add(entry['id'])
+
+    def remove(self, subscription_id):
+        entry = self._subscriptions.pop(subscription_id, None)
+        if entry is None:
             return
-            
-        print(f"📊 Checking saved jobs in channel: {channel.name}")
-        async with seek.aiosqlite.connect(seek.DATABASE_PATH) as db:
-            db.row_factory = aiosqlite.Row  # Enable dictionary access
-            print("🔍 Querying for jobs needing reminders...")
-            
-            # Debug current time
-            current_time = datetime.now()
-            print(f"🕒 Current time: {current_time.isoformat()}")
-            
-            # Get saved jobs that haven't had a reminder in 24 hours and have less than 3 reminders
-            query = '''
-                SELECT sj.*, j.title, j.company,
-                       CASE 
-                           WHEN sj.last_reminder_date IS NULL THEN 'never reminded'
-                           ELSE datetime(sj.last_reminder_date)
-                       END as last_reminder,
-                       datetime('now') as current_time
+        self._wildcard.discard(subscription_id)
+        for index, term in self._postings(entry):
+            ids = index.get(term)
+            if ids is not None:
+                ids.discard(subscription_id)
+                if not ids:
+                    del index[term]
+
+    def clear(self):
+        for subscription_id in list(self._subscriptions):
+            self.remove(subscription_id)
+
+    def match(self, job):
+        """Return every subscription that matches a SEEK job."""
+        text = f"{job.get('title', '')} {job.get('teaser', '')}".lower()
+        classifications = get_job_classifications(job)
+        location_terms = set(tokenize((job.get('locations') or [{}])[0].get('label', '')))
+        
+        candidates = set(self._wildcard)
+        for term in set(tokenize(text)):
+            candidates.update(self._keyword_index.get(term, ()))
+        for value in classifications:
+            candidates.update(self._classification_index.get(value, ()))
+        for term in location_terms:
+            candidates.update(self._location_index.get(term, ()))
+        
+        salary = seek.parse_salary(job.get('salaryLabel'))
+        
+        matches = []
+        for subscription_id in candidates:
+            subscription = self._subscriptions[subscription_id]
+            if subscription['keyword_patterns'] and not any(
+                pattern.search(text) for pattern in subscription['keyword_patterns']
+            ):
+                continue
+            if subscription['classifications'] and not classifications.intersection(subscription['classifications']):
+                continue
+            if subscription['location_terms'] and not any(
+                terms <= location_terms for terms in subscription['location_terms']
+            ):
+                continue
+            if subscription['salary_min'] and salary and salary.max < subscription['salary_min']:
+                continue
+            matches.append(subscription)
+        return matches
+
+# Global subscription index
+subscription_index = SubscriptionIndex()
+
+def subscription_from_row(row):
+    """Convert a user_subscriptions row into the dict the index works with."""
+    return {
+        'id': row['id'],
+        'user_id': row['user_id'],
+        'name': row['name'],
+        'keywords': json.loads(row['keywords'] or '[]'),
+        'classifications': json.loads(row['classifications'] or '[]'),
+        'locations': json.loads(row['locations'] or '[]'),
+        'salary_min': row['salary_min'] or 0
+    }
+
+async def setup_subscriptions_table():
+    """Initialize the subscription tables and load the subscription index."""
+    async with seek.database.writer() as db:
+        await db.execute('''
+            CREATE TABLE IF NOT EXISTS user_subscriptions (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                user_id TEXT NOT NULL,
+                name TEXT,
+                keywords TEXT,
+                classifications TEXT,
+                locations TEXT,
+                salary_min REAL,
+                created_date TEXT
+            )
+        ''')
+        await db.execute('CREATE INDEX IF NOT EXISTS idx_user_subscriptions_user ON user_subscriptions (user_id)')
+        
+        # Record which jobs each user has already been sent
+        await db.execute('''
+            CREATE TABLE IF NOT EXISTS subscription_deliveries (
+                user_id TEXT NOT NULL,
+                job_id TEXT NOT NULL,
+                delivered_date TEXT,
+                PRIMARY KEY (user_id, job_id)
+            )
+        ''')
+        await db.commit()
+        
+        db.row_factory = aiosqlite.Row
+        async with db.execute('SELECT * FROM user_subscriptions') as cursor:
+            rows = await cursor.fetchall()
+    
+    subscription_index.clear()
+    for row in rows:
+        subscription_index.add(subscription_from_row(row))
+    logger.info(f"✓ Subscriptions table initialized ({len(subscription_index)} subscriptions loaded)")
+
+async def add_subscription(user_id, name, keywords, classifications, locations, salary_min):
+    """Save a subscription for a user and add it to the index."""
+    async with seek.database.writer() as db:
+        cursor = await db.execute('''
+            INSERT INTO user_subscriptions
+            (user_id, name, keywords, classifications, locations, salary_min, created_date)
+            VALUES (?, ?, ?, ?, ?, ?, datetime('now'))
+        ''', (
+            str(user_id), name, json.dumps(keywords), json.dumps(classifications),
+            json.dumps(locations), salary_min or 0
+        ))
+        subscription_id = cursor.lastrowid
+        await db.commit()
+    
+    subscription_index.add({
+        'id': subscription_id,
+        'user_id': str(user_id),
+        'name': name,
+        'keywords': keywords,
+        'classifications': classifications,
+        'locations': locations,
+        'salary_min': salary_min or 0
+    })
+    return subscription_id
+
+async def remove_subscription(user_id, subscription_id):
+    """Delete one of a user's subscriptions. Returns False if it wasn't theirs."""
+    async with seek.database.writer() as db:
+        cursor = await db.execute(
+            'DELETE FROM user_subscriptions WHERE id = ? AND user_id = ?',
+            (subscription_id, str(user_id))
+        )
+        removed = cursor.rowcount > 0
+        await db.commit()
+    if removed:
+        subscription_index.remove(subscription_id)
+    return removed
+
+async def get_user_subscriptions(user_id):
+    """Get all of a user's subscriptions."""
+    async with seek.database.reader() as db:
+        db.row_factory = aiosqlite.Row
+        async with db.execute(
+            'SELECT * FROM user_subscriptions WHERE user_id = ? ORDER BY id',
+            (str(user_id),)
+        ) as cursor:
+            return [subscription_from_row(row) for row in await cursor.fetchall()]
+
+# Subscription matches are queued in the outbox under one target per user
+SUBSCRIPTION_TARGET_PREFIX = 'dm:'
+
+async def queue_subscription_matches(jobs):
+    """Group new jobs by the subscribed users they should be sent to, as outbox targets."""
+    if not len(subscription_index) or not jobs:
+        return {}
+    
+    # Group matches per user so overlapping subscriptions send one DM per job
+    matches = {}
+    for job in jobs:
+        for subscription in subscription_index.match(job):
+            matches.setdefault(subscription['user_id'], {})[job['id']] = job
+    if not matches:
+        return {}
+    
+    # Skip jobs a user has already been sent in an earlier cycle
+    job_ids = list({job_id for user_jobs in matches.values() for job_id in user_jobs})
+    delivered = set()
+    async with seek.database.reader() as db:
+        for start in range(0, len(job_ids), seek.SQLITE_MAX_PARAMS):
+            chunk = job_ids[start:start + seek.SQLITE_MAX_PARAMS]
+            placeholders = ','.join('?' * len(chunk))
+            async with db.execute(
+                f'SELECT user_id, job_id FROM subscription_deliveries WHERE job_id IN ({placeholders})',
+                chunk
+            ) as cursor:
+                delivered.update((row[0], row[1]) for row in await cursor.fetchall())
+    
+    targets = {}
+    for user_id, user_jobs in matches.items():
+        pending = [job for job_id, job in user_jobs.items() if (user_id, job_id) not in delivered]
+        if pending:
+            targets[f"{SUBSCRIPTION_TARGET_PREFIX}{user_id}"] = pending
+    if targets:
+        logger.info(f"📨 Queued {sum(len(pending) for pending in targets.values())} subscription matches for {len(targets)} users")
+    return targets
+
+async def send_subscription_matches(jobs, target):
+    """DM a subscribed user their queued matches and return the ones that were sent.
+    
+    Called by the subscription outbox worker, so failures are retried with
+    backoff and dead-lettered like any other delivery.
+    """
+    user_id = target[len(SUBSCRIPTION_TARGET_PREFIX):]
+    sent = []
+    try:
+        user = bot_instance.get_user(int(user_id)) or await bot_instance.fetch_user(int(user_id))
+        for job in jobs:
+            await rate_limiter.acquire(f"dm:{user_id}", PRIORITY_USER)
+            await user.send(embed=create_embed(job), view=JobActionsView(job['id']))
+            sent.append(job)
+    except discord.errors.Forbidden:
+        logger.warning(f"⚠ Could not DM user {user_id} (DMs are closed)")
+    except Exception as e:
+        logger.error(f"Error delivering subscription matches to {user_id}: {str(e)}")
+    
+    if sent:
+        async with seek.database.writer() as db:
+            await db.executemany(
+                "INSERT OR IGNORE INTO subscription_deliveries (user_id, job_id, delivered_date) VALUES (?, ?, datetime('now'))",
+                [(user_id, job['id']) for job in sent]
+            )
+            await db.commit()
+    return sent
+
+# Saved job reminder schedule
+REMINDER_INTERVAL = 24 * 60 * 60  # Seconds between reminders for a saved job
+REMINDER_MAX_COUNT = 3  # Reminders sent before a saved job is left alone
+REMINDER_RETRY_DELAY = 15 * 60  # Seconds before retrying a reminder that could not be sent
+REMINDER_MAX_SLEEP = 60 * 60  # Longest the scheduler sleeps, so clock changes are picked up
+
+class ReminderScheduler:
+    """Min-heap of saved job reminders ordered by when they are due.
+    
+    The heap is rebuilt from the indexed next_reminder_ts column at startup
+    and kept current as jobs are saved, snoozed or resolved, so run() can
+    sleep until exactly the next due time instead of polling. Entries are
+    cancelled lazily: the heap may hold stale times, and only the time in
+    _due counts.
+    """
+    def __init__(self):
+        self._heap = []  # (due_ts, job_id, user_id)
+        self._due = {}  # (job_id, user_id) -> due_ts
+        self._changed = asyncio.Event()
+
+    def __len__(self):
+        return len(self._due)
+
+    async def load(self):
+        """Rebuild the heap from the saved jobs that still have a reminder due."""
+        async with seek.database.reader() as db:
+            async with db.execute(
+                'SELECT job_id, user_id, next_reminder_ts FROM saved_jobs WHERE next_reminder_ts IS NOT NULL'
+            ) as cursor:
+                rows = await cursor.fetchall()
+        self._due = {(job_id, user_id): due_ts for job_id, user_id, due_ts in rows}
+        self._heap = [(due_ts, job_id, user_id) for (job_id, user_id), due_ts in self._due.items()]
+        heapq.heapify(self._heap)
+        self._changed.set()
+
+    def schedule(self, job_id, user_id, due_ts):
+        """Set when the next reminder for a saved job is due."""
+        key = (job_id, str(user_id))
+        self._due[key] = due_ts
+        heapq.heappush(self._heap, (due_ts, *key))
+        if self._heap[0][0] == due_ts:
+            self._changed.set()  # New earliest reminder; wake the timer
+
+    def cancel(self, job_id, user_id):
+        """Stop reminding about a saved job."""
+        self._due.pop((job_id, str(user_id)), None)
+
+    def next_due(self):
+        """Return when the earliest reminder is due, or None if none are scheduled."""
+        while self._heap:
+            due_ts, job_id, user_id = self._heap[0]
+            if self._due.get((job_id, user_id)) == due_ts:
+                return due_ts
+            heapq.heappop(self._heap)  # Cancelled or rescheduled
+        return None
+
+    def pop_due(self, now):
+        """Remove and return the (job_id, user_id) of every reminder due by now."""
+        due = []
+        while (due_ts := self.next_due()) is not None and due_ts <= now:
+            _, job_id, user_id = heapq.heappop(self._heap)
+            del self._due[(job_id, user_id)]
+            due.append((job_id, user_id))
+        return due
+
+    async def run(self):
+        """Send reminders as they fall due until cancelled."""
+        while True:
+            self._changed.clear()
+            due_ts = self.next_due()
+            delay = None if due_ts is None else due_ts - time.time()
+            if delay is None or delay > 0:
+                try:
+                    await asyncio.wait_for(self._changed.wait(), min(delay or REMINDER_MAX_SLEEP, REMINDER_MAX_SLEEP))
+                except asyncio.TimeoutError:
+                    pass
+                continue
+            try:
+                await send_reminders(self.pop_due(time.time()))
+            except Exception as e:
+                logger.error(f"❌ Error sending reminders: {str(e)}")
+
+# Global reminder schedule
+reminder_scheduler = ReminderScheduler()
+
+async def send_reminders(due):
+    """Send the reminders for (job_id, user_id) pairs that are due and record them in one transaction."""
+    if not due:
+        return
+    now = int(time.time())
+    channel = bot_instance.get_channel(SAVED_JOBS_CHANNEL_ID) if bot_instance else None
+    if not channel:
+        logger.warning("⚠ Could not find saved jobs channel, retrying reminders later")
+        for job_id, user_id in due:
+            reminder_scheduler.schedule(job_id, user_id, now + REMINDER_RETRY_DELAY)
+        return
+    
+    saved_jobs = []
+    async with seek.database.reader() as db:
+        db.row_factory = aiosqlite.Row
+        for start in range(0, len(due), seek.SQLITE_MAX_PARAMS // 2):
+            chunk = due[start:start + seek.SQLITE_MAX_PARAMS // 2]
+            async with db.execute(f'''
+                SELECT sj.job_id, sj.user_id, sj.message_id, sj.reminder_count,
+                       j.title, j.company, jm.channel_id as posted_channel_id
                 FROM saved_jobs sj
                 JOIN jobs j ON sj.job_id = j.id
-                WHERE sj.status = 'saved'
-                AND (
-                    sj.last_reminder_date IS NULL 
-                    OR 
-                    datetime(sj.last_reminder_date) <= datetime('now', '-1 day')
-                )
-                AND sj.reminder_count < 3
-            '''
-            
-            print(f"🔍 Executing query: {query}")
-            async with db.execute(query) as cursor:
-                saved_jobs = await cursor.fetchall()
-                
-            job_count = len(saved_jobs) if saved_jobs else 0
-            print(f"📝 Found {job_count} jobs needing reminders")
-            
-            if job_count > 0:
-                # Debug first job's reminder info
-                first_job = saved_jobs[0]
-                print(f"📋 First job debug info:")
-                print(f"  - Job ID: {first_job['job_id']}")
-                print(f"  - Last reminder: {first_job['last_reminder']}")
-                print(f"  - Current DB time: {first_job['current_time']}")
-                print(f"  - Reminder count: {first_job['reminder_count']}")
-                print(f"  - Status: {first_job['status']}")
-            
-            for job in saved_jobs:
-                try:
-                    print(f"📬 Sending reminder for job {job['job_id']} to user {job['user_id']}")
-                    # Create reminder embed
-                    embed = discord.Embed(
-                        title="Job Application Reminder",
-                        description=random.choice(REMINDER_MESSAGES),
-                        color=discord.Color.from_str('#fd0585')
-                    )
-                    embed.add_field(
-                        name="Job Details",
-                        value=f"**{job['title']}** at {job['company']}\n[View Original Post](https://discord.com/channels/{channel.guild.id}/{JOBS_CHANNEL_ID}/{job['message_id']})",
-                        inline=False
-                    )
-                    
-                    # Add reminder buttons
-                    view = ReminderActionsView(job['job_id'])
-                    
-                    # Send reminder
-                    await channel.send(
-                        # content=f"<@{job['user_id']}>",  # Temporarily removed user mention
-                        embed=embed,
-                        view=view
-                    )
-                    
-                    # Update reminder count and date using UTC time
-                    current_time = datetime.utcnow().strftime('%Y-%m-%d %H:%M:%S')
-                    await db.execute('''
-                        UPDATE saved_jobs 
-                        SET last_reminder_date = datetime(?), reminder_count = reminder_count + 1
-                        WHERE job_id = ? AND user_id = ?
-                    ''', (current_time, job['job_id'], job['user_id']))
-                    await db.commit()  # Commit after each reminder to ensure it's saved
-                    
-                except Exception as e:
-                    print(f"Error sending reminder for job {job['job_id']}: {str(e)}")
-                    print(f"Full job data: {dict(job)}")  # Debug full job data on error
+                LEFT JOIN job_messages jm ON jm.message_id = CAST(sj.message_id AS INTEGER) AND jm.job_id = sj.job_id
+                WHERE (sj.job_id, sj.user_id) IN (VALUES {', '.join('(?, ?)' for _ in chunk)})
+                AND sj.status = 'saved'
+                AND sj.reminder_count < ?
+            ''', (*[value for key in chunk for value in key], REMINDER_MAX_COUNT)) as cursor:
+                saved_jobs.extend(await cursor.fetchall())
+    
+    sent, failed = [], []
+    for job in saved_jobs:
+        try:
+            logger.info(f"📬 Sending reminder for job {job['job_id']} to user {job['user_id']}")
+            embed = discord.Embed(
+                title="Job Application Reminder",
+                description=random.choice(REMINDER_MESSAGES),
+                url=f"https://www.seek.com.au/job/{job['job_id']}",
+                color=discord.Color.from_str('#fd0585')
+            )
+            embed.add_field(
+                name="Job Details",
+                value=f"**{job['title']}** at {job['company']}\n[View Original Post](https://discord.com/channels/{channel.guild.id}/{job['posted_channel_id'] or JOBS_CHANNEL_ID}/{job['message_id']})",
+                inline=False
+            )
             
-    except Exception as e:
-        print(f"Error checking saved jobs: {str(e)}")
-        import traceback
-        print(traceback.format_exc())  # Print full traceback for debugging
+            await rate_limiter.acquire(f"channel:{channel.id}", PRIORITY_USER)
+            await channel.send(embed=embed, view=ReminderActionsView(job['job_id']))
+            sent.append(job)
+        except Exception as e:
+            logger.error(f"Error sending reminder for job {job['job_id']}: {str(e)}")
+            failed.append(job)
+    
+    # Record every reminder in this batch in a single transaction
+    current_time = datetime.utcnow().strftime('%Y-%m-%d %H:%M:%S')
+    updates = []
+    for job in sent:
+        next_ts = now + REMINDER_INTERVAL if job['reminder_count'] + 1 < REMINDER_MAX_COUNT else None
+        updates.append((current_time, now, next_ts, job['job_id'], job['user_id']))
+    async with seek.database.writer() as db:
+        await db.executemany('''
+            UPDATE saved_jobs
+            SET last_reminder_date = datetime(?), last_reminder_ts = ?,
+                reminder_count = reminder_count + 1, next_reminder_ts = ?
+            WHERE job_id = ? AND user_id = ?
+        ''', updates)
+        await db.executemany(
+            'UPDATE saved_jobs SET next_reminder_ts = ? WHERE job_id = ? AND user_id = ?',
+            [(now + REMINDER_RETRY_DELAY, job['job_id'], job['user_id']) for job in failed]
+        )
+    
+    for _, _, next_ts, job_id, user_id in updates:
+        if next_ts:
+            reminder_scheduler.schedule(job_id, user_id, next_ts)
+    for job in failed:
+        reminder_scheduler.schedule(job['job_id'], job['user_id'], now + REMINDER_RETRY_DELAY)
+    logger.info(f"🔔 Sent {len(sent)} reminders ({len(failed)} failed, {len(reminder_scheduler)} scheduled)")
+
+async def get_reminder_job_id(interaction):
+    """Get the saved job a reminder message is about.
+    
+    Reminders link the job itself; older ones only link the post it was
+    saved from, which a digest shares between several jobs, so those are
+    matched on the user's own saved jobs as well.
+    """
+    embed = interaction.message.embeds[0]
+    match = DIGEST_JOB_ID_PATTERN.search(embed.url or '')
+    if match:
+        return match.group(1)
+    for field in embed.fields:
+        if field.name == "Job Details":
+            message_link = field.value.rstrip(')').split('/')[-1]
+            async with seek.database.reader() as db:
+                async with db.execute(
+                    'SELECT job_id FROM saved_jobs WHERE message_id = ? AND user_id = ? ORDER BY saved_ts DESC',
+                    (message_link, str(interaction.user.id))
+                ) as cursor:
+                    result = await cursor.fetchone()
+            if result:
+                return result[0]
+    return None
 
 class ReminderActionsView(discord.ui.View):
     def __init__(self, job_id: str):
@@ -354,33 +968,19 @@ class ReminderActionsView(discord.ui.View):
                 await interaction.response.send_message("❌ Error: Could not find job information", ephemeral=True)
                 return
             
-            # Try to extract job ID from the embed field that contains the original post URL
-            job_id = None
-            for field in message_embeds[0].fields:
-                if field.name == "Job Details":
-                    # Extract job ID from the message link in the field value
-                    message_link = field.value.split('/')[-1]
-                    # Get the job data using the message ID
-                    async with seek.aiosqlite.connect(seek.DATABASE_PATH) as db:
-                        async with db.execute(
-                            'SELECT job_id FROM saved_jobs WHERE message_id = ?',
-                            (message_link,)
-                        ) as cursor:
-                            result = await cursor.fetchone()
-                            if result:
-                                job_id = result[0]
-                            
+            job_id = await get_reminder_job_id(interaction)
             if not job_id:
                 await interaction.response.send_message("❌ Error: Could not find job information", ephemeral=True)
                 return
                 
-            async with seek.aiosqlite.connect(seek.DATABASE_PATH) as db:
+            async with seek.database.writer() as db:
                 await db.execute('''
                     UPDATE saved_jobs 
-                    SET status = 'applied'
+                    SET status = 'applied', next_reminder_ts = NULL
                     WHERE job_id = ? AND user_id = ?
                 ''', (job_id, str(interaction.user.id)))
                 await db.commit()
+            reminder_scheduler.cancel(job_id, interaction.user.id)
             
             # Update the message content to show it's been handled
             embed = interaction.message.embeds[0]
@@ -390,7 +990,7 @@ class ReminderActionsView(discord.ui.View):
             await interaction.response.edit_message(embed=embed, view=None)
             await interaction.message.delete(delay=3)  # Delete after 3 seconds
         except Exception as e:
-            print(f"Error in applied button: {str(e)}")
+            logger.error(f"Error in applied button: {str(e)}")
             await interaction.response.send_message("❌ An error occurred", ephemeral=True)
 
     @discord.ui.button(
@@ -408,34 +1008,21 @@ class ReminderActionsView(discord.ui.View):
                 await interaction.response.send_message("❌ Error: Could not find job information", ephemeral=True)
                 return
             
-            # Try to extract job ID from the embed field that contains the original post URL
-            job_id = None
-            for field in message_embeds[0].fields:
-                if field.name == "Job Details":
-                    # Extract job ID from the message link in the field value
-                    message_link = field.value.split('/')[-1]
-                    # Get the job data using the message ID
-                    async with seek.aiosqlite.connect(seek.DATABASE_PATH) as db:
-                        async with db.execute(
-                            'SELECT job_id FROM saved_jobs WHERE message_id = ?',
-                            (message_link,)
-                        ) as cursor:
-                            result = await cursor.fetchone()
-                            if result:
-                                job_id = result[0]
-            
+            job_id = await get_reminder_job_id(interaction)
             if not job_id:
                 await interaction.response.send_message("❌ Error: Could not find job information", ephemeral=True)
                 return
                 
-            async with seek.aiosqlite.connect(seek.DATABASE_PATH) as db:
+            async with seek.database.writer() as db:
                 current_time = datetime.utcnow().strftime('%Y-%m-%d %H:%M:%S')
+                now = int(time.time())
                 await db.execute('''
                     UPDATE saved_jobs 
-                    SET last_reminder_date = datetime(?)
+                    SET last_reminder_date = datetime(?), last_reminder_ts = ?, next_reminder_ts = ?
                     WHERE job_id = ? AND user_id = ?
-                ''', (current_time, job_id, str(interaction.user.id)))
+                ''', (current_time, now, now + REMINDER_INTERVAL, job_id, str(interaction.user.id)))
                 await db.commit()
+            reminder_scheduler.schedule(job_id, interaction.user.id, now + REMINDER_INTERVAL)
             
             # Update the message content to show it's been handled
             embed = interaction.message.embeds[0]
@@ -445,7 +1032,7 @@ class ReminderActionsView(discord.ui.View):
             await interaction.response.edit_message(embed=embed, view=None)
             await interaction.message.delete(delay=3)  # Delete after 3 seconds
         except Exception as e:
-            print(f"Error in remind later button: {str(e)}")
+            logger.error(f"Error in remind later button: {str(e)}")
             await interaction.response.send_message("❌ An error occurred", ephemeral=True)
 
     @discord.ui.button(
@@ -463,33 +1050,19 @@ class ReminderActionsView(discord.ui.View):
                 await interaction.response.send_message("❌ Error: Could not find job information", ephemeral=True)
                 return
             
-            # Try to extract job ID from the embed field that contains the original post URL
-            job_id = None
-            for field in message_embeds[0].fields:
-                if field.name == "Job Details":
-                    # Extract job ID from the message link in the field value
-                    message_link = field.value.split('/')[-1]
-                    # Get the job data using the message ID
-                    async with seek.aiosqlite.connect(seek.DATABASE_PATH) as db:
-                        async with db.execute(
-                            'SELECT job_id FROM saved_jobs WHERE message_id = ?',
-                            (message_link,)
-                        ) as cursor:
-                            result = await cursor.fetchone()
-                            if result:
-                                job_id = result[0]
-            
+            job_id = await get_reminder_job_id(interaction)
             if not job_id:
                 await interaction.response.send_message("❌ Error: Could not find job information", ephemeral=True)
                 return
                 
-            async with seek.aiosqlite.connect(seek.DATABASE_PATH) as db:
+            async with seek.database.writer() as db:
                 await db.execute('''
                     UPDATE saved_jobs 
-                    SET status = 'dismissed'
+                    SET status = 'dismissed', next_reminder_ts = NULL
                     WHERE job_id = ? AND user_id = ?
                 ''', (job_id, str(interaction.user.id)))
                 await db.commit()
+            reminder_scheduler.cancel(job_id, interaction.user.id)
             
             # Update the message content to show it's been handled
             embed = interaction.message.embeds[0]
@@ -499,7 +1072,7 @@ class ReminderActionsView(discord.ui.View):
             await interaction.response.edit_message(embed=embed, view=None)
             await interaction.message.delete(delay=3)  # Delete after 3 seconds
         except Exception as e:
-            print(f"Error in not interested button: {str(e)}")
+            logger.error(f"Error in not interested button: {str(e)}")
             await interaction.response.send_message("❌ An error occurred", ephemeral=True)
 
 class JobBot(commands.Bot):
@@ -515,41 +1088,56 @@ class JobBot(commands.Bot):
             description='A bot that monitors SEEK jobs'
         )
         
-        # Set up output capture
-        self.output_capture = None
+        # Mirrors the log pipeline to the logs channel once the bot is ready
+        self.log_sink = None
         self.shutdown_event = shutdown_event
         
-        # Start the reminder check loop
-        self.reminder_check_loop.start()
+        # Post queued jobs independently of the fetch loop, one worker per routed channel
+        self.outbox_workers = seek.create_outbox_workers(post_jobs, post_jobs)
+        # Subscription DMs drain from the same outbox, one target per subscribed user
+        self.outbox_workers.append(seek.OutboxWorker(send_subscription_matches, f"{SUBSCRIPTION_TARGET_PREFIX}*", window=0))
+        self.outbox_tasks = []
+        
+        # Sends saved job reminders as they fall due, started once the bot is ready
+        self.reminder_task = None
     
     async def close(self):
         """Cleanup when the bot is shutting down."""
-        print("🛑 Bot is shutting down...")
+        logger.info("🛑 Bot is shutting down...")
         
         # Stop all background tasks
-        self.reminder_check_loop.cancel()
+        if self.reminder_task:
+            self.reminder_task.cancel()
+        for worker in self.outbox_workers:
+            worker.stop()
+        if self.outbox_tasks:
+            try:
+                await asyncio.wait_for(asyncio.gather(*self.outbox_tasks), 10)
+            except (asyncio.TimeoutError, asyncio.CancelledError):
+                pass
         
-        # Restore stdout
-        if self.output_capture:
-            sys.stdout = sys.__stdout__
+        # Send what is left for the logs channel while the connection is still open
+        if self.log_sink:
+            await log_pipeline.remove_sink(self.log_sink)
+            self.log_sink = None
         
         # Close the database connections
         try:
-            await seek.cleanup()
-            await db_pool.cleanup()  # Clean up the database pool
+            await seek.cleanup()  # Also closes the database pools
         except Exception as e:
-            print(f"Error during cleanup: {e}")
+            logger.error(f"Error during cleanup: {e}")
         
         await super().close()
-        print("✓ Cleanup completed")
+        logger.info("✓ Cleanup completed")
     
     async def setup_hook(self):
         """Setup hook that runs when the bot is first starting"""
-        print("🔄 Setting up persistent views...")
+        logger.info("🔄 Setting up persistent views...")
         # Register persistent views with wildcard job IDs
         self.add_view(JobActionsView("*"))
+        self.add_view(DigestView("*"))
         self.add_view(ReminderActionsView("*"))
-        print("✓ Persistent views registered")
+        logger.info("✓ Persistent views registered")
         
         # Add the purge command
         @self.tree.command(
@@ -557,47 +1145,35 @@ class JobBot(commands.Bot):
             description="Delete job listings containing the specified search term"
         )
         @app_commands.describe(
-            search_term="The term to search for in job listings (e.g. 'dental')"
+            search_term="The term to search for in job listings (e.g. 'dental')",
+            rescan="Index older posts from the channel history first (slow, only needed once)"
         )
-        async def purge(interaction: discord.Interaction, search_term: str):
+        async def purge(interaction: discord.Interaction, search_term: str, rescan: bool = False):
             """Purge job listings containing the specified search term"""
             await interaction.response.defer(ephemeral=True)
             
             try:
-                # Get message history from the channel
-                deleted_count = 0
-                messages_to_delete = []
+                if rescan:
+                    indexed = await index_channel_history(interaction.channel)
+                    logger.info(f"✓ Indexed {indexed} job posts from #{interaction.channel.name}")
                 
-                async for message in interaction.channel.history(limit=None):
-                    # Check if message is from the bot and has embeds
-                    if message.author.id == self.user.id and message.embeds:
-                        for embed in message.embeds:
-                            # Search in title, description, and fields
-                            searchable_content = [
-                                embed.title or '',
-                                embed.description or ''
-                            ]
-                            searchable_content.extend(
-                                field.value for field in embed.fields
-                            )
-                            
-                            # Join all content and search case-insensitively
-                            content = ' '.join(searchable_content).lower()
-                            if search_term.lower() in content:
-                                messages_to_delete.append(message)
-                                deleted_count += 1
-                                break  # Break after finding a match in any embed
+                # Resolve matching posts from the local index instead of the channel history
+                messages_to_delete, kept_digests = await find_job_messages(interaction.channel.id, search_term)
+                deleted_count = len(await delete_channel_messages(interaction.channel, messages_to_delete))
+                # Digests that also list other jobs stay, so the other jobs are not deleted with them
+                kept_note = (
+                    f"\n{kept_digests} digest message{'s' if kept_digests != 1 else ''} also listing other jobs {'were' if kept_digests != 1 else 'was'} kept"
+                    if kept_digests else ""
+                )
                 
-                # Delete the messages
-                if messages_to_delete:
-                    await interaction.channel.delete_messages(messages_to_delete)
+                if deleted_count:
                     embed = discord.Embed(
-                        description=f"<:checkboxchecked4x:1333305636993241161> Deleted {deleted_count} job listing{'s' if deleted_count != 1 else ''} containing '{search_term}'",
+                        description=f"<:checkboxchecked4x:1333305636993241161> Deleted {deleted_count} job listing{'s' if deleted_count != 1 else ''} containing '{search_term}'{kept_note}",
                         color=discord.Color.from_str('#fd0585')
                     )
                 else:
                     embed = discord.Embed(
-                        description=f"<:squarexmark4x:1341573622484963450> No job listings found containing '{search_term}'",
+                        description=f"<:squarexmark4x:1341573622484963450> No job listings found containing '{search_term}'{kept_note}",
                         color=discord.Color.from_str('#fd0585')
                     )
                 
@@ -622,7 +1198,7 @@ class JobBot(commands.Bot):
                 )
                 await interaction.followup.send(embed=embed, ephemeral=True)
             except Exception as e:
-                print(f"Error in purge command: {str(e)}")
+                logger.error(f"Error in purge command: {str(e)}")
                 embed = discord.Embed(
                     description="<:squarexmark4x:1341573622484963450> An error occurred while purging messages",
                     color=discord.Color.from_str('#fd0585')
@@ -731,7 +1307,7 @@ class JobBot(commands.Bot):
                         pass
                     
             except Exception as e:
-                print(f"Error in resume upload command: {str(e)}")
+                logger.error(f"Error in resume upload command: {str(e)}")
                 
                 # If response hasn't been sent yet
                 try:
@@ -797,12 +1373,222 @@ class JobBot(commands.Bot):
                 )
                 
             except Exception as e:
-                print(f"Error in view resume command: {str(e)}")
+                logger.error(f"Error in view resume command: {str(e)}")
                 await interaction.response.send_message(
                     "❌ An error occurred while retrieving your resume.",
                     ephemeral=True
                 )
         
+        # Add job statistics command
+        @self.tree.command(
+            name="stats",
+            description="Show statistics about the jobs tracked so far"
+        )
+        async def stats(interaction: discord.Interaction):
+            """Show job statistics from the materialized counters"""
+            try:
+                stats = await seek.get_job_stats()
+                
+                embed = discord.Embed(
+                    title="📊 Job Statistics",
+                    description=f"**{stats['total_jobs']}** jobs tracked, **{stats['jobs_last_24h']}** in the last 24 hours",
+                    color=discord.Color.from_str('#fd0585')
+                )
+                for name, key, column in (
+                    ("Top Classifications", 'top_classifications', 'classification'),
+                    ("Most Active Companies", 'top_companies', 'company'),
+                    ("Work Type Distribution", 'work_types', 'work_type'),
+                    ("Salary Bands", 'salary_bands', 'salary_band')
+                ):
+                    lines = [f"• {row[column]}: {row['count']}" for row in stats[key]]
+                    embed.add_field(name=name, value='\n'.join(lines) or "No data yet", inline=False)
+                
+                await interaction.response.send_message(embed=embed, ephemeral=True)
+            except Exception as e:
+                logger.error(f"Error in stats command: {str(e)}")
+                await interaction.response.send_message(
+                    "❌ An error occurred while retrieving job statistics.",
+                    ephemeral=True
+                )
+        
+        # Add subscription commands
+        @self.tree.command(
+            name="subscribe",
+            description="Get new jobs matching your own search sent to you by DM"
+        )
+        @app_commands.describe(
+            keywords="Comma-separated keywords, any of which must appear in the title or teaser",
+            classifications="Comma-separated SEEK classifications or subclassifications",
+            locations="Comma-separated locations, e.g. Hobart",
+            salary_min="Minimum salary (jobs without a salary are still sent)",
+            name="A name for this subscription"
+        )
+        async def subscribe(
+            interaction: discord.Interaction,
+            keywords: str = None,
+            classifications: str = None,
+            locations: str = None,
+            salary_min: int = 0,
+            name: str = None
+        ):
+            """Create a per-user job subscription"""
+            try:
+                keyword_terms = split_terms(keywords)
+                classification_terms = split_terms(classifications)
+                location_terms = split_terms(locations)
+                if not (keyword_terms or classification_terms or location_terms):
+                    await interaction.response.send_message(
+                        "❌ Give at least one keyword, classification or location.",
+                        ephemeral=True
+                    )
+                    return
+                
+                existing = await get_user_subscriptions(interaction.user.id)
+                if len(existing) >= MAX_SUBSCRIPTIONS_PER_USER:
+                    await interaction.response.send_message(
+                        f"❌ You already have {len(existing)} subscriptions. Remove one with /unsubscribe first.",
+                        ephemeral=True
+                    )
+                    return
+                
+                name = name or ', '.join(keyword_terms or classification_terms or location_terms)
+                subscription_id = await add_subscription(
+                    interaction.user.id, name, keyword_terms,
+                    classification_terms, location_terms, salary_min
+                )
+                await interaction.response.send_message(
+                    f"✅ Subscribed to **{name}** (ID {subscription_id}). Matching jobs will be sent to you by DM.",
+                    ephemeral=True
+                )
+            except Exception as e:
+                logger.error(f"Error in subscribe command: {str(e)}")
+                await interaction.response.send_message(
+                    "❌ An error occurred while saving your subscription.",
+                    ephemeral=True
+                )
+        
+        @self.tree.command(
+            name="subscriptions",
+            description="List your job subscriptions"
+        )
+        async def subscriptions(interaction: discord.Interaction):
+            """List the user's subscriptions"""
+            try:
+                user_subscriptions = await get_user_subscriptions(interaction.user.id)
+                if not user_subscriptions:
+                    await interaction.response.send_message(
+                        "You have no subscriptions. Create one with /subscribe.",
+                        ephemeral=True
+                    )
+                    return
+                
+                embed = discord.Embed(
+                    title="🔔 Your Subscriptions",
+                    color=discord.Color.from_str('#fd0585')
+                )
+                for subscription in user_subscriptions:
+                    details = []
+                    if subscription['keywords']:
+                        details.append(f"Keywords: {', '.join(subscription['keywords'])}")
+                    if subscription['classifications']:
+                        details.append(f"Classifications: {', '.join(subscription['classifications'])}")
+                    if subscription['locations']:
+                        details.append(f"Locations: {', '.join(subscription['locations'])}")
+                    if subscription['salary_min']:
+                        details.append(f"Salary from: ${subscription['salary_min']:,.0f}")
+                    embed.add_field(
+                        name=f"{subscription['id']}. {subscription['name']}",
+                        value='\n'.join(details),
+                        inline=False
+                    )
+                await interaction.response.send_message(embed=embed, ephemeral=True)
+            except Exception as e:
+                logger.error(f"Error in subscriptions command: {str(e)}")
+                await interaction.response.send_message(
+                    "❌ An error occurred while retrieving your subscriptions.",
+                    ephemeral=True
+                )
+        
+        @self.tree.command(
+            name="unsubscribe",
+            description="Remove one of your job subscriptions"
+        )
+        @app_commands.describe(subscription_id="The subscription ID shown by /subscriptions")
+        async def unsubscribe(interaction: discord.Interaction, subscription_id: int):
+            """Remove a user's subscription"""
+            try:
+                if await remove_subscription(interaction.user.id, subscription_id):
+                    message = f"✅ Removed subscription {subscription_id}."
+                else:
+                    message = f"❌ You don't have a subscription with ID {subscription_id}."
+                await interaction.response.send_message(message, ephemeral=True)
+            except Exception as e:
+                logger.error(f"Error in unsubscribe command: {str(e)}")
+                await interaction.response.send_message(
+                    "❌ An error occurred while removing your subscription.",
+                    ephemeral=True
+                )
+        
+        @self.tree.command(
+            name="search",
+            description="Search every job the bot has seen"
+        )
+        @app_commands.describe(query="Words to search for in job titles, companies, descriptions and tags")
+        async def search(interaction: discord.Interaction, query: str):
+            """Full-text search over stored jobs"""
+            try:
+                total, results = await seek.search_jobs(query)
+                if not total:
+                    await interaction.response.send_message(
+                        f"No stored jobs match '{query}'.",
+                        ephemeral=True
+                    )
+                    return
+                await interaction.response.send_message(
+                    embed=create_search_embed(query, total, results, 0),
+                    view=SearchResultsView(query, total),
+                    ephemeral=True
+                )
+            except Exception as e:
+                logger.error(f"Error in search command: {str(e)}")
+                await interaction.response.send_message(
+                    "❌ An error occurred while searching jobs.",
+                    ephemeral=True
+                )
+        
+        @self.tree.command(
+            name="saved",
+            description="List the jobs you have saved"
+        )
+        @app_commands.describe(status="Which saved jobs to list")
+        @app_commands.choices(status=[
+            app_commands.Choice(name="Saved", value="saved"),
+            app_commands.Choice(name="Applied", value="applied"),
+            app_commands.Choice(name="Dismissed", value="dismissed")
+        ])
+        async def saved(interaction: discord.Interaction, status: str = "saved"):
+            """List the user's saved jobs"""
+            try:
+                total = await count_saved_jobs(interaction.user.id, status)
+                if not total:
+                    await interaction.response.send_message(
+                        f"You have no {status} jobs. Use 📌 Save on a job post to keep it here.",
+                        ephemeral=True
+                    )
+                    return
+                rows, next_cursor = await get_saved_jobs_page(interaction.user.id, status)
+                await interaction.response.send_message(
+                    embed=create_saved_jobs_embed(rows, status, total, 0),
+                    view=SavedJobsView(interaction.user.id, status, total, next_cursor),
+                    ephemeral=True
+                )
+            except Exception as e:
+                logger.error(f"Error in saved command: {str(e)}")
+                await interaction.response.send_message(
+                    "❌ An error occurred while retrieving your saved jobs.",
+                    ephemeral=True
+                )
+        
         # Add migrate database command for admins
         @self.tree.command(
             name="migrate_database",
@@ -822,12 +1608,13 @@ class JobBot(commands.Bot):
                 await interaction.response.defer(ephemeral=True)
                 
                 # Connect to database and run migrations
-                async with seek.aiosqlite.connect(seek.DATABASE_PATH) as db:
+                async with seek.database.writer() as db:
                     # First run migration for jobs table
                     await seek.migrate_database(db)
                     
                     # Then run migration for saved_jobs table
                     await migrate_saved_jobs_table(db)
+                    await create_saved_jobs_indexes(db)
                     
                 await interaction.followup.send(
                     "✅ Database migration completed successfully! Schema should now be up-to-date.",
@@ -835,111 +1622,49 @@ class JobBot(commands.Bot):
                 )
                 
             except Exception as e:
-                print(f"Error in migrate_database command: {str(e)}")
+                logger.error(f"Error in migrate_database command: {str(e)}")
                 await interaction.followup.send(
                     f"❌ Error during database migration: {str(e)}",
                     ephemeral=True
                 )
         
         await self.tree.sync()  # Sync slash commands
-        print("✓ Commands synced")
+        logger.info("✓ Commands synced")
         
     async def on_ready(self):
         """Called when the bot is ready"""
-        print(f'🤖 Logged in as {self.user} (ID: {self.user.id})')
-        print('------')
+        logger.info(f'🤖 Logged in as {self.user} (ID: {self.user.id})')
         
-        # Set up output capture after bot is ready
-        self.output_capture = OutputCapture(self, LOGS_CHANNEL_ID)
-        sys.stdout = self.output_capture
+        # Mirror logs to the logs channel now that it can be reached
+        if LOGS_CHANNEL_ID and self.log_sink is None:
+            self.log_sink = DiscordSink(self.get_channel, LOGS_CHANNEL_ID)
+            log_pipeline.add_sink(self.log_sink)
         
         # Set the global bot instance
         global bot_instance
         bot_instance = self
         
-        # Start the continuous job check
+        # Start the outbox workers and the continuous job check
+        if not self.outbox_tasks or all(task.done() for task in self.outbox_tasks):
+            self.outbox_tasks = [asyncio.create_task(worker.run()) for worker in self.outbox_workers]
+            if len(seek.job_routes):
+                logger.info(f"🧭 Routing jobs to {len(seek.job_routes)} extra destinations")
+        if self.reminder_task is None or self.reminder_task.done():
+            self.reminder_task = asyncio.create_task(reminder_scheduler.run())
+            logger.info(f"✓ Reminder scheduler started ({len(reminder_scheduler)} reminders scheduled)")
         asyncio.create_task(self.continuous_job_check())
-    
-    @tasks.loop(hours=1)  # Check for reminders every hour
-    async def reminder_check_loop(self):
-        """Check for jobs that need reminders"""
-        print("🔔 Checking for job reminders...")
-        try:
-            await check_saved_jobs_reminders()
-            print("✓ Reminder check completed")
-        except Exception as e:
-            print(f"❌ Error in reminder check: {str(e)}")
-    
-    @reminder_check_loop.before_loop
-    async def before_reminder_check(self):
-        """Wait until the bot is ready before starting the loop"""
-        await self.wait_until_ready()
-        print("✓ Reminder check loop initialized")
 
     async def continuous_job_check(self):
         """Continuous job checking that mimics seek_jobs_monitor's behavior"""
         try:
             while not self.shutdown_event.is_set():
-                # Process jobs using our own implementation
-                print(f"⚡ Starting job check at {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-                
                 try:
-                    jobs = await seek.fetch_jobs()
-                    if not jobs:
-                        print("✗ No jobs fetched or error occurred")
-                        continue
-                    
-                    print(f"ℹ Found {len(jobs)} jobs")
-                    
-                    async with seek.aiosqlite.connect(seek.DATABASE_PATH) as db:
-                        new_jobs = 0
-                        filtered_jobs = 0
-                        for job in jobs:
-                            try:
-                                if not await seek.is_job_processed(db, job['id']):
-                                    if not seek.should_process_job(job):
-                                        filtered_jobs += 1
-                                        continue
-                                        
-                                    if await post_job(job):
-                                        await seek.save_job(db, job)
-                                        new_jobs += 1
-                                        print(f"✓ Posted new job: {job['title']} ({job['id']})")
-                                    else:
-                                        print(f"✗ Failed to post job: {job['title']} ({job['id']})")
-                            except Exception as job_error:
-                                print(f"❌ Error processing job {job.get('id', 'unknown')}: {str(job_error)}")
-                                # Continue with next job
-                        
-                        if new_jobs == 0 and filtered_jobs == 0:
-                            print("ℹ No new jobs found")
-                        else:
-                            print(f"✓ Posted {new_jobs} new jobs ({filtered_jobs} filtered out)")
-                            
-                        # Print job statistics
-                        try:
-                            stats = await seek.get_job_stats()
-                            print("\n📊 Job Statistics:")
-                            print(f"Total jobs tracked: {stats['total_jobs']}")
-                            print(f"Jobs in last 24h: {stats['jobs_last_24h']}")
-                            print("\nTop Classifications:")
-                            for row in stats['top_classifications']:
-                                print(f"• {row['classification']}: {row['count']}")
-                            print("\nMost Active Companies:")
-                            for row in stats['top_companies']:
-                                print(f"• {row['company']}: {row['count']}")
-                            print("\nWork Type Distribution:")
-                            for row in stats['work_types']:
-                                print(f"• {row['work_type']}: {row['count']}")
-                        except Exception as e:
-                            print(f"⚠ Error getting statistics: {str(e)}")
+                    await self.check_jobs_once()
                 except aiosqlite.OperationalError as db_error:
-                    print(f"\n❌ Database schema error: {str(db_error)}")
-                    print("🔄 This may be due to a schema change. Please restart the bot to apply migrations.")
+                    logger.error(f"❌ Database schema error: {str(db_error)}")
+                    logger.warning("🔄 This may be due to a schema change. Please restart the bot to apply migrations.")
                 except Exception as e:
-                    print(f"\n❌ Error during job processing: {str(e)}")
-                    import traceback
-                    print(traceback.format_exc())
+                    logger.exception(f"❌ Error during job processing: {str(e)}")
                 
                 # Break into smaller sleep intervals to check shutdown_event
                 for _ in range(seek.CHECK_INTERVAL):
@@ -948,13 +1673,59 @@ class JobBot(commands.Bot):
                     await asyncio.sleep(1)
                     
         except asyncio.CancelledError:
-            print("Job check loop cancelled")
+            logger.info("Job check loop cancelled")
         except Exception as e:
-            print(f"\n❌ Error in main loop: {str(e)}")
-            import traceback
-            print(traceback.format_exc())  # Print full traceback for easier debugging
+            logger.exception(f"❌ Error in main loop: {str(e)}")
         finally:
-            print("Job check loop ended")
+            logger.info("Job check loop ended")
+
+    async def check_jobs_once(self):
+        """Run a single fetch, filter and post cycle."""
+        logger.info(f"⚡ Starting job check at {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+        
+        jobs, watermarks = await seek.fetch_all_jobs()
+        if not jobs:
+            logger.warning("✗ No jobs fetched or error occurred")
+            return
+        
+        logger.info(f"ℹ Found {len(jobs)} jobs")
+        
+        seek.reset_write_stats()
+        async with seek.database.reader() as db:
+            unseen_jobs = await seek.filter_unprocessed_jobs(db, jobs)
+        
+        accepted_jobs = seek.job_filter.filter(unseen_jobs)
+        filtered_jobs = len(unseen_jobs) - len(accepted_jobs)
+        accepted_jobs, duplicate_jobs = seek.split_duplicates(accepted_jobs)
+        
+        # Queue per-user matches for every new job, including ones the channel filters skip
+        try:
+            subscription_targets = await queue_subscription_matches(unseen_jobs)
+        except Exception as e:
+            logger.warning(f"⚠ Error matching subscriptions: {str(e)}")
+            subscription_targets = {}
+        
+        # Save new jobs and queue them for the outbox workers in one transaction;
+        # suppressed duplicates are stored too so they are not reconsidered next cycle
+        await seek.save_and_enqueue(accepted_jobs + duplicate_jobs, accepted_jobs, watermarks, subscription_targets)
+        new_jobs = len(accepted_jobs)
+        
+        if new_jobs == 0 and filtered_jobs == 0 and not duplicate_jobs:
+            logger.info("ℹ No new jobs found")
+        else:
+            logger.info(f"✓ Queued {new_jobs} new jobs ({filtered_jobs} filtered out, {len(duplicate_jobs)} duplicates suppressed)")
+            logger.info(f"💾 Saved {seek.write_stats['rows']} rows in {seek.write_stats['commits']} commits")
+            
+        # Log job statistics at DEBUG so they stay out of the logs channel by default
+        try:
+            await seek.log_job_stats(logging.DEBUG)
+            log_metrics = log_pipeline.metrics()
+            logger.debug(
+                f"📝 Logs: {log_metrics['buffered']}/{log_metrics['capacity']} buffered, "
+                f"{log_metrics['sampled']} sampled out, {log_metrics['dropped']} dropped"
+            )
+        except Exception as e:
+            logger.warning(f"⚠ Error getting statistics: {str(e)}")
 
 class JobActionsView(discord.ui.View):
     def __init__(self, job_id: str):
@@ -995,7 +1766,7 @@ class JobActionsView(discord.ui.View):
             await interaction.response.edit_message(embed=embed, view=None)
             await interaction.message.delete(delay=3)  # Delete after 3 seconds
         except Exception as e:
-            print(f"Error in dismiss button: {str(e)}")
+            logger.error(f"Error in dismiss button: {str(e)}")
             await interaction.response.send_message("❌ An error occurred", ephemeral=True)
 
     @discord.ui.button(
@@ -1028,7 +1799,7 @@ class JobActionsView(discord.ui.View):
             await interaction.message.delete(delay=3)  # Delete after 3 seconds
             
         except Exception as e:
-            print(f"Error saving job: {str(e)}")
+            logger.error(f"Error saving job: {str(e)}")
             await interaction.response.send_message("❌ An error occurred while saving the job", ephemeral=True)
 
     @discord.ui.button(
@@ -1039,156 +1810,342 @@ class JobActionsView(discord.ui.View):
     )
     async def ai_compatibility_button(self, interaction: discord.Interaction, button: discord.ui.Button):
         """Handle AI compatibility check button click"""
-        try:
-            # Extract job ID from the message URL
-            message_embeds = interaction.message.embeds
-            if not message_embeds:
-                await interaction.response.send_message("❌ Error: Could not find job information", ephemeral=True)
-                return
-                
-            job_url = message_embeds[0].url
-            job_id = job_url.split('/')[-1]
-            
-            # Check if user has a resume uploaded
-            resume = await get_user_resume(interaction.user.id)
+        await check_compatibility(interaction)
+
+async def check_compatibility(interaction: discord.Interaction):
+    """Check the user's resume against the job a message shows, for the job and digest views."""
+    try:
+        # Extract job ID from the message URL
+        message_embeds = interaction.message.embeds
+        if not message_embeds:
+            await interaction.response.send_message("❌ Error: Could not find job information", ephemeral=True)
+            return
             
-            if not resume:
-                # No resume found, prompt to upload one
-                await interaction.response.send_modal(
-                    ResumeModal(job_id=job_id, analyze_immediately=True)
-                )
-                return
+        job_url = message_embeds[0].url
+        job_id = job_url.split('/')[-1]
+        
+        # Check if user has a resume uploaded
+        resume = await get_user_resume(interaction.user.id)
+        
+        if not resume:
+            # No resume found, prompt to upload one
+            await interaction.response.send_modal(
+                ResumeModal(job_id=job_id, analyze_immediately=True)
+            )
+            return
+        
+        # User has a resume, start the compatibility analysis
+        await interaction.response.defer(ephemeral=True)
+        
+        # Get job data
+        job_data = await get_cached_job_data(job_id)
+        if not job_data:
+            await interaction.followup.send(
+                "❌ Could not find job data for compatibility analysis. The job may no longer exist in our database.",
+                ephemeral=True
+            )
+            return
             
-            # User has a resume, start the compatibility analysis
-            await interaction.response.defer(ephemeral=True)
+        # Validate resume text
+        if not resume['resume_text'] or len(resume['resume_text']) < 50:
+            await interaction.followup.send(
+                "❌ Your stored resume appears to be empty or too short for analysis. Please upload a complete resume using `/upload_resume`.",
+                ephemeral=True
+            )
+            return
+        
+        # Send initial status
+        await interaction.followup.send(
+            "🔍 Analyzing your resume against this job posting...\nThis may take up to 30 seconds.",
+            ephemeral=True
+        )
+        
+        try:
+            # Run the analysis
+            score, analysis = await analyze_job_compatibility(resume['resume_text'], job_data)
             
-            # Get job data
-            job_data = await get_cached_job_data(job_id)
-            if not job_data:
-                await interaction.followup.send(
-                    "❌ Could not find job data for compatibility analysis. The job may no longer exist in our database.",
-                    ephemeral=True
-                )
-                return
-                
-            # Validate resume text
-            if not resume['resume_text'] or len(resume['resume_text']) < 50:
-                await interaction.followup.send(
-                    "❌ Your stored resume appears to be empty or too short for analysis. Please upload a complete resume using `/upload_resume`.",
-                    ephemeral=True
-                )
-                return
+            # Create the results embed
+            embed = create_compatibility_embed(job_data, score, analysis)
             
-            # Send initial status
+            # Send the results to the user
             await interaction.followup.send(
-                "🔍 Analyzing your resume against this job posting...\nThis may take up to 30 seconds.",
+                content=f"Here's your AI job match analysis for: **{job_data.get('title')}**",
+                embed=embed,
                 ephemeral=True
             )
             
-            try:
-                # Run the analysis
-                score, analysis = await analyze_job_compatibility(resume['resume_text'], job_data)
-                
-                # Create the results embed
-                embed = create_compatibility_embed(job_data, score, analysis)
-                
-                # Send the results to the user
-                await interaction.followup.send(
-                    content=f"Here's your AI job match analysis for: **{job_data.get('title')}**",
-                    embed=embed,
-                    ephemeral=True
-                )
-                
-                # Save the analysis results
-                await save_compatibility_results(job_id, interaction.user.id, score, analysis)
-            except Exception as analysis_error:
-                print(f"Error during compatibility analysis: {str(analysis_error)}")
-                import traceback
-                print(traceback.format_exc())
-                
-                await interaction.followup.send(
-                    f"❌ Error analyzing job compatibility: {str(analysis_error)}\n\n" +
-                    "This could be due to a server issue or a problem with OpenAI's API. Please try again later.",
-                    ephemeral=True
-                )
+            # Save the analysis results
+            await save_compatibility_results(job_id, interaction.user.id, score, analysis)
+        except Exception as analysis_error:
+            logger.exception(f"Error during compatibility analysis: {str(analysis_error)}")
             
+            await interaction.followup.send(
+                f"❌ Error analyzing job compatibility: {str(analysis_error)}\n\n" +
+                "This could be due to a server issue or a problem with OpenAI's API. Please try again later.",
+                ephemeral=True
+            )
+        
+    except Exception as e:
+        logger.exception(f"Error in AI compatibility check: {str(e)}")
+        
+        # Try to send an error message, but don't error if response is already sent
+        try:
+            if interaction.response.is_done():
+                await interaction.followup.send("❌ An error occurred during the compatibility check.", ephemeral=True)
+            else:
+                await interaction.response.send_message("❌ An error occurred during the compatibility check.", ephemeral=True)
+        except:
+            pass
+
+DIGEST_JOB_ID_PATTERN = re.compile(r'seek\.com\.au/job/(\w+)')
+
+def digest_job_from_row(row):
+    """Shape a jobs table row like a SEEK listing for the digest helpers."""
+    return {
+        'id': row['id'],
+        'title': row['title'] or 'Unknown title',
+        'companyName': row['company'] or 'Unknown Company',
+        'locations': [{'label': row['location'] or 'Unknown location'}],
+        'salaryLabel': row['salary'],
+        'teaser': row['description']
+    }
+
+async def get_digest_jobs(job_ids):
+    """Load the jobs listed in a digest message, in digest order."""
+    placeholders = ','.join('?' * len(job_ids))
+    async with seek.database.reader() as db:
+        db.row_factory = aiosqlite.Row
+        async with db.execute(
+            f'SELECT id, title, company, location, salary, description FROM jobs WHERE id IN ({placeholders})',
+            job_ids
+        ) as cursor:
+            rows = {row['id']: digest_job_from_row(row) for row in await cursor.fetchall()}
+    return [rows[job_id] for job_id in job_ids if job_id in rows]
+
+class DigestView(discord.ui.View):
+    """Pagination for a digest message.
+    
+    The digest lists several jobs and shows the highlighted one in full;
+    Previous and Next move the highlight, and the job actions act on the
+    highlighted job. The buttons have their own digest_* custom_ids so they
+    never route to JobActionsView. Everything needed is read back from the
+    message, so the view keeps working across restarts.
+    """
+    def __init__(self, job_id: str):
+        super().__init__(timeout=None)
+        self.job_id = job_id
+        
+        # Add the Apply button for the highlighted job
+        self.add_item(discord.ui.Button(
+            label="Apply",
+            style=discord.ButtonStyle.link,
+            emoji="<:blog:1330298579377590376>",
+            url=f"https://www.seek.com.au/job/{job_id}" if job_id != "*" else "https://www.seek.com.au"
+        ))
+
+    @staticmethod
+    def _state(message):
+        embed = message.embeds[0]
+        job_ids = DIGEST_JOB_ID_PATTERN.findall(embed.description or '')
+        current = embed.url.split('/')[-1] if embed.url else None
+        index = job_ids.index(current) if current in job_ids else 0
+        return job_ids, index
+
+    async def _show(self, interaction, step=0, remove=False):
+        job_ids, index = self._state(interaction.message)
+        if remove:
+            job_ids.pop(index)
+            if not job_ids:
+                await interaction.response.defer()
+                await interaction.message.delete()
+                return
+            index = min(index, len(job_ids) - 1)
+        
+        jobs = await get_digest_jobs(job_ids)
+        if not jobs:
+            await interaction.response.send_message("❌ Error: Could not find job information", ephemeral=True)
+            return
+        index = (index + step) % len(jobs)
+        await interaction.response.edit_message(
+            embed=create_digest_embed(jobs, index),
+            view=DigestView(jobs[index]['id'])
+        )
+
+    @discord.ui.button(label="Previous", style=discord.ButtonStyle.primary, emoji="◀️", custom_id="digest_previous", row=1)
+    async def previous_button(self, interaction: discord.Interaction, button: discord.ui.Button):
+        """Highlight the previous job in the digest"""
+        try:
+            await self._show(interaction, step=-1)
         except Exception as e:
-            print(f"Error in AI compatibility check: {str(e)}")
-            import traceback
-            print(traceback.format_exc())
-            
-            # Try to send an error message, but don't error if response is already sent
-            try:
-                if interaction.response.is_done():
-                    await interaction.followup.send("❌ An error occurred during the compatibility check.", ephemeral=True)
-                else:
-                    await interaction.response.send_message("❌ An error occurred during the compatibility check.", ephemeral=True)
-            except:
-                pass
+            logger.error(f"Error in digest previous button: {str(e)}")
+            await interaction.response.send_message("❌ An error occurred", ephemeral=True)
 
-class OutputCapture:
-    def __init__(self, bot, channel_id):
-        self.bot = bot
-        self.channel_id = channel_id
-        self.buffer = StringIO()
-        self.last_send = 0
-        self.lock = asyncio.Lock()
-        self._queue = asyncio.Queue()
-        self._task = None
-
-    def write(self, text):
-        sys.__stdout__.write(text)  # Still write to terminal
-        self._queue.put_nowait(text)
-        if self._task is None or self._task.done():
-            self._task = asyncio.create_task(self._process_queue())
-
-    def flush(self):
-        sys.__stdout__.flush()  # Flush terminal output
-        
-    async def _process_queue(self):
-        """Process the queue of text to write"""
+    @discord.ui.button(label="Next", style=discord.ButtonStyle.primary, emoji="▶️", custom_id="digest_next", row=1)
+    async def next_button(self, interaction: discord.Interaction, button: discord.ui.Button):
+        """Highlight the next job in the digest"""
         try:
-            while True:
-                # Get all available text from queue
-                text = await self._queue.get()
-                while not self._queue.empty():
-                    text += await self._queue.get()
-
-                async with self.lock:
-                    self.buffer.write(text)
-                    now = datetime.now().timestamp()
-                    
-                    # Send if buffer is getting full or enough time has passed
-                    if (self.buffer.tell() > 1500) or (now - self.last_send > 5):
-                        content = self.buffer.getvalue()
-                        if content:
-                            channel = self.bot.get_channel(self.channel_id)
-                            if channel:
-                                # Split into chunks if too long
-                                chunks = [content[i:i+1900] for i in range(0, len(content), 1900)]
-                                for chunk in chunks:
-                                    try:
-                                        await channel.send(f"```\n{chunk}\n```")
-                                    except Exception as e:
-                                        sys.__stdout__.write(f"Error sending to Discord: {str(e)}\n")
-                            
-                            self.buffer = StringIO()
-                            self.last_send = now
-
-                # Small delay to allow more text to accumulate
-                await asyncio.sleep(0.1)
+            await self._show(interaction, step=1)
+        except Exception as e:
+            logger.error(f"Error in digest next button: {str(e)}")
+            await interaction.response.send_message("❌ An error occurred", ephemeral=True)
 
-        except asyncio.CancelledError:
-            # Ensure any remaining content is sent
-            content = self.buffer.getvalue()
-            if content:
-                channel = self.bot.get_channel(self.channel_id)
-                if channel:
-                    try:
-                        await channel.send(f"```\n{content}\n```")
-                    except Exception as e:
-                        sys.__stdout__.write(f"Error sending to Discord: {str(e)}\n")
-            raise
+    @discord.ui.button(
+        label="Not Interested",
+        style=discord.ButtonStyle.secondary,
+        emoji="<:sqaurex:1330298583135817780>",
+        custom_id="digest_dismiss"
+    )
+    async def dismiss_button(self, interaction: discord.Interaction, button: discord.ui.Button):
+        """Remove the highlighted job from the digest"""
+        try:
+            await self._show(interaction, remove=True)
+        except Exception as e:
+            logger.error(f"Error in digest dismiss button: {str(e)}")
+            await interaction.response.send_message("❌ An error occurred", ephemeral=True)
+
+    @discord.ui.button(
+        label="Save",
+        style=discord.ButtonStyle.secondary,
+        emoji="<:bookmark2:1330298581319417947>",
+        custom_id="digest_save"
+    )
+    async def save_button(self, interaction: discord.Interaction, button: discord.ui.Button):
+        """Save the highlighted job without removing the digest"""
+        try:
+            job_ids, index = self._state(interaction.message)
+            await save_job_for_user(job_ids[index], interaction.user.id, str(interaction.message.id))
+            await interaction.response.send_message(
+                "📌 Job saved! I'll send you reminders in the saved jobs channel.",
+                ephemeral=True
+            )
+        except Exception as e:
+            logger.error(f"Error saving job from digest: {str(e)}")
+            await interaction.response.send_message("❌ An error occurred while saving the job", ephemeral=True)
+
+    @discord.ui.button(
+        label="Check Compatibility",
+        style=discord.ButtonStyle.secondary,
+        emoji="<:sparkle220x:1384044645511860294>",
+        custom_id="digest_ai_compatibility"
+    )
+    async def ai_compatibility_button(self, interaction: discord.Interaction, button: discord.ui.Button):
+        """Check compatibility with the highlighted job"""
+        await check_compatibility(interaction)
+
+def create_search_embed(query, total, results, page):
+    """Create an embed listing one page of /search results."""
+    pages = max(1, -(-total // seek.SEARCH_PAGE_SIZE))
+    embed = discord.Embed(
+        title=f"🔎 {total} job{'s' if total != 1 else ''} matching '{query}'",
+        color=discord.Color.from_str('#fd0585')
+    )
+    for number, job in enumerate(results, start=page * seek.SEARCH_PAGE_SIZE + 1):
+        details = [f"{seek.EMOTE_COMPANY} {job['company']} · {seek.EMOTE_LOCATION} {job['location']}"]
+        if job['salary']:
+            details.append(f"{seek.EMOTE_SALARY} {job['salary']}")
+        if job['snippet']:
+            details.append(job['snippet'][:300])
+        details.append(f"[View on SEEK](https://www.seek.com.au/job/{job['id']})")
+        embed.add_field(name=f"{number}. {job['title']}"[:256], value='\n'.join(details)[:1024], inline=False)
+    embed.set_footer(text=f"Page {page + 1} of {pages}")
+    return embed
+
+class SearchResultsView(discord.ui.View):
+    """Previous/next buttons for paging through /search results."""
+    def __init__(self, query: str, total: int, page: int = 0):
+        super().__init__(timeout=600)
+        self.query = query
+        self.total = total
+        self.page = page
+        self._update_buttons()
+    
+    def _update_buttons(self):
+        self.previous_button.disabled = self.page == 0
+        self.next_button.disabled = (self.page + 1) * seek.SEARCH_PAGE_SIZE >= self.total
+    
+    async def _show(self, interaction, step):
+        try:
+            self.page += step
+            self.total, results = await seek.search_jobs(self.query, self.page)
+            self._update_buttons()
+            await interaction.response.edit_message(
+                embed=create_search_embed(self.query, self.total, results, self.page),
+                view=self
+            )
+        except Exception as e:
+            logger.error(f"Error paging search results: {str(e)}")
+            await interaction.response.send_message("❌ An error occurred while loading results.", ephemeral=True)
+    
+    @discord.ui.button(label="Previous", emoji="◀️", style=discord.ButtonStyle.secondary)
+    async def previous_button(self, interaction: discord.Interaction, button: discord.ui.Button):
+        await self._show(interaction, -1)
+    
+    @discord.ui.button(label="Next", emoji="▶️", style=discord.ButtonStyle.secondary)
+    async def next_button(self, interaction: discord.Interaction, button: discord.ui.Button):
+        await self._show(interaction, 1)
+
+def create_saved_jobs_embed(rows, status, total, page):
+    """Create an embed listing one page of a user's saved jobs."""
+    pages = max(1, -(-total // SAVED_JOBS_PAGE_SIZE))
+    embed = discord.Embed(
+        title=f"📌 Your {status} jobs ({total})",
+        color=discord.Color.from_str('#fd0585')
+    )
+    for number, job in enumerate(rows, start=page * SAVED_JOBS_PAGE_SIZE + 1):
+        details = [f"{seek.EMOTE_COMPANY} {job['company']} · {seek.EMOTE_LOCATION} {job['location']}"]
+        if job['salary']:
+            details.append(f"{seek.EMOTE_SALARY} {job['salary']}")
+        if job['ai_compatibility_score'] is not None:
+            details.append(f"🤖 Compatibility: {job['ai_compatibility_score']:.0f}%")
+        saved = f"Saved <t:{job['saved_ts']}:R>" if job['saved_ts'] else "Saved"
+        if status == 'saved' and job['next_reminder_ts']:
+            saved += f" · next reminder <t:{job['next_reminder_ts']}:R>"
+        details.append(saved)
+        details.append(f"[View on SEEK](https://www.seek.com.au/job/{job['job_id']})")
+        embed.add_field(name=f"{number}. {job['title']}"[:256], value='\n'.join(details)[:1024], inline=False)
+    embed.set_footer(text=f"Page {page + 1} of {pages}")
+    return embed
+
+class SavedJobsView(discord.ui.View):
+    """Previous/next buttons for paging through /saved.
+    
+    Holds the keyset cursor each visited page started from, so moving in
+    either direction is a single indexed range query.
+    """
+    def __init__(self, user_id, status: str, total: int, next_cursor):
+        super().__init__(timeout=600)
+        self.user_id = user_id
+        self.status = status
+        self.total = total
+        self.cursors = [None]  # Start cursor of each page up to the current one
+        self.next_cursor = next_cursor
+        self._update_buttons()
+    
+    def _update_buttons(self):
+        self.previous_button.disabled = len(self.cursors) == 1
+        self.next_button.disabled = self.next_cursor is None
+    
+    async def _show(self, interaction):
+        try:
+            rows, self.next_cursor = await get_saved_jobs_page(self.user_id, self.status, self.cursors[-1])
+            self._update_buttons()
+            await interaction.response.edit_message(
+                embed=create_saved_jobs_embed(rows, self.status, self.total, len(self.cursors) - 1),
+                view=self
+            )
+        except Exception as e:
+            logger.error(f"Error paging saved jobs: {str(e)}")
+            await interaction.response.send_message("❌ An error occurred while loading saved jobs.", ephemeral=True)
+    
+    @discord.ui.button(label="Previous", emoji="◀️", style=discord.ButtonStyle.secondary)
+    async def previous_button(self, interaction: discord.Interaction, button: discord.ui.Button):
+        self.cursors.pop()
+        await self._show(interaction)
+    
+    @discord.ui.button(label="Next", emoji="▶️", style=discord.ButtonStyle.secondary)
+    async def next_button(self, interaction: discord.Interaction, button: discord.ui.Button):
+        self.cursors.append(self.next_cursor)
+        await self._show(interaction)
 
 def create_embed(job):
     """Create a Discord embed for a job listing using discord.py's Embed class."""
@@ -1225,6 +2182,14 @@ def create_embed(job):
         bullet_points = '\n• ' + '\n• '.join(job['bulletPoints'])
         embed.add_field(name=f"{seek.EMOTE_KEY_POINTS} Key Points", value=bullet_points, inline=False)
     
+    # Note reposts let through in DUPLICATE_MODE=flag
+    if job.get('duplicate_of'):
+        embed.add_field(
+            name="🔁 Possible Repost",
+            value=f"Very similar to https://www.seek.com.au/job/{job['duplicate_of']}",
+            inline=False
+        )
+    
     # Add footer with posting time and any tags
     footer_text = f"Posted {job['listingDateDisplay']}"
     if job.get('tags'):
@@ -1234,31 +2199,99 @@ def create_embed(job):
     
     return embed
 
-async def post_job(job):
-    """Post a job to the Discord channel using the bot."""
+def create_digest_embed(jobs, index=0):
+    """Create a digest embed listing several jobs, with the highlighted one shown in full."""
+    job = jobs[index]
+    embed = discord.Embed(
+        title=job['title'],
+        url=f"https://www.seek.com.au/job/{job['id']}",
+        description='\n'.join(
+            seek.digest_line(entry, '▶' if position == index else '•')
+            for position, entry in enumerate(jobs)
+        ),
+        color=discord.Color.from_str('#fd0585')
+    )
+    embed.set_author(name=f"📋 Job digest · {index + 1} of {len(jobs)}")
+    
+    company_name = job.get('advertiser', {}).get('description') or job.get('companyName', 'Unknown Company')
+    embed.add_field(name=f"{seek.EMOTE_COMPANY} Company", value=company_name, inline=True)
+    embed.add_field(name=f"{seek.EMOTE_LOCATION} Location", value=job['locations'][0]['label'], inline=True)
+    if job.get('salaryLabel'):
+        embed.add_field(name=f"{seek.EMOTE_SALARY} Salary", value=job['salaryLabel'], inline=True)
+    if job.get('teaser'):
+        embed.add_field(name=f"{seek.EMOTE_DESCRIPTION} Description", value=job['teaser'][:1024], inline=False)
+    
+    embed.set_footer(text="Use ◀️ ▶️ to browse · actions apply to the highlighted job", icon_url="https://cdn.getminted.cc/seek.png")
+    return embed
+
+async def post_job(job, channel_id=JOBS_CHANNEL_ID):
+    """Post a job to a Discord channel using the bot and return the message, or None if it could not be posted."""
     global bot_instance
     if not bot_instance:
-        return False
+        return None
         
     try:
-        channel = bot_instance.get_channel(JOBS_CHANNEL_ID)
+        channel = bot_instance.get_channel(channel_id)
         if not channel:
-            print(f"⚠ Could not find jobs channel with ID {JOBS_CHANNEL_ID}")
-            return False
+            logger.warning(f"⚠ Could not find jobs channel with ID {channel_id}")
+            return None
             
         embed = create_embed(job)
         view = JobActionsView(job['id'])
-        await channel.send(embed=embed, view=view)
-        return True
+        await rate_limiter.acquire(f"channel:{channel.id}", PRIORITY_JOBS)
+        return await channel.send(embed=embed, view=view)
     except Exception as e:
-        print(f"Error posting job: {str(e)}")
-        return False
+        logger.error(f"Error posting job: {str(e)}")
+        return None
+
+async def post_jobs(jobs, channel_id=JOBS_CHANNEL_ID):
+    """Post a batch of queued jobs to a channel and return the ones that were posted, in order.
+    
+    Up to POST_CONCURRENCY sends are in flight at once. The rate limiter
+    grants them in listing order, so they leave in order, though overlapping
+    sends can land a position apart; POST_CONCURRENCY=1 sends strictly one
+    after another. Message IDs are recorded in listing order once the batch
+    is done.
+    """
+    if not jobs:
+        return []
+    if seek.use_digest(jobs):
+        return await post_digests(jobs, channel_id)
+    limit = asyncio.Semaphore(max(1, POST_CONCURRENCY))
+    
+    async def post_limited(job):
+        async with limit:
+            return await post_job(job, channel_id=channel_id)
+    
+    results = await asyncio.gather(*(post_limited(job) for job in jobs))
+    await record_job_messages([(job['id'], message) for job, message in zip(jobs, results) if message])
+    return [job for job, message in zip(jobs, results) if message]
+
+async def post_digests(jobs, channel_id=JOBS_CHANNEL_ID):
+    """Post a burst of jobs as digest messages and return the ones that were posted."""
+    channel = bot_instance.get_channel(channel_id) if bot_instance else None
+    if not channel:
+        logger.warning(f"⚠ Could not find jobs channel with ID {channel_id}")
+        return []
+    
+    posted, messages = [], 0
+    for group in seek.chunk_jobs(jobs):
+        try:
+            await rate_limiter.acquire(f"channel:{channel.id}", PRIORITY_JOBS)
+            message = await channel.send(embed=create_digest_embed(group), view=DigestView(group[0]['id']))
+            await record_job_messages([(job['id'], message) for job in group])
+            posted.extend(group)
+            messages += 1
+        except Exception as e:
+            logger.error(f"Error posting job digest: {str(e)}")
+    logger.info(f"📋 Posted {len(posted)} jobs in {messages} digest messages")
+    return posted
 
 async def save_resume(user_id: str, resume_text: str, resume_name: str = "resume.txt"):
     """Save a user's resume to the database."""
     try:
         current_time = datetime.utcnow().strftime('%Y-%m-%d %H:%M:%S')
-        async with seek.aiosqlite.connect(seek.DATABASE_PATH) as db:
+        async with seek.database.writer() as db:
             await db.execute('''
                 INSERT OR REPLACE INTO user_resumes
                 (user_id, resume_text, upload_date, resume_name, last_updated)
@@ -1267,13 +2300,13 @@ async def save_resume(user_id: str, resume_text: str, resume_name: str = "resume
             await db.commit()
         return True
     except Exception as e:
-        print(f"Error saving resume: {str(e)}")
+        logger.error(f"Error saving resume: {str(e)}")
         return False
 
 async def get_user_resume(user_id: str):
     """Get a user's resume from the database."""
     try:
-        async with seek.aiosqlite.connect(seek.DATABASE_PATH) as db:
+        async with seek.database.reader() as db:
             db.row_factory = aiosqlite.Row
             async with db.execute(
                 'SELECT resume_text, resume_name, last_updated FROM user_resumes WHERE user_id = ?',
@@ -1282,7 +2315,7 @@ async def get_user_resume(user_id: str):
                 resume = await cursor.fetchone()
                 return dict(resume) if resume else None
     except Exception as e:
-        print(f"Error getting resume: {str(e)}")
+        logger.error(f"Error getting resume: {str(e)}")
         return None
 
 async def analyze_job_compatibility(resume_text: str, job_data: dict):
@@ -1313,7 +2346,7 @@ async def analyze_job_compatibility(resume_text: str, job_data: dict):
         }
         
         # Debug info
-        print(f"Processing job compatibility for: {job_description['title']}")
+        logger.debug(f"Processing job compatibility for: {job_description['title']}")
         
         # Construct the prompt
         prompt = f"""
@@ -1351,7 +2384,7 @@ async def analyze_job_compatibility(resume_text: str, job_data: dict):
         if "gpt-4" in OPENAI_MODEL or "gpt-3.5-turbo" in OPENAI_MODEL:
             api_params["temperature"] = 0.3
         
-        print(f"Calling OpenAI API with model: {OPENAI_MODEL}")
+        logger.debug(f"Calling OpenAI API with model: {OPENAI_MODEL}")
         
         # Call OpenAI API
         try:
@@ -1359,7 +2392,7 @@ async def analyze_job_compatibility(resume_text: str, job_data: dict):
         except openai.BadRequestError as e:
             # If temperature is the issue, retry without it
             if "temperature" in str(e):
-                print("Temperature not supported by this model, retrying without temperature parameter")
+                logger.info("Temperature not supported by this model, retrying without temperature parameter")
                 if "temperature" in api_params:
                     del api_params["temperature"]
                 response = openai_client.chat.completions.create(**api_params)
@@ -1371,14 +2404,14 @@ async def analyze_job_compatibility(resume_text: str, job_data: dict):
         result_text = response.choices[0].message.content.strip()
         
         # Debug response
-        print(f"OpenAI API response received, length: {len(result_text)}")
+        logger.debug(f"OpenAI API response received, length: {len(result_text)}")
         
         # Parse result with error handling
         try:
             result = json.loads(result_text)
         except json.JSONDecodeError as e:
-            print(f"Error parsing OpenAI response: {str(e)}")
-            print(f"Response was: {result_text[:100]}...")
+            logger.error(f"Error parsing OpenAI response: {str(e)}")
+            logger.debug(f"Response was: {result_text[:100]}...")
             return 50, {
                 "error": "Failed to parse AI response",
                 "strengths": ["Unable to analyze strengths automatically"],
@@ -1398,9 +2431,7 @@ async def analyze_job_compatibility(resume_text: str, job_data: dict):
         return result.get('score', 0), result
         
     except Exception as e:
-        print(f"Error analyzing job compatibility: {str(e)}")
-        import traceback
-        print(traceback.format_exc())
+        logger.exception(f"Error analyzing job compatibility: {str(e)}")
         return 0, {"error": str(e), "strengths": [], "improvement_areas": [], "tailoring_suggestions": []}
 
 class ResumeModal(discord.ui.Modal):
@@ -1463,7 +2494,7 @@ class ResumeModal(discord.ui.Modal):
                     ephemeral=True
                 )
         except Exception as e:
-            print(f"Error in resume submission: {str(e)}")
+            logger.error(f"Error in resume submission: {str(e)}")
             await interaction.response.send_message(
                 "An error occurred while processing your resume.",
                 ephemeral=True
@@ -1506,7 +2537,7 @@ class ResumeModal(discord.ui.Modal):
             await save_compatibility_results(job_id, interaction.user.id, score, analysis)
             
         except Exception as e:
-            print(f"Error in job compatibility analysis: {str(e)}")
+            logger.error(f"Error in job compatibility analysis: {str(e)}")
             await interaction.followup.send(
                 "❌ An error occurred during compatibility analysis.",
                 ephemeral=True
@@ -1518,7 +2549,7 @@ async def save_compatibility_results(job_id, user_id, score, analysis_details):
         current_time = datetime.utcnow().strftime('%Y-%m-%d %H:%M:%S')
         analysis_json = json.dumps(analysis_details) if isinstance(analysis_details, dict) else '{}'
         
-        async with seek.aiosqlite.connect(seek.DATABASE_PATH) as db:
+        async with seek.database.writer() as db:
             await db.execute('''
                 UPDATE saved_jobs
                 SET ai_compatibility_score = ?, 
@@ -1529,7 +2560,7 @@ async def save_compatibility_results(job_id, user_id, score, analysis_details):
             await db.commit()
         return True
     except Exception as e:
-        print(f"Error saving compatibility results: {str(e)}")
+        logger.error(f"Error saving compatibility results: {str(e)}")
         return False
 
 def create_compatibility_embed(job_data, score, analysis):
@@ -1614,7 +2645,7 @@ class ResumeActionsView(discord.ui.View):
         try:
             await interaction.response.send_modal(ResumeModal())
         except Exception as e:
-            print(f"Error opening resume modal: {str(e)}")
+            logger.error(f"Error opening resume modal: {str(e)}")
             await interaction.response.send_message(
                 "❌ An error occurred while opening the resume update form.",
                 ephemeral=True
@@ -1628,7 +2659,7 @@ class ResumeActionsView(discord.ui.View):
     async def delete_resume_button(self, interaction: discord.Interaction, button: discord.ui.Button):
         """Delete the user's resume"""
         try:
-            async with seek.aiosqlite.connect(seek.DATABASE_PATH) as db:
+            async with seek.database.writer() as db:
                 await db.execute(
                     'DELETE FROM user_resumes WHERE user_id = ?',
                     (str(interaction.user.id),)
@@ -1641,7 +2672,7 @@ class ResumeActionsView(discord.ui.View):
                 view=None
             )
         except Exception as e:
-            print(f"Error deleting resume: {str(e)}")
+            logger.error(f"Error deleting resume: {str(e)}")
             await interaction.response.send_message(
                 "❌ An error occurred while deleting your resume.",
                 ephemeral=True
@@ -1673,7 +2704,7 @@ async def process_resume_file(file_path, file_ext):
                     file_content = text
             except ImportError:
                 # If PyPDF2 is not available, use a simple approach
-                print("PyPDF2 not available, using fallback method for PDF")
+                logger.warning("PyPDF2 not available, using fallback method for PDF")
                 with open(file_path, 'rb') as f:
                     # Read binary content for processing with OpenAI
                     file_content = "PDF binary content extracted"
@@ -1689,7 +2720,7 @@ async def process_resume_file(file_path, file_ext):
                 file_content = '\n'.join(text)
             except ImportError:
                 # If python-docx is not available, use a simple approach
-                print("python-docx not available, using fallback method for DOCX")
+                logger.warning("python-docx not available, using fallback method for DOCX")
                 with open(file_path, 'rb') as f:
                     # Read binary content for processing with OpenAI
                     file_content = "DOCX binary content extracted"
@@ -1717,7 +2748,7 @@ async def process_resume_file(file_path, file_ext):
             if "gpt-4" in OPENAI_MODEL or "gpt-3.5-turbo" in OPENAI_MODEL:
                 api_params["temperature"] = 0.2
                 
-            print(f"Processing resume file with model: {OPENAI_MODEL}")
+            logger.debug(f"Processing resume file with model: {OPENAI_MODEL}")
             
             # Call OpenAI API with error handling
             try:
@@ -1725,7 +2756,7 @@ async def process_resume_file(file_path, file_ext):
             except openai.BadRequestError as e:
                 # If temperature is the issue, retry without it
                 if "temperature" in str(e):
-                    print("Temperature not supported for resume processing, retrying without temperature")
+                    logger.info("Temperature not supported for resume processing, retrying without temperature")
                     if "temperature" in api_params:
                         del api_params["temperature"]
                     response = openai_client.chat.completions.create(**api_params)
@@ -1737,19 +2768,26 @@ async def process_resume_file(file_path, file_ext):
         
         return None
     except Exception as e:
-        print(f"Error processing resume file: {str(e)}")
-        import traceback
-        print(traceback.format_exc())
+        logger.exception(f"Error processing resume file: {str(e)}")
         return None
 
 async def main():
     """Main function to run the bot"""
+    # Send log records through the log pipeline from here on
+    log_pipeline.install()
+    log_pipeline.start()
     try:
-        print("📦 Initializing database...")
+        if openai_client:
+            logger.info("✓ OpenAI client initialized")
+        else:
+            logger.warning("⚠ OpenAI API key not found, AI features will not be available")
+        logger.info("📦 Initializing database...")
         # Initialize the database
         await seek.setup_database()
         await setup_saved_jobs_table()
-        print("✓ Database initialization complete")
+        await setup_subscriptions_table()
+        await setup_job_messages_table()
+        logger.info("✓ Database initialization complete")
         
         # Create shutdown event
         shutdown_event = asyncio.Event()
@@ -1761,7 +2799,7 @@ async def main():
         loop = asyncio.get_event_loop()
         
         def signal_handler():
-            print("\n🛑 Shutdown signal received. Cleaning up...")
+            logger.info("🛑 Shutdown signal received. Cleaning up...")
             shutdown_event.set()
             asyncio.create_task(bot.close())
         
@@ -1772,8 +2810,10 @@ async def main():
             await bot.start(DISCORD_TOKEN)
             
     except Exception as e:
-        print(f"❌ Critical error in main: {str(e)}")
+        logger.exception(f"❌ Critical error in main: {str(e)}")
         raise  # Re-raise to ensure the error is not silently caught
+    finally:
+        await log_pipeline.stop()
 
 if __name__ == "__main__":
     try:
@@ -0,0 +1,339 @@
+import os
+import sys
+import time
+import asyncio
+import logging
+import threading
+from collections import deque
+from logging.handlers import RotatingFileHandler
+from dotenv import load_dotenv
+from ratelimit import rate_limiter, PRIORITY_LOGS
+
+# Load environment variables
+load_dotenv()
+
+DEBUG = logging.DEBUG
+INFO = logging.INFO
+WARNING = logging.WARNING
+ERROR = logging.ERROR
+
+def parse_level(name, default=INFO):
+    """Turn a level name such as 'warning' into its number."""
+    level = logging.getLevelName(str(name).strip().upper())
+    return level if isinstance(level, int) else default
+
+# Log pipeline settings
+LOG_BUFFER_SIZE = int(os.getenv('LOG_BUFFER_SIZE', '2000'))  # Records held between flushes
+LOG_SAMPLE_THRESHOLD = float(os.getenv('LOG_SAMPLE_THRESHOLD', '0.5'))  # Buffer fill ratio at which DEBUG and INFO records are sampled
+LOG_SAMPLE_RATE = int(os.getenv('LOG_SAMPLE_RATE', '10'))  # Keep one in this many DEBUG and INFO records while sampling
+LOG_FLUSH_SIZE = int(os.getenv('LOG_FLUSH_SIZE', '100'))  # Buffered records that trigger an early flush
+LOG_FLUSH_INTERVAL = float(os.getenv('LOG_FLUSH_INTERVAL', '0.5'))  # Seconds between flushes
+LOG_LIBRARY_LEVEL = parse_level(os.getenv('LOG_LIBRARY_LEVEL', 'WARNING'), WARNING)  # Threshold for other libraries' records, e.g. discord.py
+
+# Log sink settings
+LOG_TERMINAL_LEVEL = parse_level(os.getenv('LOG_TERMINAL_LEVEL', 'DEBUG'), DEBUG)
+LOG_FILE = os.getenv('LOG_FILE', '')  # Rotating log file, disabled when empty
+LOG_FILE_LEVEL = parse_level(os.getenv('LOG_FILE_LEVEL', 'DEBUG'), DEBUG)
+LOG_FILE_MAX_BYTES = int(os.getenv('LOG_FILE_MAX_BYTES', str(5 * 1024 * 1024)))  # Size at which the file is rotated
+LOG_FILE_BACKUPS = int(os.getenv('LOG_FILE_BACKUPS', '3'))  # Rotated files kept
+LOG_DISCORD_LEVEL = parse_level(os.getenv('LOG_DISCORD_LEVEL', 'INFO'), INFO)
+LOG_DISCORD_BUFFER_SIZE = int(os.getenv('LOG_DISCORD_BUFFER_SIZE', '500'))  # Lines queued for the logs channel
+LOG_DISCORD_INTERVAL = float(os.getenv('LOG_DISCORD_INTERVAL', '5'))  # Minimum seconds between logs channel batches
+LOG_DISCORD_MAX_MESSAGES = int(os.getenv('LOG_DISCORD_MAX_MESSAGES', '2'))  # Messages sent per batch, the rest waits for the next one
+
+DISCORD_MESSAGE_LIMIT = 1900  # Characters per code block, leaving room for the fences
+
+# Loggers under this name belong to the app; anything else is a library
+APP_LOGGER = 'seekret'
+
+def report_error(text):
+    """Write a sink failure straight to stderr so it cannot loop back into the pipeline."""
+    sys.stderr.write(f"{text}\n")
+
+class TerminalSink(logging.StreamHandler):
+    """Writes records to stdout as the bare message, as the console always looked."""
+    def __init__(self, level=LOG_TERMINAL_LEVEL, stream=None):
+        super().__init__(stream or sys.stdout)
+        self.setLevel(level)
+        self.setFormatter(logging.Formatter('%(message)s'))
+
+class FileSink(RotatingFileHandler):
+    """Appends timestamped records to a size-rotated log file."""
+    def __init__(self, path=LOG_FILE, level=LOG_FILE_LEVEL, max_bytes=LOG_FILE_MAX_BYTES, backups=LOG_FILE_BACKUPS):
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        super().__init__(path, maxBytes=max_bytes, backupCount=backups, encoding='utf-8')
+        self.setLevel(level)
+        self.setFormatter(logging.Formatter('%(asctime)s %(levelname)-7s %(name)s: %(message)s'))
+
+class DiscordSink(logging.Handler):
+    """Mirrors records to a Discord channel as code blocks.
+
+    Lines wait in their own bounded queue for a sender task, so a slow or
+    rate-limited channel never holds up the other sinks. Each batch sends at
+    most max_messages at log priority, behind job posts and user replies;
+    lines that overflow the queue are dropped and the next message says how
+    many.
+    """
+    def __init__(self, get_channel, channel_id, level=LOG_DISCORD_LEVEL, buffer_size=LOG_DISCORD_BUFFER_SIZE,
+                 interval=LOG_DISCORD_INTERVAL, max_messages=LOG_DISCORD_MAX_MESSAGES):
+        super().__init__(level)
+        self.setFormatter(logging.Formatter('%(message)s'))
+        self.get_channel = get_channel
+        self.channel_id = channel_id
+        self.route = f"channel:{channel_id}"
+        self.interval = interval
+        self.max_messages = max(1, max_messages)
+        self._lines = deque(maxlen=max(1, buffer_size))
+        self._dropped = 0
+        self._ready = asyncio.Event()
+        self._task = None
+        self._stats = {
+            'messages': 0,
+            'errors': 0,
+            'dropped': 0
+        }
+
+    def start(self):
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    def emit(self, record):
+        for line in self.format(record).split('\n'):
+            if len(self._lines) == self._lines.maxlen:
+                self._dropped += 1
+                self._stats['dropped'] += 1
+            self._lines.append(line[:DISCORD_MESSAGE_LIMIT].replace('```', "'''"))
+        self._ready.set()
+
+    def _next_chunk(self):
+        """Take as many queued lines as fit in one message."""
+        lines = []
+        size = 0
+        if self._dropped:
+            lines.append(f"… {self._dropped} log lines dropped")
+            size = len(lines[0]) + 1
+            self._dropped = 0
+        while self._lines and size + len(self._lines[0]) + 1 <= DISCORD_MESSAGE_LIMIT:
+            line = self._lines.popleft()
+            lines.append(line)
+            size += len(line) + 1
+        return '\n'.join(lines)
+
+    async def send_batch(self):
+        """Send up to max_messages of queued lines; False if the channel is unavailable."""
+        channel = self.get_channel(self.channel_id)
+        if channel is None:
+            return False
+        for _ in range(self.max_messages):
+            if not self._lines and not self._dropped:
+                break
+            chunk = self._next_chunk()
+            if not chunk.strip():
+                continue
+            try:
+                await rate_limiter.acquire(self.route, PRIORITY_LOGS)
+                await channel.send(f"```\n{chunk}\n```")
+                self._stats['messages'] += 1
+            except Exception as e:
+                self._stats['errors'] += 1
+                report_error(f"Error sending logs to Discord: {str(e)}")
+        return True
+
+    async def _run(self):
+        while True:
+            await self._ready.wait()
+            self._ready.clear()
+            await self.send_batch()
+            if self._lines:
+                self._ready.set()
+            await asyncio.sleep(self.interval)
+
+    async def drain(self, timeout=5):
+        """Stop the sender and send what is still queued, within timeout."""
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        async def drain():
+            while (self._lines or self._dropped) and await self.send_batch():
+                pass
+        try:
+            await asyncio.wait_for(drain(), timeout)
+        except asyncio.TimeoutError:
+            pass
+
+    def metrics(self):
+        return {
+            'queued': len(self._lines),
+            'messages': self._stats['messages'],
+            'errors': self._stats['errors'],
+            'dropped': self._stats['dropped']
+        }
+
+class LogPipeline(logging.Handler):
+    """Non-blocking path from log records to level-filtered sinks.
+
+    The pipeline is a handler on the root logger. emit() only appends to a
+    bounded ring buffer; a flusher task drains it every flush_interval, or
+    sooner once flush_size records are waiting, and hands each sink, itself
+    a logging handler, the records at or above its level. Once the buffer is
+    past sample_threshold full, DEBUG and INFO records are sampled one in
+    sample_rate, and when it is full they are dropped while warnings and
+    errors push out the oldest records instead. The next flush reports what
+    was lost. Until start() is called, records go to the sinks immediately.
+    """
+    def __init__(self, buffer_size=LOG_BUFFER_SIZE, flush_size=LOG_FLUSH_SIZE, flush_interval=LOG_FLUSH_INTERVAL,
+                 sample_threshold=LOG_SAMPLE_THRESHOLD, sample_rate=LOG_SAMPLE_RATE):
+        super().__init__(ERROR)
+        self._records = deque(maxlen=max(1, buffer_size))
+        self._flush_size = max(1, flush_size)
+        self._flush_interval = flush_interval
+        self._sample_at = int(self._records.maxlen * sample_threshold)
+        self._sample_rate = max(1, sample_rate)
+        self._sample_seen = 0
+        self._sinks = []
+        self._ready = None
+        self._task = None
+        self._thread = None
+        self._lost = {'sampled': 0, 'dropped': 0}
+        self._stats = {
+            'records': 0,
+            'sampled': 0,
+            'dropped': 0,
+            'flushes': 0
+        }
+
+    def add_sink(self, sink):
+        self._sinks.append(sink)
+        self.setLevel(min(s.level for s in self._sinks))
+        if self._task and hasattr(sink, 'start'):
+            sink.start()
+
+    async def remove_sink(self, sink):
+        """Flush pending records, then detach sink, send what it still holds and close it."""
+        self.flush()
+        if sink in self._sinks:
+            self._sinks.remove(sink)
+        self.setLevel(min((s.level for s in self._sinks), default=ERROR))
+        if hasattr(sink, 'drain'):
+            await sink.drain()
+        sink.close()
+
+    def emit(self, record):
+        """Buffer a record; called by logging with the handler lock held."""
+        if self._task is None:
+            self._write([record])
+            return
+        
+        level = record.levelno
+        if level < WARNING and len(self._records) >= self._sample_at:
+            self._sample_seen += 1
+            if self._sample_seen % self._sample_rate:
+                self._lost['sampled'] += 1
+                self._stats['sampled'] += 1
+                return
+        if len(self._records) == self._records.maxlen:
+            self._lost['dropped'] += 1
+            self._stats['dropped'] += 1
+            if level < WARNING:
+                return
+        # Render the message now, while its arguments still hold the values they were logged with
+        record.msg = record.getMessage()
+        record.args = None
+        self._records.append(record)
+        self._stats['records'] += 1
+        if len(self._records) >= self._flush_size and threading.get_ident() == self._thread:
+            self._ready.set()
+
+    def _write(self, records):
+        for sink in self._sinks:
+            for record in records:
+                if record.levelno >= sink.level:
+                    sink.handle(record)
+
+    def flush(self):
+        """Hand every buffered record to the sinks."""
+        with self.lock:
+            batch = list(self._records)
+            self._records.clear()
+            lost, self._lost = self._lost, {'sampled': 0, 'dropped': 0}
+        if lost['sampled'] or lost['dropped']:
+            batch.append(logging.makeLogRecord({
+                'name': f'{APP_LOGGER}.logs',
+                'levelno': WARNING,
+                'levelname': logging.getLevelName(WARNING),
+                'msg': f"⚠ Log buffer under pressure: {lost['sampled']} records sampled out, {lost['dropped']} dropped"
+            }))
+        if batch:
+            self._stats['flushes'] += 1
+            self._write(batch)
+
+    async def _run(self):
+        while True:
+            try:
+                await asyncio.wait_for(self._ready.wait(), self._flush_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._ready.clear()
+            self.flush()
+
+    def install(self):
+        """Attach the pipeline to the root logger: app records at every level, libraries from LOG_LIBRARY_LEVEL."""
+        root = logging.getLogger()
+        if self not in root.handlers:
+            root.addHandler(self)
+        root.setLevel(LOG_LIBRARY_LEVEL)
+        logging.getLogger(APP_LOGGER).setLevel(DEBUG)
+
+    def start(self):
+        """Start buffering; must be called from the running event loop."""
+        if self._task and not self._task.done():
+            return
+        self._ready = asyncio.Event()
+        self._thread = threading.get_ident()
+        self._task = asyncio.create_task(self._run())
+        for sink in self._sinks:
+            if hasattr(sink, 'start'):
+                sink.start()
+
+    async def stop(self):
+        """Stop the flusher and write out what is buffered; later records go straight to the sinks."""
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        self.flush()
+
+    def metrics(self):
+        """Return buffer occupancy and how many records were sampled or dropped."""
+        metrics = {
+            'buffered': len(self._records),
+            'capacity': self._records.maxlen,
+            'records': self._stats['records'],
+            'sampled': self._stats['sampled'],
+            'dropped': self._stats['dropped'],
+            'flushes': self._stats['flushes']
+        }
+        for sink in self._sinks:
+            if isinstance(sink, DiscordSink):
+                metrics['discord'] = sink.metrics()
+        return metrics
+
+def create_log_pipeline():
+    """Build the pipeline with the terminal sink and, if configured, the log file."""
+    pipeline = LogPipeline()
+    pipeline.add_sink(TerminalSink())
+    if LOG_FILE:
+        pipeline.add_sink(FileSink())
+    return pipeline
+
+# Global log pipeline shared by the whole process; the Discord sink is added once the bot is ready
+log_pipeline = create_log_pipeline()
@@ -0,0 +1,195 @@
+import os
+import time
+import asyncio
+import logging
+import aiosqlite
+from contextlib import asynccontextmanager
+from dotenv import load_dotenv
+
+# Load environment variables
+load_dotenv()
+
+logger = logging.getLogger('seekret.database')
+
+# SQLite performance profile
+DB_JOURNAL_MODE = os.getenv('DB_JOURNAL_MODE', 'WAL')
+DB_SYNCHRONOUS = os.getenv('DB_SYNCHRONOUS', 'NORMAL')
+DB_MMAP_SIZE = int(os.getenv('DB_MMAP_SIZE', str(256 * 1024 * 1024)))  # Bytes of the file to memory-map
+DB_CACHE_SIZE = int(os.getenv('DB_CACHE_SIZE', '-65536'))  # Negative values are KiB (64 MiB)
+DB_BUSY_TIMEOUT = int(os.getenv('DB_BUSY_TIMEOUT', '5000'))  # Milliseconds to wait on a locked database
+
+# Connection pool settings
+DB_READ_POOL_SIZE = int(os.getenv('DB_READ_POOL_SIZE', '4'))  # Reader connections allowed at once
+DB_ACQUIRE_TIMEOUT = float(os.getenv('DB_ACQUIRE_TIMEOUT', '30'))  # Seconds to wait for a free connection
+DB_HEALTH_CHECK_INTERVAL = float(os.getenv('DB_HEALTH_CHECK_INTERVAL', '60'))  # Idle seconds before a connection is re-checked
+DB_STATEMENT_CACHE_SIZE = int(os.getenv('DB_STATEMENT_CACHE_SIZE', '256'))  # Prepared statements cached per connection
+
+class PoolTimeoutError(Exception):
+    """Raised when no pooled connection frees up within the acquire timeout."""
+
+async def connect_database(path):
+    """Open a database connection with the performance profile applied."""
+    db = await aiosqlite.connect(path, cached_statements=DB_STATEMENT_CACHE_SIZE)
+    await db.execute(f'PRAGMA journal_mode={DB_JOURNAL_MODE}')
+    await db.execute(f'PRAGMA synchronous={DB_SYNCHRONOUS}')
+    await db.execute(f'PRAGMA mmap_size={DB_MMAP_SIZE}')
+    await db.execute(f'PRAGMA cache_size={DB_CACHE_SIZE}')
+    await db.execute(f'PRAGMA busy_timeout={DB_BUSY_TIMEOUT}')
+    await db.execute('PRAGMA temp_store=MEMORY')
+    return db
+
+# Database connection pool
+class DatabasePool:
+    """Bounded pool of tuned SQLite connections.
+
+    At most max_size connections are handed out at once and callers wait up to
+    acquire_timeout for one to free up. Idle connections are health-checked
+    before reuse, and released connections are reset so per-caller state such
+    as row_factory or an open transaction never leaks to the next borrower.
+    """
+    def __init__(self, path, max_size=DB_READ_POOL_SIZE, acquire_timeout=DB_ACQUIRE_TIMEOUT, name='pool'):
+        self.path = path
+        self.name = name
+        self._max_size = max(1, max_size)
+        self._acquire_timeout = acquire_timeout
+        self._idle = []  # (connection, last released at)
+        self._slots = asyncio.Semaphore(self._max_size)
+        self._in_use = 0
+        self._closed = False
+        self._stats = {
+            'acquired': 0,
+            'timeouts': 0,
+            'replaced': 0,
+            'wait_total': 0.0,
+            'wait_max': 0.0
+        }
+
+    async def get_connection(self):
+        """Check a connection out of the pool, waiting for a free slot."""
+        started = time.monotonic()
+        try:
+            await asyncio.wait_for(self._slots.acquire(), self._acquire_timeout)
+        except asyncio.TimeoutError:
+            self._stats['timeouts'] += 1
+            raise PoolTimeoutError(
+                f"Timed out after {self._acquire_timeout}s waiting for a {self.name} connection"
+            )
+
+        waited = time.monotonic() - started
+        self._stats['acquired'] += 1
+        self._stats['wait_total'] += waited
+        self._stats['wait_max'] = max(self._stats['wait_max'], waited)
+
+        try:
+            conn = await self._checkout()
+        except BaseException:
+            self._slots.release()
+            raise
+        self._in_use += 1
+        return conn
+
+    async def _checkout(self):
+        """Reuse a healthy idle connection or open a new one."""
+        while self._idle:
+            conn, released_at = self._idle.pop()
+            if time.monotonic() - released_at < DB_HEALTH_CHECK_INTERVAL:
+                return conn
+            try:
+                async with conn.execute('SELECT 1') as cursor:
+                    await cursor.fetchone()
+                return conn
+            except Exception as e:
+                logger.warning(f"⚠ Replacing unhealthy {self.name} connection: {str(e)}")
+                self._stats['replaced'] += 1
+                try:
+                    await conn.close()
+                except Exception:
+                    pass
+        return await connect_database(self.path)
+
+    async def release_connection(self, conn):
+        """Reset a connection and return it to the pool."""
+        self._in_use -= 1
+        try:
+            if self._closed:
+                await conn.close()
+                return
+            conn.row_factory = None
+            if conn.in_transaction:
+                await conn.rollback()
+            self._idle.append((conn, time.monotonic()))
+        except Exception as e:
+            logger.warning(f"⚠ Dropping {self.name} connection after failed reset: {str(e)}")
+            try:
+                await conn.close()
+            except Exception:
+                pass
+        finally:
+            self._slots.release()
+
+    @asynccontextmanager
+    async def connection(self):
+        """Borrow a connection for the duration of a with block."""
+        conn = await self.get_connection()
+        try:
+            yield conn
+        finally:
+            await self.release_connection(conn)
+
+    def metrics(self):
+        """Return pool size and acquire wait-time statistics."""
+        acquired = self._stats['acquired']
+        return {
+            'in_use': self._in_use,
+            'idle': len(self._idle),
+            'max_size': self._max_size,
+            'acquired': acquired,
+            'timeouts': self._stats['timeouts'],
+            'replaced': self._stats['replaced'],
+            'avg_wait_ms': (self._stats['wait_total'] / acquired * 1000) if acquired else 0.0,
+            'max_wait_ms': self._stats['wait_max'] * 1000
+        }
+
+    async def cleanup(self):
+        self._closed = True
+        while self._idle:
+            conn, _ = self._idle.pop()
+            await conn.close()
+
+class Database:
+    """Data-access layer shared by the whole process.
+
+    Every write goes through a single-connection writer pool, so transactions
+    never interleave; reads borrow from a bounded reader pool, which WAL lets
+    run alongside the writer.
+    """
+    def __init__(self, path):
+        self.path = path
+        self.write_pool = DatabasePool(path, max_size=1, name='writer')
+        self.read_pool = DatabasePool(path, max_size=DB_READ_POOL_SIZE, name='reader')
+
+    @asynccontextmanager
+    async def writer(self):
+        """Hold the writer connection for one unit of work.
+
+        Anything left uncommitted is committed when the block exits normally
+        and rolled back if it raises.
+        """
+        async with self.write_pool.connection() as db:
+            yield db
+            if db.in_transaction:
+                await db.commit()
+
+    def reader(self):
+        """Borrow a reader connection from the pool."""
+        return self.read_pool.connection()
+
+    def metrics(self):
+        return {
+            'writer': self.write_pool.metrics(),
+            'reader': self.read_pool.metrics()
+        }
+
+    async def close(self):
+        await self.write_pool.cleanup()
+        await self.read_pool.cleanup()
@@ -0,0 +1,160 @@
+import os
+import time
+import asyncio
+import itertools
+from dotenv import load_dotenv
+
+# Load environment variables
+load_dotenv()
+
+# Discord rate-limit settings
+DISCORD_GLOBAL_RATE = int(os.getenv('DISCORD_GLOBAL_RATE', '50'))  # Requests per second across every route
+DISCORD_DEFAULT_BUCKET_LIMIT = int(os.getenv('DISCORD_DEFAULT_BUCKET_LIMIT', '5'))  # Assumed per-route limit until headers say otherwise
+DISCORD_DEFAULT_BUCKET_WINDOW = float(os.getenv('DISCORD_DEFAULT_BUCKET_WINDOW', '5'))  # Seconds the assumed limit applies to
+
+# Request priorities, lowest first: job posts go before user messages, which go before log mirroring
+PRIORITY_JOBS = 0
+PRIORITY_USER = 1
+PRIORITY_LOGS = 2
+
+class RateLimitBucket:
+    """Request budget for one Discord rate-limit bucket."""
+    def __init__(self, limit=DISCORD_DEFAULT_BUCKET_LIMIT, window=DISCORD_DEFAULT_BUCKET_WINDOW):
+        self.limit = limit
+        self.window = window
+        self.remaining = limit
+        self.reset_at = 0.0
+
+    def ready_at(self, now):
+        """Return when the next request may be sent."""
+        if self.remaining > 0 or now >= self.reset_at:
+            return now
+        return self.reset_at
+
+    def consume(self, now):
+        if now >= self.reset_at:
+            self.remaining = self.limit
+            self.reset_at = now + self.window
+        self.remaining -= 1
+
+class RateLimiter:
+    """Paces Discord requests before they are sent instead of after a 429.
+
+    Requests name a route (a channel, a DM or a webhook) and a priority.
+    Routes start on a conservative default bucket, and paths that see
+    Discord's X-RateLimit-* headers feed them back through update(), which
+    also merges routes Discord reports as sharing a bucket. A single
+    dispatcher grants waiting requests in priority order whenever both their
+    bucket and the global limit allow it.
+    """
+    def __init__(self, global_rate=DISCORD_GLOBAL_RATE):
+        self._global = RateLimitBucket(limit=global_rate, window=1.0)
+        self._buckets = {}  # route -> RateLimitBucket
+        self._bucket_ids = {}  # Discord bucket hash -> RateLimitBucket
+        self._waiting = []  # [priority, sequence, route, future]
+        self._sequence = itertools.count()
+        self._changed = asyncio.Event()
+        self._dispatcher = None
+        self._stats = {
+            'requests': 0,
+            'rate_limited': 0,
+            'wait_total': 0.0,
+            'wait_max': 0.0
+        }
+
+    def _bucket(self, route):
+        if route not in self._buckets:
+            self._buckets[route] = RateLimitBucket()
+        return self._buckets[route]
+
+    async def acquire(self, route, priority=PRIORITY_JOBS):
+        """Wait until a request on route may be sent."""
+        started = time.monotonic()
+        future = asyncio.get_running_loop().create_future()
+        self._waiting.append([priority, next(self._sequence), route, future])
+        self._waiting.sort(key=lambda entry: (entry[0], entry[1]))
+        self._changed.set()
+        if self._dispatcher is None or self._dispatcher.done():
+            self._dispatcher = asyncio.create_task(self._dispatch())
+        await future
+
+        waited = time.monotonic() - started
+        self._stats['requests'] += 1
+        self._stats['wait_total'] += waited
+        self._stats['wait_max'] = max(self._stats['wait_max'], waited)
+
+    async def _dispatch(self):
+        """Grant waiting requests in priority order as their buckets allow."""
+        while self._waiting:
+            self._changed.clear()
+            now = time.monotonic()
+            self._waiting = [entry for entry in self._waiting if not entry[3].done()]
+
+            next_ready = self._global.ready_at(now)
+            if next_ready <= now:
+                for entry in self._waiting:
+                    bucket = self._bucket(entry[2])
+                    ready_at = bucket.ready_at(now)
+                    if ready_at <= now:
+                        bucket.consume(now)
+                        self._global.consume(now)
+                        self._waiting.remove(entry)
+                        entry[3].set_result(None)
+                        next_ready = now
+                        break
+                    next_ready = ready_at if next_ready <= now else min(next_ready, ready_at)
+
+            if next_ready > now and self._waiting:
+                # Sleep until a bucket resets or a new request arrives
+                try:
+                    await asyncio.wait_for(self._changed.wait(), next_ready - now)
+                except asyncio.TimeoutError:
+                    pass
+
+    def update(self, route, headers):
+        """Record the X-RateLimit-* headers from a response on route."""
+        now = time.monotonic()
+        bucket_id = headers.get('X-RateLimit-Bucket')
+        bucket = self._bucket(route)
+        if bucket_id:
+            shared = self._bucket_ids.setdefault(bucket_id, bucket)
+            self._buckets[route] = bucket = shared
+        try:
+            if 'X-RateLimit-Limit' in headers:
+                bucket.limit = int(headers['X-RateLimit-Limit'])
+            if 'X-RateLimit-Remaining' in headers:
+                bucket.remaining = int(headers['X-RateLimit-Remaining'])
+            if 'X-RateLimit-Reset-After' in headers:
+                bucket.window = float(headers['X-RateLimit-Reset-After'])
+                bucket.reset_at = now + bucket.window
+        except ValueError:
+            pass
+        self._changed.set()
+
+    def rate_limited(self, route, headers):
+        """Back off after a 429 on route, globally if Discord says so."""
+        now = time.monotonic()
+        self._stats['rate_limited'] += 1
+        retry_after = float(headers.get('Retry-After', DISCORD_DEFAULT_BUCKET_WINDOW))
+        if headers.get('X-RateLimit-Global') or headers.get('X-RateLimit-Scope') == 'global':
+            bucket = self._global
+        else:
+            self.update(route, headers)
+            bucket = self._bucket(route)
+        bucket.remaining = 0
+        bucket.reset_at = now + retry_after
+        self._changed.set()
+
+    def metrics(self):
+        """Return request, wait-time and 429 counts."""
+        requests = self._stats['requests']
+        return {
+            'requests': requests,
+            'rate_limited': self._stats['rate_limited'],
+            'waiting': len(self._waiting),
+            'avg_wait_ms': (self._stats['wait_total'] / requests * 1000) if requests else 0.0,
+            'max_wait_ms': self._stats['wait_max'] * 1000
+        }
+
+# Global rate limiter shared by every Discord request in the process
+rate_limiter = RateLimiter()
@@ -1,16 +1,29 @@
 import os
+import sys
+import argparse
 import json
+import logging
+import re
 import asyncio
 import aiosqlite
-import requests
+import aiohttp
 import signal
+import time
+import hashlib
+from functools import lru_cache
 from datetime import datetime, timedelta
-from discord_webhook import DiscordWebhook, DiscordEmbed
+from discord_webhook import DiscordEmbed
 from dotenv import load_dotenv
+from database import Database
+from ratelimit import rate_limiter, PRIORITY_JOBS
 
 # Load environment variables
 load_dotenv()
 
+# Log records go to the terminal, or through bot.py's log pipeline when the bot imports this module
+logger = logging.getLogger('seekret.monitor')
+LOG_LEVEL = os.getenv('LOG_LEVEL', 'INFO').upper()  # Lowest level written to the terminal when run on its own
+
 # ASCII Logo
 LOGO = '''
                    (                                
@@ -44,10 +57,10 @@ def handle_shutdown(signum, frame):
     """Handle shutdown signals gracefully."""
     global shutdown_flag
     if not shutdown_flag:
-        print("\n🛑 Shutdown signal received. Cleaning up...")
+        logger.info("🛑 Shutdown signal received. Cleaning up...")
         shutdown_flag = True
     else:
-        print("\n⚠ Force quitting... (Press Ctrl+C again to force exit)")
+        logger.warning("⚠ Force quitting... (Press Ctrl+C again to force exit)")
         os._exit(1)
 
 # Register signal handlers
@@ -59,6 +72,182 @@ SALARY_MIN = float(os.getenv('SALARY_MIN', '0'))  # Minimum salary to include
 EXCLUDED_COMPANIES = set(filter(None, os.getenv('EXCLUDED_COMPANIES', '').split(',')))
 REQUIRED_KEYWORDS = set(filter(None, os.getenv('REQUIRED_KEYWORDS', '').split(',')))
 EXCLUDED_KEYWORDS = set(filter(None, os.getenv('EXCLUDED_KEYWORDS', '').split(',')))
+KEYWORD_WORD_BOUNDARY = os.getenv('KEYWORD_WORD_BOUNDARY', 'false').lower() in ('1', 'true', 'yes')  # Match whole words only
+
+# Salary normalization
+SALARY_SUPER_RATE = float(os.getenv('SALARY_SUPER_RATE', '0.12'))  # Super share removed from "including super" packages
+
+# Multipliers that annualize a salary quoted per period
+SALARY_PERIODS = {
+    'hour': 38 * 52,
+    'day': 5 * 52,
+    'week': 52,
+    'month': 12,
+    'year': 1
+}
+SALARY_PERIOD_PATTERNS = (
+    ('hour', re.compile(r'per\s*hour|an\s*hour|hourly|p/?h\b|/\s*h(?:ou)?r\b|\bph\b')),
+    ('day', re.compile(r'per\s*day|a\s*day|daily|p/?d\b|/\s*day\b|\bpd\b')),
+    ('week', re.compile(r'per\s*week|a\s*week|weekly|p/?w\b|/\s*w(?:ee)?k\b|\bpw\b')),
+    ('month', re.compile(r'per\s*month|a\s*month|monthly|/\s*month\b|\bpcm\b')),
+    ('year', re.compile(r'per\s*(?:annum|year)|a\s*year|annual|yearly|p\.?\s*a\b|/\s*(?:year|yr)\b'))
+)
+SALARY_AMOUNT_PATTERN = re.compile(r'(\$)?\s*(\d{1,3}(?:,\d{3})+|\d+)(?:\.(\d+))?\s*(k\b)?', re.IGNORECASE)
+SALARY_RANGE_SEPARATOR_PATTERN = re.compile(r'\s*(?:-|–|—|to)\s*')
+SALARY_SUPER_PATTERN = re.compile(r'super(?:annuation)?\b')
+SALARY_INCLUDES_SUPER_PATTERN = re.compile(r'\b(?:inc(?:l(?:uding|usive(?:\s+of)?)?)?\.?|with|package)\s*(?:\+\s*)?super')
+
+class SalaryRange:
+    """Annual base salary range parsed from a SEEK salary label."""
+    __slots__ = ('min', 'max', 'period')
+
+    def __init__(self, min_salary, max_salary, period):
+        self.min = min_salary
+        self.max = max_salary
+        self.period = period
+
+    def __repr__(self):
+        return f"SalaryRange({self.min!r}, {self.max!r}, {self.period!r})"
+
+@lru_cache(maxsize=4096)
+def parse_salary(label):
+    """Parse a salary label such as "$80k - $95k + super" or "$45 per hour".
+    
+    Amounts are annualized and any super included in a package is taken out,
+    so every range is comparable with SALARY_MIN. Returns None when the label
+    has no usable amount. Labels repeat across listings, so parses are cached.
+    """
+    if not label:
+        return None
+    text = label.lower()
+    
+    amounts = []
+    for match in SALARY_AMOUNT_PATTERN.finditer(text):
+        dollar, whole, fraction, thousands = match.groups()
+        value = float(whole.replace(',', '') + (f".{fraction}" if fraction else ''))
+        amounts.append((value, bool(dollar), bool(thousands), match.start(), match.end()))
+    
+    # Bare numbers ("38 hours", "12 month contract") only count when no amount is marked with $,
+    # unless they carry a k suffix or close a range opened by one ("$80 - 95k")
+    if any(amount[1] for amount in amounts):
+        def in_range_with_dollar(index):
+            for other in (index - 1, index + 1):
+                if 0 <= other < len(amounts) and amounts[other][1]:
+                    first, second = sorted((amounts[index], amounts[other]), key=lambda amount: amount[3])
+                    if SALARY_RANGE_SEPARATOR_PATTERN.fullmatch(text[first[4]:second[3]]):
+                        return True
+            return False
+        amounts = [
+            amount for index, amount in enumerate(amounts)
+            if amount[1] or amount[2] or in_range_with_dollar(index)
+        ]
+    amounts = [amount[:3] for amount in amounts if amount[0] > 0][:2]
+    if not amounts:
+        return None
+    
+    # "$80 - 95k" shares the k suffix across the range
+    shared_thousands = any(thousands for _, _, thousands in amounts)
+    values = [
+        value * 1000 if thousands or (shared_thousands and value < 1000) else value
+        for value, _, thousands in amounts
+    ]
+    
+    period = next((name for name, pattern in SALARY_PERIOD_PATTERNS if pattern.search(text)), None)
+    if period is None:
+        # Unlabelled amounts are judged by size: hourly and daily rates are far below annual salaries
+        smallest = min(values)
+        period = 'hour' if smallest < 250 else 'day' if smallest < 3000 else 'year'
+    values = [value * SALARY_PERIODS[period] for value in values]
+    
+    if SALARY_SUPER_PATTERN.search(text) and SALARY_INCLUDES_SUPER_PATTERN.search(text):
+        values = [value / (1 + SALARY_SUPER_RATE) for value in values]
+    
+    return SalaryRange(round(min(values)), round(max(values)), period)
+
+# Annual salary bands used by get_job_stats() and delivery routing, as (label, lower, upper)
+SALARY_BANDS = (
+    ('Under $60k', 0, 60000),
+    ('$60k - $80k', 60000, 80000),
+    ('$80k - $100k', 80000, 100000),
+    ('$100k - $130k', 100000, 130000),
+    ('$130k+', 130000, float('inf'))
+)
+
+def salary_band(amount):
+    """Return the label of the salary band an annual amount falls in."""
+    for label, lower, upper in SALARY_BANDS:
+        if lower <= amount < upper:
+            return label
+    return None
+
+class JobFilter:
+    """Job filters compiled once from the configured company and keyword lists.
+    
+    Required and excluded keywords share one regex of zero-width lookaheads,
+    so each job's text is scanned in a single pass and overlapping keywords
+    are still all seen.
+    """
+    def __init__(self, salary_min=0, excluded_companies=(), required_keywords=(),
+                 excluded_keywords=(), word_boundary=False):
+        self.salary_min = salary_min
+        self.excluded_companies = {company.strip().lower() for company in excluded_companies if company.strip()}
+        self.has_required = any(keyword.strip() for keyword in required_keywords)
+        
+        groups = []
+        for name, keywords in (('excluded', excluded_keywords), ('required', required_keywords)):
+            alternation = self._alternation(keywords, word_boundary)
+            if alternation:
+                groups.append(f"(?P<{name}>{alternation})")
+        self.keyword_pattern = re.compile(f"(?=(?:{'|'.join(groups)}))") if groups else None
+
+    @staticmethod
+    def _alternation(keywords, word_boundary):
+        # Longest first so the reported match is the most specific keyword
+        keywords = sorted({keyword.strip().lower() for keyword in keywords if keyword.strip()}, key=len, reverse=True)
+        if not keywords:
+            return None
+        alternation = '|'.join(re.escape(keyword) for keyword in keywords)
+        if word_boundary:
+            return rf"(?<!\w)(?:{alternation})(?!\w)"
+        return f"(?:{alternation})"
+
+    def matches(self, job):
+        """Return True if the job passes every filter."""
+        # Get company name from advertiser description if available
+        company_name = job.get('advertiser', {}).get('description') or job.get('companyName', '')
+        if company_name.strip().lower() in self.excluded_companies:
+            return False
+        
+        # Check salary if available, keeping jobs whose range reaches the minimum
+        if self.salary_min:
+            salary = parse_salary(job.get('salaryLabel'))
+            if salary and salary.max < self.salary_min:
+                return False
+        
+        if self.keyword_pattern is None:
+            return True
+        
+        # Combine title and description for keyword checking
+        text_to_check = f"{job['title']} {job.get('teaser', '')}".lower()
+        found_required = False
+        for match in self.keyword_pattern.finditer(text_to_check):
+            if match.lastgroup == 'excluded':
+                return False
+            found_required = True
+        return found_required or not self.has_required
+
+    def filter(self, jobs):
+        """Return the jobs from a fetched page that pass every filter, in order."""
+        return [job for job in jobs if self.matches(job)]
+
+# Filters compiled once at startup
+job_filter = JobFilter(
+    salary_min=SALARY_MIN,
+    excluded_companies=EXCLUDED_COMPANIES,
+    required_keywords=REQUIRED_KEYWORDS,
+    excluded_keywords=EXCLUDED_KEYWORDS,
+    word_boundary=KEYWORD_WORD_BOUNDARY
+)
 
 # SEEK API configuration
 SEEK_HEADERS = {
@@ -78,9 +267,332 @@ SEEK_HEADERS = {
 
 SEEK_URL = "https://www.seek.com.au/api/jobsearch/v5/search"
 
+# Keep batched IN (...) lookups under SQLite's bound parameter limit
+SQLITE_MAX_PARAMS = 500
+
+# Search profiles: every profile is a set of SEEK query params run each cycle
+SEARCH_PROFILES_FILE = os.getenv('SEARCH_PROFILES_FILE', os.path.join(os.path.dirname(os.path.abspath(__file__)), 'search_profiles.json'))
+SEARCH_CONCURRENCY = int(os.getenv('SEARCH_CONCURRENCY', '4'))  # Searches allowed in flight at once
+DEFAULT_LOCATION = os.getenv('LOCATION', 'Hobart TAS 7000')
+
+def load_search_profiles():
+    """Load the search profile registry from SEARCH_PROFILES or SEARCH_PROFILES_FILE.
+    
+    Each profile is a JSON object with a unique "name" plus any SEEK search
+    params (e.g. "where", "keywords", "classification"). Falls back to a single
+    search of LOCATION when nothing is configured.
+    """
+    default_profiles = [{"name": "default", "where": DEFAULT_LOCATION}]
+    try:
+        raw = os.getenv('SEARCH_PROFILES')
+        if not raw and os.path.exists(SEARCH_PROFILES_FILE):
+            with open(SEARCH_PROFILES_FILE, 'r', encoding='utf-8') as f:
+                raw = f.read()
+        if not raw:
+            return default_profiles
+        
+        profiles = []
+        names = set()
+        for index, profile in enumerate(json.loads(raw)):
+            if not isinstance(profile, dict):
+                logger.warning(f"⚠ Skipping search profile #{index + 1}: expected an object")
+                continue
+            profile = {key: str(value) for key, value in profile.items()}
+            profile.setdefault('name', f"search-{index + 1}")
+            if profile['name'] in names:
+                logger.warning(f"⚠ Skipping duplicate search profile: {profile['name']}")
+                continue
+            names.add(profile['name'])
+            profiles.append(profile)
+        return profiles or default_profiles
+    except Exception as e:
+        logger.warning(f"⚠ Error loading search profiles, using default search: {str(e)}")
+        return default_profiles
+
+SEARCH_PROFILES = load_search_profiles()
+
+# Pagination settings for each poll
+SEEK_PAGE_SIZE = int(os.getenv('SEEK_PAGE_SIZE', '22'))  # Listings requested per page
+SEEK_MAX_PAGES = int(os.getenv('SEEK_MAX_PAGES', '10'))  # Safety cap on pages walked per poll
+
+# SEEK HTTP client configuration
+SEEK_TIMEOUT = float(os.getenv('SEEK_TIMEOUT', '20'))  # Total seconds allowed for one SEEK request
+SEEK_CONNECT_TIMEOUT = float(os.getenv('SEEK_CONNECT_TIMEOUT', '5'))  # Seconds allowed to open a connection
+SEEK_POOL_SIZE = int(os.getenv('SEEK_POOL_SIZE', '10'))  # Maximum open connections to SEEK
+SEEK_KEEPALIVE = float(os.getenv('SEEK_KEEPALIVE', '90'))  # Seconds to keep idle connections open
+
+class SeekClient:
+    """Async HTTP client for the SEEK API.
+
+    A single aiohttp session is shared by every caller so polls reuse pooled
+    keep-alive connections instead of blocking the event loop on a fresh
+    handshake each cycle.
+    """
+    def __init__(self):
+        self._session = None
+        self._session_lock = asyncio.Lock()
+
+    async def get_session(self):
+        async with self._session_lock:
+            if self._session is None or self._session.closed:
+                connector = aiohttp.TCPConnector(
+                    limit=SEEK_POOL_SIZE,
+                    limit_per_host=SEEK_POOL_SIZE,
+                    keepalive_timeout=SEEK_KEEPALIVE,
+                    ttl_dns_cache=300
+                )
+                timeout = aiohttp.ClientTimeout(total=SEEK_TIMEOUT, connect=SEEK_CONNECT_TIMEOUT)
+                self._session = aiohttp.ClientSession(
+                    headers=SEEK_HEADERS,
+                    connector=connector,
+                    timeout=timeout
+                )
+            return self._session
+
+    async def search(self, params):
+        """Run a job search and return the decoded JSON payload."""
+        session = await self.get_session()
+        async with session.get(SEEK_URL, params=params) as response:
+            response.raise_for_status()
+            return await response.json(content_type=None)
+
+    async def close(self):
+        async with self._session_lock:
+            if self._session and not self._session.closed:
+                await self._session.close()
+            self._session = None
+
+# Global SEEK client shared by the CLI loop and the bot
+seek_client = SeekClient()
+
+# Global database shared by the CLI loop and the bot
+database = Database(DATABASE_PATH)
+
+def to_epoch(value):
+    """Convert an ISO 8601 timestamp to epoch seconds, or None if it can't be parsed."""
+    if not value:
+        return None
+    try:
+        return int(datetime.fromisoformat(str(value).replace('Z', '+00:00')).timestamp())
+    except ValueError:
+        return None
+
+# Indexes backing the stats queries (GROUP BY, the rolling 24h window and salary ranges)
+JOB_INDEXES = (
+    'CREATE INDEX IF NOT EXISTS idx_jobs_posted_ts ON jobs (posted_ts)',
+    'CREATE INDEX IF NOT EXISTS idx_jobs_classification ON jobs (classification)',
+    'CREATE INDEX IF NOT EXISTS idx_jobs_company ON jobs (company)',
+    'CREATE INDEX IF NOT EXISTS idx_jobs_work_type ON jobs (work_type)',
+    'CREATE INDEX IF NOT EXISTS idx_jobs_salary_min ON jobs (salary_min)',
+    'CREATE INDEX IF NOT EXISTS idx_jobs_salary_max ON jobs (salary_max)'
+)
+
+async def create_job_indexes(db):
+    """Backfill epoch timestamps and create the jobs table indexes."""
+    # Rows written before the epoch columns existed only have ISO strings.
+    # posted_date comes from SEEK in UTC, processed_date was stored as local time.
+    await db.execute('''
+        UPDATE jobs SET posted_ts = CAST(strftime('%s', posted_date) AS INTEGER)
+        WHERE posted_ts IS NULL AND posted_date IS NOT NULL
+    ''')
+    await db.execute('''
+        UPDATE jobs SET processed_ts = CAST(strftime('%s', processed_date, 'utc') AS INTEGER)
+        WHERE processed_ts IS NULL AND processed_date IS NOT NULL
+    ''')
+    await backfill_salaries(db)
+    for statement in JOB_INDEXES:
+        await db.execute(statement)
+    await db.commit()
+
+async def backfill_salaries(db):
+    """Parse the salary label of rows stored before the numeric salary columns existed."""
+    async with db.execute(
+        "SELECT id, salary FROM jobs WHERE salary_period IS NULL AND salary IS NOT NULL AND salary != ''"
+    ) as cursor:
+        rows = await cursor.fetchall()
+    if not rows:
+        return
+    await db.executemany(
+        'UPDATE jobs SET salary_min = ?, salary_max = ?, salary_period = ? WHERE id = ?',
+        [(*salary_columns(salary), job_id) for job_id, salary in rows]
+    )
+    logger.info(f"✓ Parsed salaries for {len(rows)} existing jobs")
+
+# Dimensions kept as materialized counters in job_stats
+STATS_DIMENSIONS = ('classification', 'company', 'work_type')
+STATS_HOURLY_WINDOW = 24  # Hourly buckets, the current one included, kept for the jobs-in-last-24h count
+
+def first_stats_bucket():
+    """Return the oldest hourly bucket still inside the window."""
+    return int(time.time()) // 3600 - STATS_HOURLY_WINDOW + 1
+
+def _salary_band_sql(column):
+    """Build a CASE expression mapping an annual salary column to its SALARY_BANDS label."""
+    cases = ' '.join(
+        f"WHEN {column} < {upper} THEN '{label}'"
+        for label, _, upper in SALARY_BANDS[:-1]
+    )
+    return f"CASE {cases} ELSE '{SALARY_BANDS[-1][0]}' END"
+
+def _stats_trigger_sql(row, delta):
+    """Build the counter upserts a trigger runs for one jobs row (NEW or OLD)."""
+    statements = [
+        f"INSERT INTO job_stats (dimension, value, count) VALUES ('total', '', {delta}) "
+        f"ON CONFLICT(dimension, value) DO UPDATE SET count = count + {delta};"
+    ]
+    for dimension in STATS_DIMENSIONS:
+        statements.append(
+            f"INSERT INTO job_stats (dimension, value, count) "
+            f"VALUES ('{dimension}', COALESCE({row}.{dimension}, 'Unspecified'), {delta}) "
+            f"ON CONFLICT(dimension, value) DO UPDATE SET count = count + {delta};"
+        )
+    statements.append(
+        f"INSERT INTO job_stats (dimension, value, count) "
+        f"SELECT 'salary_band', {_salary_band_sql(f'{row}.salary_min')}, {delta} "
+        f"WHERE {row}.salary_min IS NOT NULL "
+        f"ON CONFLICT(dimension, value) DO UPDATE SET count = count + {delta};"
+    )
+    # Only listings inside the window are bucketed; older buckets are pruned by prune_job_stats()
+    statements.append(
+        f"INSERT INTO job_stats_hourly (bucket, count) SELECT {row}.posted_ts / 3600, {delta} "
+        f"WHERE {row}.posted_ts / 3600 > CAST(strftime('%s', 'now') AS INTEGER) / 3600 - {STATS_HOURLY_WINDOW} "
+        f"ON CONFLICT(bucket) DO UPDATE SET count = count + {delta};"
+    )
+    return '\n'.join(statements)
+
+async def prune_job_stats(db):
+    """Drop hourly buckets that have left the window. Runs in the caller's transaction."""
+    await db.execute('DELETE FROM job_stats_hourly WHERE bucket < ?', (first_stats_bucket(),))
+
+async def setup_job_stats(db):
+    """Create the materialized job counters and the triggers that maintain them.
+    
+    Triggers keep the counters in the same transaction as the jobs write,
+    delete included, so get_job_stats() never has to rescan the jobs table.
+    """
+    await db.execute('''
+        CREATE TABLE IF NOT EXISTS job_stats (
+            dimension TEXT NOT NULL,
+            value TEXT NOT NULL,
+            count INTEGER NOT NULL DEFAULT 0,
+            PRIMARY KEY (dimension, value)
+        )
+    ''')
+    await db.execute('CREATE INDEX IF NOT EXISTS idx_job_stats_count ON job_stats (dimension, count)')
+    await db.execute('''
+        CREATE TABLE IF NOT EXISTS job_stats_hourly (
+            bucket INTEGER PRIMARY KEY,
+            count INTEGER NOT NULL DEFAULT 0
+        )
+    ''')
+    await db.execute(f'''
+        CREATE TRIGGER IF NOT EXISTS trg_jobs_stats_insert AFTER INSERT ON jobs
+        BEGIN
+            {_stats_trigger_sql('NEW', 1)}
+        END
+    ''')
+    await db.execute(f'''
+        CREATE TRIGGER IF NOT EXISTS trg_jobs_stats_update
+        AFTER UPDATE OF {', '.join(STATS_DIMENSIONS)}, posted_ts, salary_min ON jobs
+        BEGIN
+            {_stats_trigger_sql('OLD', -1)}
+            {_stats_trigger_sql('NEW', 1)}
+        END
+    ''')
+    await db.execute(f'''
+        CREATE TRIGGER IF NOT EXISTS trg_jobs_stats_delete AFTER DELETE ON jobs
+        BEGIN
+            {_stats_trigger_sql('OLD', -1)}
+        END
+    ''')
+    
+    # Seed the counters from existing rows the first time they are created
+    async with db.execute("SELECT 1 FROM job_stats WHERE dimension = 'total'") as cursor:
+        seeded = await cursor.fetchone() is not None
+    if not seeded:
+        await db.execute("INSERT INTO job_stats (dimension, value, count) SELECT 'total', '', COUNT(*) FROM jobs")
+        for dimension in STATS_DIMENSIONS:
+            await db.execute(f'''
+                INSERT INTO job_stats (dimension, value, count)
+                SELECT '{dimension}', COALESCE({dimension}, 'Unspecified'), COUNT(*)
+                FROM jobs GROUP BY COALESCE({dimension}, 'Unspecified')
+            ''')
+        await db.execute(f'''
+            INSERT INTO job_stats (dimension, value, count)
+            SELECT 'salary_band', {_salary_band_sql('salary_min')} AS band, COUNT(*)
+            FROM jobs WHERE salary_min IS NOT NULL GROUP BY band
+        ''')
+        await db.execute('''
+            INSERT INTO job_stats_hourly (bucket, count)
+            SELECT posted_ts / 3600, COUNT(*) FROM jobs
+            WHERE posted_ts >= ? GROUP BY posted_ts / 3600
+        ''', (first_stats_bucket() * 3600,))
+        logger.info("✓ Job statistics counters seeded")
+    await prune_job_stats(db)
+    await db.commit()
+
+# Job text indexed for full-text search, in jobs_fts column order
+SEARCH_COLUMNS = ('title', 'company', 'description', 'bullet_points', 'tags', 'location', 'salary', 'work_type', 'work_arrangement')
+SEARCH_WEIGHTS = (10.0, 4.0, 2.0, 1.0, 2.0, 2.0, 1.0, 1.0, 1.0)  # bm25 weight per column: title matches rank highest
+SEARCH_PAGE_SIZE = int(os.getenv('SEARCH_PAGE_SIZE', '5'))  # Results shown per page
+SEARCH_TERM_PATTERN = re.compile(r'\w+')
+
+# Cleared when SQLite was built without FTS5
+search_available = True
+
+async def setup_job_search(db):
+    """Create the jobs_fts full-text index and the triggers that keep it in sync with jobs.
+    
+    jobs_fts is an external-content FTS5 table over the jobs rows, so the
+    text is not stored twice; the triggers update it in the same transaction
+    as every jobs write. The index is built from existing rows the first time
+    it is created.
+    """
+    global search_available
+    columns = ', '.join(SEARCH_COLUMNS)
+    new_values = ', '.join(f"NEW.{column}" for column in SEARCH_COLUMNS)
+    old_values = ', '.join(f"OLD.{column}" for column in SEARCH_COLUMNS)
+    
+    async with db.execute("SELECT 1 FROM sqlite_master WHERE name = 'jobs_fts'") as cursor:
+        exists = await cursor.fetchone() is not None
+    try:
+        await db.execute(f'''
+            CREATE VIRTUAL TABLE IF NOT EXISTS jobs_fts USING fts5(
+                {columns}, content='jobs', content_rowid='rowid', tokenize='porter unicode61'
+            )
+        ''')
+    except aiosqlite.OperationalError as e:
+        search_available = False
+        logger.warning(f"⚠ Full-text search unavailable: {str(e)}")
+        return
+    
+    await db.execute(f'''
+        CREATE TRIGGER IF NOT EXISTS trg_jobs_fts_insert AFTER INSERT ON jobs
+        BEGIN
+            INSERT INTO jobs_fts (rowid, {columns}) VALUES (NEW.rowid, {new_values});
+        END
+    ''')
+    await db.execute(f'''
+        CREATE TRIGGER IF NOT EXISTS trg_jobs_fts_delete AFTER DELETE ON jobs
+        BEGIN
+            INSERT INTO jobs_fts (jobs_fts, rowid, {columns}) VALUES ('delete', OLD.rowid, {old_values});
+        END
+    ''')
+    await db.execute(f'''
+        CREATE TRIGGER IF NOT EXISTS trg_jobs_fts_update AFTER UPDATE OF {columns} ON jobs
+        BEGIN
+            INSERT INTO jobs_fts (jobs_fts, rowid, {columns}) VALUES ('delete', OLD.rowid, {old_values});
+            INSERT INTO jobs_fts (rowid, {columns}) VALUES (NEW.rowid, {new_values});
+        END
+    ''')
+    if not exists:
+        await db.execute("INSERT INTO jobs_fts (jobs_fts) VALUES ('rebuild')")
+        logger.info("✓ Full-text search index built")
+    await db.commit()
+
 async def setup_database():
     """Initialize the SQLite database with migrations."""
-    async with aiosqlite.connect(DATABASE_PATH) as db:
+    async with database.writer() as db:
         # Get current columns
         try:
             async with db.execute("PRAGMA table_info(jobs)") as cursor:
@@ -114,27 +626,323 @@ async def setup_database():
             'bullet_points': 'TEXT',
             'display_type': 'TEXT',
             'is_featured': 'INTEGER',
-            'tags': 'TEXT'
+            'tags': 'TEXT',
+            'posted_ts': 'INTEGER',
+            'processed_ts': 'INTEGER',
+            'salary_min': 'REAL',
+            'salary_max': 'REAL',
+            'salary_period': 'TEXT'
         }
         
         for column, type_ in new_columns.items():
             if column not in current_columns:
                 try:
                     await db.execute(f'ALTER TABLE jobs ADD COLUMN {column} {type_}')
-                    print(f"✓ Added new column: {column}")
+                    logger.info(f"✓ Added new column: {column}")
                 except Exception as e:
-                    print(f"⚠ Error adding column {column}: {str(e)}")
+                    logger.warning(f"⚠ Error adding column {column}: {str(e)}")
+        
+        # Track the newest listing seen per search so polls can stop paging early
+        await db.execute('''
+            CREATE TABLE IF NOT EXISTS crawl_state (
+                search_key TEXT PRIMARY KEY,
+                last_listing_date TEXT,
+                last_job_id TEXT,
+                updated_date TEXT
+            )
+        ''')
         
         await db.commit()
-    print("✓ Database initialized and migrated")
+        await create_job_indexes(db)
+        await setup_job_stats(db)
+        await setup_job_search(db)
+        
+        # Load known job IDs so dedupe checks stay in memory
+        await seen_jobs.load(db)
+        await setup_duplicate_index(db)
+        await setup_outbox(db)
+    logger.info(f"✓ Database initialized and migrated ({len(seen_jobs)} known jobs, {len(duplicate_index)} signatures)")
+
+class SeenJobIndex:
+    """In-memory set of job IDs already stored in the jobs table.
+    
+    SEEK job IDs are numeric, so they are packed as integers; any other ID
+    shape falls back to a string set. Loaded once by setup_database() and kept
+    current by save_jobs() once its writes commit, so dedupe checks never need
+    to query SQLite.
+    """
+    def __init__(self):
+        self._numeric_ids = set()
+        self._other_ids = set()
+        self.loaded = False
+
+    def add(self, job_id):
+        job_id = str(job_id)
+        if job_id.isdigit():
+            self._numeric_ids.add(int(job_id))
+        else:
+            self._other_ids.add(job_id)
+
+    def update(self, job_ids):
+        for job_id in job_ids:
+            self.add(job_id)
+
+    def __contains__(self, job_id):
+        job_id = str(job_id)
+        if job_id.isdigit():
+            return int(job_id) in self._numeric_ids
+        return job_id in self._other_ids
+
+    def __len__(self):
+        return len(self._numeric_ids) + len(self._other_ids)
+
+    async def load(self, db):
+        """Rebuild the index from the jobs table."""
+        self._numeric_ids.clear()
+        self._other_ids.clear()
+        async with db.execute('SELECT id FROM jobs') as cursor:
+            async for row in cursor:
+                self.add(row[0])
+        self.loaded = True
+
+# Global index of processed job IDs
+seen_jobs = SeenJobIndex()
+
+async def get_processed_job_ids(db, job_ids):
+    """Return the subset of job_ids already stored, using one query per chunk."""
+    job_ids = list(dict.fromkeys(job_ids))
+    processed = set()
+    for start in range(0, len(job_ids), SQLITE_MAX_PARAMS):
+        chunk = job_ids[start:start + SQLITE_MAX_PARAMS]
+        placeholders = ','.join('?' * len(chunk))
+        async with db.execute(f'SELECT id FROM jobs WHERE id IN ({placeholders})', chunk) as cursor:
+            processed.update(row[0] for row in await cursor.fetchall())
+    return processed
+
+async def filter_unprocessed_jobs(db, jobs):
+    """Return only the jobs that have not been processed yet, keeping their order."""
+    if seen_jobs.loaded:
+        return [job for job in jobs if job['id'] not in seen_jobs]
+    
+    processed = await get_processed_job_ids(db, [job['id'] for job in jobs])
+    return [job for job in jobs if job['id'] not in processed]
+
+# Near-duplicate detection settings
+DUPLICATE_MODE = os.getenv('DUPLICATE_MODE', 'flag').lower()  # flag, suppress or off
+DUPLICATE_WINDOW_DAYS = int(os.getenv('DUPLICATE_WINDOW_DAYS', '30'))  # How far back reposts are matched
+
+SIMHASH_BITS = 64
+# Copies within DUPLICATE_MAX_DISTANCE bits share at least one whole band,
+# which is why the distance is capped at one less than the number of bands.
+# Unrelated listings typically differ in about half of the 64 bits.
+SIMHASH_BANDS = 8
+DUPLICATE_MAX_DISTANCE = min(int(os.getenv('DUPLICATE_MAX_DISTANCE', '6')), SIMHASH_BANDS - 1)  # SimHash bits two copies may differ by
+SIMHASH_BAND_BITS = SIMHASH_BITS // SIMHASH_BANDS
+SIMHASH_BAND_MASK = (1 << SIMHASH_BAND_BITS) - 1
+SIMHASH_WORD_PATTERN = re.compile(r'[a-z0-9+#]+')
+
+@lru_cache(maxsize=65536)
+def _feature_hash(feature):
+    return format(int.from_bytes(hashlib.blake2b(feature.encode(), digest_size=8).digest(), 'big'), '064b').encode()
+
+def job_company(job):
+    return job.get('advertiser', {}).get('description') or job.get('companyName') or ''
+
+def job_scope(job):
+    """Return the location and classification a repost has to share with the original."""
+    location = (job.get('locations') or [{}])[0].get('label', '')
+    classification = (job.get('classifications') or [{}])[0].get('classification', {}).get('description', '')
+    return f"{location}|{classification}".lower()
+
+def job_simhash(job):
+    """Compute a 64-bit SimHash over a job's title, company, teaser and bullet points.
+    
+    Features are words and word pairs, with the title counted twice, so
+    reworded agency copies of the same role land a few bits apart while
+    short generic listings from different advertisers are pushed apart by
+    their company names.
+    """
+    title = SIMHASH_WORD_PATTERN.findall(job.get('title', '').lower())
+    company = SIMHASH_WORD_PATTERN.findall(job_company(job).lower())
+    body = SIMHASH_WORD_PATTERN.findall(
+        ' '.join([job.get('teaser', '')] + list(job.get('bulletPoints') or [])).lower()
+    )
+    features = []
+    for words, weight in ((title, 2), (company, 1), (body, 1)):
+        grams = words + [f"{first} {second}" for first, second in zip(words, words[1:])]
+        features.extend(_feature_hash(gram) for gram in grams for _ in range(weight))
+    if not features:
+        return 0
+    
+    # Column-wise bit counts: '1' is byte 49 and '0' is 48
+    threshold = len(features) * 48 + len(features) / 2
+    simhash = 0
+    for column in zip(*features):
+        simhash = (simhash << 1) | (sum(column) > threshold)
+    return simhash
+
+def to_signed64(value):
+    """Map an unsigned 64-bit value into SQLite's signed INTEGER range."""
+    return value - (1 << 64) if value >= 1 << 63 else value
+
+class DuplicateIndex:
+    """LSH index of job SimHash signatures for spotting reposts.
+    
+    Signatures are persisted in job_signatures alongside the jobs table and
+    bucketed here by band, so a lookup only compares against the handful of
+    jobs sharing a band instead of every stored listing. Only listings with
+    the same scope (location and classification) can match, so one title
+    advertised in two places is never treated as a repost.
+    """
+    def __init__(self, max_distance=DUPLICATE_MAX_DISTANCE, window_days=DUPLICATE_WINDOW_DAYS):
+        self.max_distance = max_distance
+        self.window = window_days * 86400
+        self._buckets = [{} for _ in range(SIMHASH_BANDS)]
+        self._signatures = {}  # job_id -> (simhash, posted_ts, scope)
+        self.loaded = False
+
+    def __len__(self):
+        return len(self._signatures)
 
-async def is_job_processed(db, job_id):
-    """Check if a job has already been processed."""
-    async with db.execute('SELECT id FROM jobs WHERE id = ?', (job_id,)) as cursor:
-        return await cursor.fetchone() is not None
+    @staticmethod
+    def _bands(simhash):
+        return [(simhash >> (band * SIMHASH_BAND_BITS)) & SIMHASH_BAND_MASK for band in range(SIMHASH_BANDS)]
 
-async def save_job(db, job):
-    """Save a job to the database."""
+    def add(self, job_id, simhash, posted_ts=None, scope=None):
+        job_id = str(job_id)
+        if job_id in self._signatures or not simhash:
+            return
+        self._signatures[job_id] = (simhash, posted_ts, scope)
+        for buckets, key in zip(self._buckets, self._bands(simhash)):
+            buckets.setdefault(key, []).append(job_id)
+
+    def find(self, job_id, simhash, posted_ts=None, scope=None):
+        """Return (job_id, distance) of the closest earlier listing in scope, or None."""
+        if not simhash:
+            return None
+        job_id = str(job_id)
+        oldest = (posted_ts or int(time.time())) - self.window
+        best = None
+        for buckets, key in zip(self._buckets, self._bands(simhash)):
+            for candidate in buckets.get(key, ()):
+                if candidate == job_id:
+                    continue
+                candidate_hash, candidate_ts, candidate_scope = self._signatures[candidate]
+                if candidate_scope != scope or (candidate_ts is not None and candidate_ts < oldest):
+                    continue
+                distance = bin(simhash ^ candidate_hash).count('1')
+                if distance <= self.max_distance and (best is None or distance < best[1]):
+                    best = (candidate, distance)
+        return best
+
+    async def load(self, db):
+        """Rebuild the band buckets from job_signatures, skipping listings outside the window."""
+        self._buckets = [{} for _ in range(SIMHASH_BANDS)]
+        self._signatures.clear()
+        oldest = int(time.time()) - self.window
+        async with db.execute(
+            'SELECT job_id, simhash, posted_ts, scope FROM job_signatures WHERE posted_ts IS NULL OR posted_ts >= ?',
+            (oldest,)
+        ) as cursor:
+            async for job_id, simhash, posted_ts, scope in cursor:
+                self.add(job_id, simhash & ((1 << 64) - 1), posted_ts, scope)
+        self.loaded = True
+
+# Global near-duplicate index
+duplicate_index = DuplicateIndex()
+
+def split_duplicates(jobs):
+    """Separate reposts from new listings before they are posted.
+    
+    Returns (jobs to post, suppressed duplicates). Each job found to repeat an
+    earlier listing gets 'duplicate_of' set to that listing's ID; in flag mode
+    it is still posted with the note, in suppress mode it is held back. New
+    listings go into an index for this batch so copies within it are caught;
+    the shared index only learns them once save_jobs() commits.
+    """
+    if DUPLICATE_MODE == 'off':
+        return list(jobs), []
+    
+    batch_index = DuplicateIndex(duplicate_index.max_distance, DUPLICATE_WINDOW_DAYS)
+    to_post, duplicates = [], []
+    for job in jobs:
+        simhash = job_simhash(job)
+        posted_ts = to_epoch(job.get('listingDate'))
+        scope = job_scope(job)
+        match = (duplicate_index.find(job['id'], simhash, posted_ts, scope)
+                 or batch_index.find(job['id'], simhash, posted_ts, scope))
+        if match is None:
+            batch_index.add(job['id'], simhash, posted_ts, scope)
+            to_post.append(job)
+            continue
+        job['duplicate_of'] = match[0]
+        if DUPLICATE_MODE == 'flag':
+            to_post.append(job)
+        else:
+            duplicates.append(job)
+    return to_post, duplicates
+
+async def setup_duplicate_index(db):
+    """Create the job_signatures table, sign recent stored jobs and load the index."""
+    await db.execute('''
+        CREATE TABLE IF NOT EXISTS job_signatures (
+            job_id TEXT PRIMARY KEY,
+            simhash INTEGER NOT NULL,
+            posted_ts INTEGER,
+            scope TEXT
+        )
+    ''')
+    
+    # Sign jobs stored before signatures existed, as far back as the window reaches
+    oldest = int(time.time()) - duplicate_index.window
+    async with db.execute('''
+        SELECT id, title, company, location, classification, description, bullet_points, posted_ts FROM jobs
+        WHERE posted_ts >= ? AND id NOT IN (SELECT job_id FROM job_signatures)
+    ''', (oldest,)) as cursor:
+        rows = await cursor.fetchall()
+    if rows:
+        signatures = []
+        for job_id, title, company, location, classification, description, bullet_points, posted_ts in rows:
+            job = {
+                'title': title or '',
+                'companyName': company or '',
+                'locations': [{'label': location or ''}],
+                'classifications': [{'classification': {'description': classification or ''}}],
+                'teaser': description or '',
+                'bulletPoints': json.loads(bullet_points) if bullet_points else []
+            }
+            signatures.append((job_id, to_signed64(job_simhash(job)), posted_ts, job_scope(job)))
+        await db.executemany(
+            'INSERT OR REPLACE INTO job_signatures (job_id, simhash, posted_ts, scope) VALUES (?, ?, ?, ?)',
+            signatures
+        )
+        logger.info(f"✓ Signed {len(rows)} existing jobs for duplicate detection")
+    await db.commit()
+    
+    await duplicate_index.load(db)
+
+# Columns written by save_jobs, in the order build_job_row returns them
+JOB_COLUMNS = (
+    'id', 'title', 'company', 'company_id', 'location', 'salary', 'work_type',
+    'work_arrangement', 'classification', 'subclassification', 'description',
+    'bullet_points', 'posted_date', 'processed_date', 'display_type',
+    'is_featured', 'tags', 'posted_ts', 'processed_ts', 'salary_min', 'salary_max',
+    'salary_period'
+)
+
+def salary_columns(label):
+    """Return the (salary_min, salary_max, salary_period) columns for a salary label.
+    
+    Labels without a usable amount get an empty period, so the backfill can
+    tell them apart from rows that were never parsed.
+    """
+    salary = parse_salary(label)
+    if salary is None:
+        return (None, None, '' if label else None)
+    return (salary.min, salary.max, salary.period)
+
+def build_job_row(job):
+    """Build the jobs table row for a SEEK job, in JOB_COLUMNS order."""
     # Get company name from advertiser description if available
     company_name = job.get('advertiser', {}).get('description') or job.get('companyName', 'Unknown Company')
     company_id = job.get('advertiser', {}).get('id', '')
@@ -157,15 +965,8 @@ async def save_job(db, job):
     bullet_points = json.dumps(job.get('bulletPoints', [])) if job.get('bulletPoints') else None
     tags = json.dumps([tag['label'] for tag in job.get('tags', [])]) if job.get('tags') else None
     
-    await db.execute('''
-        INSERT INTO jobs (
-            id, title, company, company_id, location, salary, work_type,
-            work_arrangement, classification, subclassification, description,
-            bullet_points, posted_date, processed_date, display_type,
-            is_featured, tags
-        )
-        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-    ''', (
+    processed_at = datetime.now()
+    return (
         job['id'],
         job['title'],
         company_name,
@@ -179,65 +980,562 @@ async def save_job(db, job):
         job.get('teaser', ''),
         bullet_points,
         job['listingDate'],
-        datetime.now().isoformat(),
+        processed_at.isoformat(),
         job.get('displayType', ''),
         1 if job.get('isFeatured', False) else 0,
-        tags
-    ))
+        tags,
+        to_epoch(job['listingDate']),
+        int(processed_at.timestamp()),
+        *salary_columns(job.get('salaryLabel'))
+    )
+
+# Rows and commits written by save_jobs, reset at the start of every cycle
+write_stats = {'rows': 0, 'commits': 0}
+
+def reset_write_stats():
+    """Reset the per-cycle write counters."""
+    write_stats['rows'] = 0
+    write_stats['commits'] = 0
+
+async def save_jobs(db, jobs, commit=True, after_commit=None):
+    """Save a batch of jobs in a single transaction.
+    
+    Jobs that already exist are updated in place, so one conflicting row never
+    aborts the rest of the batch. With commit=False the transaction is left
+    open so the caller can add more writes to it; the step that adds the jobs
+    to the in-memory seen and duplicate indexes is then appended to
+    after_commit for the caller to run once its commit succeeds.
+    """
+    rows = [build_job_row(job) for job in jobs]
+    if not rows:
+        return 0
+    
+    placeholders = ', '.join('?' * len(JOB_COLUMNS))
+    updates = ', '.join(
+        f"{column} = excluded.{column}"
+        for column in JOB_COLUMNS
+        if column not in ('id', 'processed_date', 'processed_ts')
+    )
+    try:
+        await prune_job_stats(db)
+        await db.executemany(f'''
+            INSERT INTO jobs ({', '.join(JOB_COLUMNS)})
+            VALUES ({placeholders})
+            ON CONFLICT(id) DO UPDATE SET {updates}
+        ''', rows)
+        signatures = [
+            (job['id'], job_simhash(job), to_epoch(job.get('listingDate')), job_scope(job))
+            for job in jobs
+        ]
+        await db.executemany(
+            'INSERT OR REPLACE INTO job_signatures (job_id, simhash, posted_ts, scope) VALUES (?, ?, ?, ?)',
+            [(job_id, to_signed64(simhash), posted_ts, scope) for job_id, simhash, posted_ts, scope in signatures]
+        )
+        if commit:
+            await db.commit()
+            write_stats['commits'] += 1
+    except Exception:
+        await db.rollback()
+        raise
+    
+    def index_jobs():
+        seen_jobs.update(row[0] for row in rows)
+        for signature in signatures:
+            duplicate_index.add(*signature)
+    
+    if commit:
+        index_jobs()
+    else:
+        after_commit.append(index_jobs)
+    write_stats['rows'] += len(rows)
+    return len(rows)
+
+# Digest mode: bursts of new jobs are sent as compact multi-job messages
+DIGEST_THRESHOLD = int(os.getenv('DIGEST_THRESHOLD', '0'))  # Batches of at least this many jobs become digests (0 disables)
+DIGEST_SIZE = min(int(os.getenv('DIGEST_SIZE', '10')), 15)  # Jobs listed per digest message
+DIGEST_DESCRIPTION_LIMIT = 4096  # Discord's limit on an embed description, which holds the digest lines
+DIGEST_WINDOW = float(os.getenv('DIGEST_WINDOW', '0'))  # Seconds to let new jobs accumulate before delivering
+
+# Delivery outbox settings
+OUTBOX_BATCH_SIZE = int(os.getenv('OUTBOX_BATCH_SIZE', '50'))  # Deliveries handed to the sender at once
+OUTBOX_MAX_ATTEMPTS = int(os.getenv('OUTBOX_MAX_ATTEMPTS', '5'))  # Attempts before a delivery is dead-lettered
+OUTBOX_RETRY_BASE = float(os.getenv('OUTBOX_RETRY_BASE', '30'))  # Seconds before the first retry, doubled each time
+OUTBOX_RETRY_MAX = float(os.getenv('OUTBOX_RETRY_MAX', '3600'))  # Longest wait between retries
+OUTBOX_POLL_INTERVAL = float(os.getenv('OUTBOX_POLL_INTERVAL', '5'))  # Seconds the worker sleeps when nothing is due
+OUTBOX_DEFAULT_TARGET = 'default'
+
+# Delivery routing: send jobs to extra channels or webhooks by classification, location or salary
+JOB_ROUTES_FILE = os.getenv('JOB_ROUTES_FILE', os.path.join(os.path.dirname(os.path.abspath(__file__)), 'routes.json'))
+ROUTE_DIMENSIONS = ('classification', 'subclassification', 'location', 'salary_band')
+
+def load_routes():
+    """Load the delivery routing table from JOB_ROUTES or JOB_ROUTES_FILE.
+    
+    Each route is a JSON object with a unique "name", the "webhook" URL to
+    deliver to and any of "classification", "subclassification", "location"
+    or "salary_band" as a value or list of values. A job matches a route when it has one of the listed values for
+    every dimension the route names, so a route naming none matches every
+    job. Every job still goes to the default destination as well, unless it
+    matches a route with "exclusive": true.
+    """
+    try:
+        raw = os.getenv('JOB_ROUTES')
+        if not raw and os.path.exists(JOB_ROUTES_FILE):
+            with open(JOB_ROUTES_FILE, 'r', encoding='utf-8') as f:
+                raw = f.read()
+        if not raw:
+            return []
+        
+        band_labels = {label.lower() for label, _, _ in SALARY_BANDS}
+        routes = []
+        names = {OUTBOX_DEFAULT_TARGET}
+        for index, entry in enumerate(json.loads(raw)):
+            if not isinstance(entry, dict):
+                logger.warning(f"⚠ Skipping route #{index + 1}: expected an object")
+                continue
+            route = {'name': str(entry.get('name') or f"route-{index + 1}"), 'match': {}}
+            if entry.get('webhook'):
+                route['webhook'] = str(entry['webhook'])
+            route['exclusive'] = entry.get('exclusive') is True
+            if not route.get('webhook'):
+                logger.warning(f"⚠ Skipping route {route['name']}: it needs a webhook")
+                continue
+            if route['name'] in names:
+                logger.warning(f"⚠ Skipping duplicate route: {route['name']}")
+                continue
+            
+            for key, values in entry.items():
+                if key in ('name', 'webhook', 'exclusive'):
+                    continue
+                if key not in ROUTE_DIMENSIONS:
+                    logger.warning(f"⚠ Ignoring unknown key {key} in route {route['name']}")
+                    continue
+                values = values if isinstance(values, list) else [values]
+                route['match'][key] = {str(value).strip().lower() for value in values if str(value).strip()}
+                if key == 'salary_band' and route['match'][key] - band_labels:
+                    logger.warning(f"⚠ Unknown salary bands in route {route['name']}: {', '.join(sorted(route['match'][key] - band_labels))}")
+            names.add(route['name'])
+            routes.append(route)
+        return routes
+    except Exception as e:
+        logger.warning(f"⚠ Error loading routes, sending every job to the default destination: {str(e)}")
+        return []
+
+def job_route_values(job):
+    """Return the lowercase values a SEEK job has for each routing dimension.
+    
+    A location matches on its full label ("Chatswood, Sydney NSW"), each
+    part of it ("Sydney NSW"), its state ("NSW") and SEEK's wider areas.
+    """
+    classifications = job.get('classifications') or []
+    locations = set()
+    for location in job.get('locations') or []:
+        label = location.get('label') or ''
+        locations.add(label)
+        locations.update(part.strip() for part in label.split(','))
+        locations.update(label.split()[-1:])
+        for area in location.get('seoHierarchy') or []:
+            name = area.get('contextualName') or ''
+            locations.add(name[4:] if name.startswith('All ') else name)
+    salary = parse_salary(job.get('salaryLabel'))
+    band = salary_band(salary.min) if salary else None
+    return {
+        'classification': {(entry.get('classification') or {}).get('description', '').lower() for entry in classifications},
+        'subclassification': {(entry.get('subclassification') or {}).get('description', '').lower() for entry in classifications},
+        'location': {location.lower() for location in locations},
+        'salary_band': {band.lower()} if band else set()
+    }
+
+class RoutingTable:
+    """Precomputed lookup from job attributes to the routes that want them.
+    
+    Every route is one bit. For each dimension the table maps each listed
+    value to the bits of the routes listing it, and keeps the bits of routes
+    that do not care about the dimension, so routing a job costs one dict
+    lookup per job attribute and a few ANDs however many routes there are.
+    """
+    def __init__(self, routes):
+        self.routes = routes
+        self._all = (1 << len(routes)) - 1
+        self._wildcards = {dimension: 0 for dimension in ROUTE_DIMENSIONS}
+        self._lookup = {dimension: {} for dimension in ROUTE_DIMENSIONS}
+        for bit, route in enumerate(routes):
+            for dimension in ROUTE_DIMENSIONS:
+                values = route['match'].get(dimension)
+                if not values:
+                    self._wildcards[dimension] |= 1 << bit
+                    continue
+                lookup = self._lookup[dimension]
+                for value in values:
+                    lookup[value] = lookup.get(value, 0) | 1 << bit
+
+    def __len__(self):
+        return len(self.routes)
+
+    def match(self, job):
+        """Return the names of the routes a job matches."""
+        mask = self._all
+        for dimension, values in job_route_values(job).items():
+            lookup = self._lookup[dimension]
+            allowed = self._wildcards[dimension]
+            for value in values:
+                allowed |= lookup.get(value, 0)
+            mask &= allowed
+            if not mask:
+                return []
+        return [route['name'] for bit, route in enumerate(self.routes) if mask >> bit & 1]
+
+    def route(self, jobs):
+        """Group jobs by delivery target, keeping their order within each target.
+        
+        Jobs go to the default target too unless a route they match is exclusive.
+        """
+        if not self.routes:
+            return {OUTBOX_DEFAULT_TARGET: list(jobs)} if jobs else {}
+        exclusive = {route['name'] for route in self.routes if route['exclusive']}
+        targets = {}
+        for job in jobs:
+            names = self.match(job)
+            if exclusive.isdisjoint(names):
+                names.insert(0, OUTBOX_DEFAULT_TARGET)
+            for target in names:
+                targets.setdefault(target, []).append(job)
+        return targets
+
+# Routing table built once at startup
+job_routes = RoutingTable(load_routes())
+
+async def setup_outbox(db):
+    """Create the delivery outbox and its dead-letter table."""
+    await db.execute('''
+        CREATE TABLE IF NOT EXISTS outbox (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            job_id TEXT NOT NULL,
+            target TEXT NOT NULL,
+            payload TEXT NOT NULL,
+            attempts INTEGER NOT NULL DEFAULT 0,
+            enqueued_ts INTEGER NOT NULL,
+            next_attempt_ts INTEGER NOT NULL,
+            last_error TEXT,
+            UNIQUE (job_id, target)
+        )
+    ''')
+    await db.execute('CREATE INDEX IF NOT EXISTS idx_outbox_due ON outbox (target, next_attempt_ts)')
+    await db.execute('''
+        CREATE TABLE IF NOT EXISTS outbox_dead_letter (
+            id INTEGER PRIMARY KEY,
+            job_id TEXT NOT NULL,
+            target TEXT NOT NULL,
+            payload TEXT NOT NULL,
+            attempts INTEGER NOT NULL,
+            enqueued_ts INTEGER NOT NULL,
+            failed_ts INTEGER NOT NULL,
+            last_error TEXT
+        )
+    ''')
     await db.commit()
 
+async def enqueue_deliveries(db, jobs, target=OUTBOX_DEFAULT_TARGET):
+    """Queue jobs for delivery. Runs in the caller's transaction and does not commit."""
+    now = int(time.time())
+    await db.executemany('''
+        INSERT OR IGNORE INTO outbox (job_id, target, payload, enqueued_ts, next_attempt_ts)
+        VALUES (?, ?, ?, ?, ?)
+    ''', [(job['id'], target, json.dumps(job), now, now) for job in jobs])
+
+async def save_and_enqueue(jobs, deliver_jobs, watermarks=(), extra_targets=None):
+    """Save a cycle's new jobs and queue the ones to post in a single transaction.
+    
+    Each job to post is queued once for every target job_routes sends it to,
+    and extra_targets maps any further targets to the jobs queued for them.
+    The searches' high-water marks are advanced in the same transaction, so
+    a cycle that fails to save is fetched again down to the old marks.
+    """
+    targets = job_routes.route(deliver_jobs)
+    for target, target_jobs in (extra_targets or {}).items():
+        targets.setdefault(target, []).extend(target_jobs)
+    after_commit = []
+    async with database.writer() as db:
+        await save_jobs(db, jobs, commit=False, after_commit=after_commit)
+        for target, target_jobs in targets.items():
+            await enqueue_deliveries(db, target_jobs, target)
+        for search_key, listing_date, job_id in watermarks:
+            await save_watermark(db, search_key, listing_date, job_id)
+        await db.commit()
+        write_stats['commits'] += 1
+    for callback in after_commit:
+        callback()
+    for target in targets:
+        outbox_event(target).set()
+
+async def get_outbox_metrics(target=None):
+    """Return queue depth, the age of the oldest queued delivery and the dead-letter count."""
+    async with database.reader() as db:
+        where, params = ('WHERE target = ?', (target,)) if target else ('', ())
+        async with db.execute(f'SELECT COUNT(*), MIN(enqueued_ts) FROM outbox {where}', params) as cursor:
+            depth, oldest = await cursor.fetchone()
+        async with db.execute(f'SELECT COUNT(*) FROM outbox_dead_letter {where}', params) as cursor:
+            dead_letters = (await cursor.fetchone())[0]
+        async with db.execute(f'SELECT target, COUNT(*) FROM outbox {where} GROUP BY target', params) as cursor:
+            targets = dict(await cursor.fetchall())
+    return {
+        'depth': depth,
+        'oldest_age': int(time.time()) - oldest if oldest else 0,
+        'dead_letters': dead_letters,
+        'targets': targets
+    }
+
+async def log_outbox_metrics(target=None, level=logging.INFO):
+    """Log outbox queue depth and age."""
+    metrics = await get_outbox_metrics(target)
+    logger.log(
+        level,
+        f"📬 Outbox: {metrics['depth']} queued, oldest {metrics['oldest_age']}s, "
+        f"{metrics['dead_letters']} dead-lettered"
+    )
+    if len(job_routes) and metrics['targets']:
+        logger.log(level, "   " + ", ".join(f"{target}: {depth}" for target, depth in sorted(metrics['targets'].items())))
+
+# Set whenever deliveries are queued for a target so its worker wakes straight away
+outbox_ready = {}  # target -> asyncio.Event
+
+def outbox_event(target):
+    """Return the event that wakes the worker for target, or for the family it belongs to."""
+    for family in outbox_ready:
+        if family.endswith('*') and target.startswith(family[:-1]):
+            return outbox_ready[family]
+    if target not in outbox_ready:
+        outbox_ready[target] = asyncio.Event()
+    return outbox_ready[target]
+
+class OutboxWorker:
+    """Drains the outbox for one target independently of the fetch loop.
+    
+    send takes a list of jobs and returns the ones it delivered. When woken
+    by new deliveries the worker first waits window seconds so jobs arriving
+    together are handed to send as one batch. Deliveries that fail are
+    retried with exponential backoff and moved to outbox_dead_letter after
+    OUTBOX_MAX_ATTEMPTS attempts.
+    
+    A target ending in '*' names a family: the worker drains every target
+    starting with the rest of it and calls send(jobs, target) once per target.
+    """
+    def __init__(self, send, target=OUTBOX_DEFAULT_TARGET, window=DIGEST_WINDOW):
+        self.send = send
+        self.target = target
+        self.window = window
+        self._ready = outbox_event(target)
+        self._stopped = asyncio.Event()
+
+    def stop(self):
+        self._stopped.set()
+        self._ready.set()
+
+    async def run(self):
+        """Deliver due jobs until stopped."""
+        while not self._stopped.is_set():
+            try:
+                delivered = await self.drain_once()
+            except Exception as e:
+                logger.warning(f"⚠ Outbox delivery error ({self.target}): {str(e)}")
+                delivered = 0
+            if delivered:
+                continue
+            self._ready.clear()
+            try:
+                await asyncio.wait_for(self._ready.wait(), OUTBOX_POLL_INTERVAL)
+            except asyncio.TimeoutError:
+                continue
+            if self.window and not self._stopped.is_set():
+                # Let a burst finish arriving so it can go out as digests
+                await asyncio.sleep(self.window)
+
+    async def drain_once(self):
+        """Send one batch of due deliveries and record the outcome. Returns the number delivered."""
+        family = self.target.endswith('*')
+        if family:
+            prefix = self.target[:-1]
+            where, params = 'substr(target, 1, ?) = ?', (len(prefix), prefix)
+        else:
+            where, params = 'target = ?', (self.target,)
+        async with database.reader() as db:
+            async with db.execute(f'''
+                SELECT id, target, payload, attempts FROM outbox
+                WHERE {where} AND next_attempt_ts <= ?
+                ORDER BY id LIMIT ?
+            ''', (*params, int(time.time()), OUTBOX_BATCH_SIZE)) as cursor:
+                rows = await cursor.fetchall()
+        if not rows:
+            return 0
+        
+        jobs = {row[0]: json.loads(row[2]) for row in rows}
+        batches = {}
+        for outbox_id, row_target, _, _ in rows:
+            batches.setdefault(row_target, []).append(jobs[outbox_id])
+        started = time.monotonic()
+        delivered_ids, errors = set(), {}
+        for row_target, batch in batches.items():
+            try:
+                delivered = await (self.send(batch, row_target) if family else self.send(batch))
+                errors[row_target] = "Delivery failed"
+            except Exception as e:
+                delivered = []
+                errors[row_target] = str(e)
+            delivered_ids.update((row_target, job['id']) for job in delivered)
+        elapsed = time.monotonic() - started
+        
+        now = int(time.time())
+        done, retry, dead = [], [], []
+        for outbox_id, row_target, _, attempts in rows:
+            job = jobs[outbox_id]
+            error = errors[row_target]
+            if (row_target, job['id']) in delivered_ids:
+                done.append((outbox_id,))
+                logger.info(f"✓ Posted new job: {job['title']} ({job['id']})")
+            elif attempts + 1 >= OUTBOX_MAX_ATTEMPTS:
+                dead.append((now, error, outbox_id))
+                logger.error(f"✗ Giving up on job after {attempts + 1} attempts: {job['title']} ({job['id']})")
+            else:
+                delay = min(OUTBOX_RETRY_BASE * 2 ** attempts, OUTBOX_RETRY_MAX)
+                retry.append((now + int(delay), error, outbox_id))
+                logger.warning(f"✗ Failed to post job: {job['title']} ({job['id']}), retrying in {int(delay)}s")
+        
+        async with database.writer() as db:
+            await db.executemany('DELETE FROM outbox WHERE id = ?', done)
+            await db.executemany('''
+                UPDATE outbox SET attempts = attempts + 1, next_attempt_ts = ?, last_error = ?
+                WHERE id = ?
+            ''', retry)
+            await db.executemany('''
+                INSERT OR REPLACE INTO outbox_dead_letter
+                (id, job_id, target, payload, attempts, enqueued_ts, failed_ts, last_error)
+                SELECT id, job_id, target, payload, attempts + 1, enqueued_ts, ?, ?
+                FROM outbox WHERE id = ?
+            ''', dead)
+            await db.executemany('DELETE FROM outbox WHERE id = ?', [(row[2],) for row in dead])
+        
+        if done:
+            logger.info(f"📤 Delivered {len(done)} jobs to {self.target} in {elapsed:.1f}s ({len(done) / max(elapsed, 0.001):.1f} jobs/s)")
+        return len(done)
+
 async def get_job_stats():
-    """Get statistics about processed jobs."""
-    async with aiosqlite.connect(DATABASE_PATH) as db:
+    """Get statistics about processed jobs from the materialized counters."""
+    async with database.reader() as db:
         db.row_factory = aiosqlite.Row
         stats = {}
         
         # Get total jobs count
-        async with db.execute('SELECT COUNT(*) as count FROM jobs') as cursor:
+        async with db.execute("SELECT count FROM job_stats WHERE dimension = 'total'") as cursor:
             row = await cursor.fetchone()
-            stats['total_jobs'] = row['count']
-        
-        # Get jobs by classification (handle NULL values)
-        async with db.execute('''
-            SELECT COALESCE(classification, 'Unspecified') as classification, COUNT(*) as count 
-            FROM jobs 
-            GROUP BY classification 
-            ORDER BY count DESC 
-            LIMIT 5
-        ''') as cursor:
-            stats['top_classifications'] = await cursor.fetchall()
+            stats['total_jobs'] = row['count'] if row else 0
         
-        # Get jobs by company
-        async with db.execute('''
-            SELECT company, COUNT(*) as count 
-            FROM jobs 
-            GROUP BY company 
-            ORDER BY count DESC 
-            LIMIT 5
-        ''') as cursor:
-            stats['top_companies'] = await cursor.fetchall()
+        # Get the top values for each counted dimension
+        for dimension, key in (
+            ('classification', 'top_classifications'),
+            ('company', 'top_companies'),
+            ('work_type', 'work_types')
+        ):
+            async with db.execute(f'''
+                SELECT value as {dimension}, count
+                FROM job_stats
+                WHERE dimension = ? AND count > 0
+                ORDER BY count DESC
+                LIMIT 5
+            ''', (dimension,)) as cursor:
+                stats[key] = await cursor.fetchall()
         
-        # Get recent job count
-        one_day_ago = (datetime.now() - timedelta(days=1)).isoformat()
+        # Get recent job count from the hourly buckets
         async with db.execute(
-            'SELECT COUNT(*) as count FROM jobs WHERE posted_date > ?', 
-            (one_day_ago,)
+            'SELECT COALESCE(SUM(count), 0) as count FROM job_stats_hourly WHERE bucket >= ?', 
+            (first_stats_bucket(),)
         ) as cursor:
             row = await cursor.fetchone()
             stats['jobs_last_24h'] = row['count']
         
-        # Get work type distribution
-        async with db.execute('''
-            SELECT COALESCE(work_type, 'Unspecified') as work_type, COUNT(*) as count 
-            FROM jobs 
-            GROUP BY work_type 
-            ORDER BY count DESC 
-            LIMIT 5
-        ''') as cursor:
-            stats['work_types'] = await cursor.fetchall()
+        # Salary bands come from their counters too, listed in band order
+        async with db.execute(
+            "SELECT value, count FROM job_stats WHERE dimension = 'salary_band' AND count > 0"
+        ) as cursor:
+            band_counts = {row['value']: row['count'] for row in await cursor.fetchall()}
+        stats['salary_bands'] = [
+            {'salary_band': label, 'count': band_counts[label]}
+            for label, _, _ in SALARY_BANDS
+            if label in band_counts
+        ]
         
         return stats
 
+async def log_job_stats(level=logging.INFO):
+    """Log the job statistics, database and outbox metrics."""
+    stats = await get_job_stats()
+    sections = (
+        ("Top Classifications", 'top_classifications', 'classification'),
+        ("Most Active Companies", 'top_companies', 'company'),
+        ("Work Type Distribution", 'work_types', 'work_type'),
+        ("Salary Bands", 'salary_bands', 'salary_band')
+    )
+    lines = [
+        "📊 Job Statistics:",
+        f"Total jobs tracked: {stats['total_jobs']}",
+        f"Jobs in last 24h: {stats['jobs_last_24h']}"
+    ]
+    for title, key, column in sections:
+        lines += ["", f"{title}:"] + [f"• {row[column]}: {row['count']}" for row in stats[key]]
+    logger.log(level, '\n'.join(lines))
+    log_database_metrics(level)
+    await log_outbox_metrics(level=level)
+
+def search_query(text):
+    """Turn free text into an FTS5 query matching every word, the last one as a prefix."""
+    terms = SEARCH_TERM_PATTERN.findall(text.lower())
+    if not terms:
+        return None
+    return ' '.join([f'"{term}"' for term in terms[:-1]] + [f'"{terms[-1]}"*'])
+
+async def search_jobs(text, page=0, page_size=SEARCH_PAGE_SIZE, highlight=('**', '**')):
+    """Search stored jobs and return (total matches, one page of results ranked best first).
+    
+    Results are dicts with the job's id, title, company, location, salary,
+    posted_date and a snippet of its description with the matches wrapped in
+    highlight.
+    """
+    query = search_query(text)
+    if not query or not search_available:
+        return 0, []
+    async with database.reader() as db:
+        db.row_factory = aiosqlite.Row
+        async with db.execute('SELECT COUNT(*) FROM jobs_fts WHERE jobs_fts MATCH ?', (query,)) as cursor:
+            total = (await cursor.fetchone())[0]
+        if not total:
+            return 0, []
+        async with db.execute(f'''
+            SELECT j.id, j.title, j.company, j.location, j.salary, j.posted_date,
+                   snippet(jobs_fts, 2, ?, ?, '…', 16) as snippet
+            FROM jobs_fts
+            JOIN jobs j ON j.rowid = jobs_fts.rowid
+            WHERE jobs_fts MATCH ?
+            ORDER BY bm25(jobs_fts, {', '.join(str(weight) for weight in SEARCH_WEIGHTS)})
+            LIMIT ? OFFSET ?
+        ''', (*highlight, query, page_size, page * page_size)) as cursor:
+            results = [dict(row) for row in await cursor.fetchall()]
+    return total, results
+
+def log_database_metrics(level=logging.INFO):
+    """Log connection pool and Discord rate-limit wait-time metrics."""
+    for name, metrics in database.metrics().items():
+        logger.log(
+            level,
+            f"🗄️ DB {name} pool: {metrics['acquired']} acquires, "
+            f"avg wait {metrics['avg_wait_ms']:.1f}ms, max wait {metrics['max_wait_ms']:.1f}ms, "
+            f"{metrics['timeouts']} timeouts"
+        )
+    metrics = rate_limiter.metrics()
+    logger.log(
+        level,
+        f"🚦 Discord: {metrics['requests']} requests, {metrics['rate_limited']} rate limited, "
+        f"avg wait {metrics['avg_wait_ms']:.1f}ms, max wait {metrics['max_wait_ms']:.1f}ms"
+    )
+
 def create_job_embed(job):
     """Create a Discord embed for a job listing."""
     embed = DiscordEmbed(
@@ -273,6 +1571,14 @@ def create_job_embed(job):
         bullet_points = '\n• ' + '\n• '.join(job['bulletPoints'])
         embed.add_embed_field(name=f"{EMOTE_KEY_POINTS} Key Points", value=bullet_points, inline=False)
     
+    # Note reposts let through in DUPLICATE_MODE=flag
+    if job.get('duplicate_of'):
+        embed.add_embed_field(
+            name="🔁 Possible Repost",
+            value=f"Very similar to https://www.seek.com.au/job/{job['duplicate_of']}",
+            inline=False
+        )
+    
     # Add footer with posting time and any tags
     footer_text = f"Posted {job['listingDateDisplay']}"
     if job.get('tags'):
@@ -282,116 +1588,384 @@ def create_job_embed(job):
     
     return embed
 
-async def send_webhook(job, max_retries=3):
-    """Send a Discord webhook with the job information."""
-    for attempt in range(max_retries):
-        try:
-            webhook = DiscordWebhook(url=WEBHOOK_URL, content="", silent=True)
-            embed = create_job_embed(job)
-            webhook.add_embed(embed)
-            response = webhook.execute()
-            if response.status_code == 200:
-                return True
-            elif response.status_code == 429:  # Rate limit
-                retry_after = int(response.headers.get('Retry-After', 5))
-                print(f"⚠ Rate limited, waiting {retry_after} seconds...")
-                await asyncio.sleep(retry_after)
-                continue
-            else:
-                print(f"⚠ Webhook failed with status {response.status_code}")
-        except Exception as e:
-            print(f"⚠ Webhook error (attempt {attempt + 1}/{max_retries}): {str(e)}")
+def use_digest(jobs):
+    """Return True if a delivery batch is large enough to be sent as digests."""
+    return bool(DIGEST_THRESHOLD) and len(jobs) >= DIGEST_THRESHOLD
+
+def chunk_jobs(jobs, size=None):
+    """Split jobs into consecutive digest groups.
+    
+    A group holds at most size jobs (DIGEST_SIZE by default) and is closed
+    early when its digest lines would overflow an embed description.
+    """
+    size = size or DIGEST_SIZE
+    groups, group, length = [], [], 0
+    for job in jobs:
+        line_length = len(digest_line(job)) + 1
+        if group and (len(group) >= size or length + line_length > DIGEST_DESCRIPTION_LIMIT):
+            groups.append(group)
+            group, length = [], 0
+        group.append(job)
+        length += line_length
+    if group:
+        groups.append(group)
+    return groups
+
+def digest_line(job, marker='•'):
+    """Format one job as a single compact digest line."""
+    company = job.get('advertiser', {}).get('description') or job.get('companyName', 'Unknown Company')
+    line = f"{marker} **[{job['title'][:80]}](https://www.seek.com.au/job/{job['id']})** · {company[:40]}"
+    if job.get('salaryLabel'):
+        line += f" · {job['salaryLabel'][:40]}"
+    return line
+
+def create_digest_embed(jobs):
+    """Create one compact Discord embed listing several jobs."""
+    embed = DiscordEmbed(
+        title=f"📋 {len(jobs)} new jobs",
+        description='\n'.join(digest_line(job) for job in jobs),
+        color='fd0585'
+    )
+    embed.set_footer(text="Job digest", icon_url="https://cdn.getminted.cc/seek.png")
+    return embed
+
+# Discord webhook delivery
+WEBHOOK_MAX_EMBEDS = 10  # Discord's limit on embeds per message
+WEBHOOK_EMBED_CHAR_LIMIT = 6000  # Discord's limit on total embed text per message
+WEBHOOK_TIMEOUT = float(os.getenv('WEBHOOK_TIMEOUT', '15'))  # Total seconds allowed per webhook request
+WEBHOOK_SUPPRESS_NOTIFICATIONS = 1 << 12  # Message flag for silent posts
+
+def embed_to_dict(embed):
+    """Convert a DiscordEmbed into the JSON object the webhook API expects."""
+    return {key: value for key, value in embed.__dict__.items() if value not in (None, [], {})}
+
+def embed_length(embed):
+    """Count the characters Discord charges against the per-message embed budget."""
+    length = len(embed.get('title') or '') + len(embed.get('description') or '')
+    length += len((embed.get('footer') or {}).get('text') or '')
+    length += len((embed.get('author') or {}).get('name') or '')
+    for field in embed.get('fields', []):
+        length += len(field.get('name') or '') + len(field.get('value') or '')
+    return length
+
+def batch_embeds(jobs):
+    """Pack jobs into webhook messages of up to 10 embeds within the 6000-character budget.
+    
+    Each embed is one job, or a digest of up to DIGEST_SIZE jobs when the batch
+    is large enough for digest mode. Returns a list of (job groups, embeds)
+    pairs in the original job order, with one job group per embed.
+    """
+    if use_digest(jobs):
+        units = [(group, create_digest_embed(group)) for group in chunk_jobs(jobs)]
+    else:
+        units = [([job], create_job_embed(job)) for job in jobs]
+    
+    batches = []
+    pending_groups, pending_embeds, pending_length = [], [], 0
+    for group, embed in units:
+        embed = embed_to_dict(embed)
+        length = embed_length(embed)
+        if pending_embeds and (
+            len(pending_embeds) >= WEBHOOK_MAX_EMBEDS or pending_length + length > WEBHOOK_EMBED_CHAR_LIMIT
+        ):
+            batches.append((pending_groups, pending_embeds))
+            pending_groups, pending_embeds, pending_length = [], [], 0
+        pending_groups.append(group)
+        pending_embeds.append(embed)
+        pending_length += length
+    if pending_embeds:
+        batches.append((pending_groups, pending_embeds))
+    return batches
+
+class WebhookSender:
+    """Async Discord webhook client with a pooled keep-alive session.
+    
+    Jobs are packed into as few messages as Discord allows and the messages
+    are sent one after another, so a burst of new jobs costs a handful of
+    requests, arrives in listing order and never blocks the event loop.
+    """
+    def __init__(self, url):
+        self.url = url
+        self.route = f"webhook:{url}"
+        self._session = None
+        self._session_lock = asyncio.Lock()
+
+    async def get_session(self):
+        async with self._session_lock:
+            if self._session is None or self._session.closed:
+                connector = aiohttp.TCPConnector(limit=1, ttl_dns_cache=300)
+                timeout = aiohttp.ClientTimeout(total=WEBHOOK_TIMEOUT)
+                self._session = aiohttp.ClientSession(connector=connector, timeout=timeout)
+            return self._session
+
+    async def post(self, embeds, max_retries=3):
+        """Post one message of embeds, retrying rate limits and transient errors.
+        
+        Returns True once sent, False if Discord rejected the message and None
+        if it still failed after every retry.
+        """
+        payload = {'embeds': embeds, 'flags': WEBHOOK_SUPPRESS_NOTIFICATIONS}
+        for attempt in range(max_retries):
+            try:
+                session = await self.get_session()
+                await rate_limiter.acquire(self.route, PRIORITY_JOBS)
+                async with session.post(self.url, json=payload, params={'wait': 'true'}) as response:
+                    if response.status == 429:  # Rate limit; the limiter holds the route until it resets
+                        rate_limiter.rate_limited(self.route, response.headers)
+                        logger.warning(f"⚠ Rate limited, waiting {response.headers.get('Retry-After', '?')} seconds...")
+                        continue
+                    rate_limiter.update(self.route, response.headers)
+                    if response.status in (200, 204):
+                        return True
+                    logger.warning(f"⚠ Webhook failed with status {response.status}: {(await response.text())[:200]}")
+                    if response.status < 500:
+                        return False
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                logger.warning(f"⚠ Webhook error (attempt {attempt + 1}/{max_retries}): {str(e)}")
             await asyncio.sleep(2 ** attempt)  # Exponential backoff
+        return None
+
+    async def send_jobs(self, jobs):
+        """Post jobs in batched messages, in order, and return the ones that were delivered.
+        
+        Sending stops at the first message that still fails after its retries,
+        so the jobs after it are retried by the outbox behind it rather than
+        overtaking it.
+        """
+        delivered = []
+        for groups, embeds in batch_embeds(jobs):
+            sent = await self.post(embeds)
+            if sent is False and len(embeds) > 1:
+                # A rejected message fails every embed in it, so resend them
+                # one by one to deliver all but the embed Discord objects to
+                results = []
+                for embed in embeds:
+                    results.append(await self.post([embed]))
+                    if results[-1] is None:
+                        break
+            else:
+                results = [sent] * len(embeds)
+            delivered.extend(job for group, result in zip(groups, results) if result for job in group)
+            if None in results:
+                break
+        return delivered
+
+    async def close(self):
+        async with self._session_lock:
+            if self._session and not self._session.closed:
+                await self._session.close()
+            self._session = None
+
+# Global webhook sender for job notifications
+webhook_sender = WebhookSender(WEBHOOK_URL)
+
+# Webhook senders for routed deliveries, by URL
+webhook_senders = {}
+
+def get_webhook_sender(url):
+    """Return the shared WebhookSender for a routed webhook URL."""
+    if url not in webhook_senders:
+        webhook_senders[url] = WebhookSender(url)
+    return webhook_senders[url]
+
+async def send_webhooks(jobs):
+    """Send jobs to the Discord webhook and return the ones that were posted."""
+    if not jobs:
+        return []
+    return await webhook_sender.send_jobs(jobs)
+
+def create_outbox_workers(send):
+    """Create one outbox worker per delivery target so each drains in parallel.
     
-    return False
+    send delivers the default target and every route posts through its own
+    WebhookSender.
+    """
+    workers = [OutboxWorker(send)]
+    for route in job_routes.routes:
+        workers.append(OutboxWorker(get_webhook_sender(route['webhook']).send_jobs, route['name']))
+    return workers
 
-async def fetch_jobs():
-    """Fetch jobs from SEEK API."""
+async def get_watermark(db, search_key):
+    """Get the newest listing already seen for a search as (listing_date, job_id)."""
+    async with db.execute(
+        'SELECT last_listing_date, last_job_id FROM crawl_state WHERE search_key = ?',
+        (search_key,)
+    ) as cursor:
+        row = await cursor.fetchone()
+    # A search without crawl state yet only reads its first page
+    return (row[0], row[1]) if row else (None, None)
+
+async def save_watermark(db, search_key, listing_date, job_id):
+    """Move the high-water mark for a search, never backwards. Runs in the caller's transaction and does not commit."""
+    await db.execute('''
+        INSERT INTO crawl_state (search_key, last_listing_date, last_job_id, updated_date)
+        VALUES (?, ?, ?, ?)
+        ON CONFLICT(search_key) DO UPDATE SET
+            last_listing_date = excluded.last_listing_date,
+            last_job_id = excluded.last_job_id,
+            updated_date = excluded.updated_date
+        WHERE excluded.last_listing_date >= COALESCE(crawl_state.last_listing_date, '')
+    ''', (search_key, listing_date, job_id, datetime.now().isoformat()))
+
+async def fetch_jobs_page(params, page):
+    """Fetch a single page of search results from SEEK."""
+    payload = await seek_client.search({**params, "page": str(page)})
+    return payload.get('data', [])
+
+async def fetch_jobs(profile=None):
+    """Fetch jobs for one search profile from SEEK API.
+    
+    Pages are walked newest first until the stored high-water mark for the
+    search is reached, so a burst of postings between polls is not lost
+    beyond page 1. If SEEK_MAX_PAGES is reached first, the gap is logged and
+    the mark still moves to the newest job fetched. Returns (jobs,
+    watermark), where watermark is the (search_key, listing_date, job_id) to
+    store once the jobs are saved, or None when nothing was fetched.
+    """
     params = {
         "siteKey": "AU-Main",
         "sourcesystem": "houston",
-        "where": "Hobart TAS 7000",
-        "page": "1",
         "sortmode": "ListedDate",  # Ensure we get newest listings first
-        "pageSize": "22",
+        "pageSize": str(SEEK_PAGE_SIZE),
         "include": "seodata,joracrosslink,gptTargeting",
         "locale": "en-AU"
     }
+    profile = profile or SEARCH_PROFILES[0]
+    search_key = profile['name']
+    params.update({key: value for key, value in profile.items() if key != 'name'})
     
     try:
-        response = requests.get(SEEK_URL, headers=SEEK_HEADERS, params=params)
-        response.raise_for_status()
-        return response.json()['data']
+        async with database.reader() as db:
+            last_date, last_id = await get_watermark(db, search_key)
+        jobs = {}
+        pages = 0
+        for page in range(1, SEEK_MAX_PAGES + 1):
+            page_jobs = await fetch_jobs_page(params, page)
+            pages += 1
+            
+            reached_watermark = last_date is None  # First crawl only takes page 1
+            for job in page_jobs:
+                jobs.setdefault(job['id'], job)
+                # Featured listings are pinned above the date order, so skip them
+                if job.get('isFeatured'):
+                    continue
+                if job['id'] == last_id or (last_date and job.get('listingDate', '') <= last_date):
+                    reached_watermark = True
+            
+            if reached_watermark or len(page_jobs) < SEEK_PAGE_SIZE:
+                if pages > 1:
+                    logger.info(f"ℹ [{search_key}] Walked {pages} pages to reach the last seen job")
+                break
+        else:
+            # Move the mark on anyway: new postings only push the old one deeper, so every later poll would hit the limit too
+            oldest = min((job.get('listingDate', '') for job in jobs.values() if not job.get('isFeatured')), default='')
+            logger.warning(
+                f"⚠ [{search_key}] Reached page limit ({SEEK_MAX_PAGES}) before the last seen job; "
+                f"jobs listed between {last_date} and {oldest or 'the last page'} may have been missed"
+            )
+        
+        watermark = None
+        dated_jobs = [job for job in jobs.values() if job.get('listingDate')]
+        if dated_jobs:
+            newest = max(dated_jobs, key=lambda job: job['listingDate'])
+            watermark = (search_key, newest['listingDate'], newest['id'])
+        
+        return list(jobs.values()), watermark
     except Exception as e:
-        print(f"Error fetching jobs: {e}")
-        return []
+        logger.error(f"Error fetching jobs for {search_key}: {e}")
+        return [], None
+
+async def fetch_all_jobs():
+    """Run every search profile concurrently and merge the results.
+    
+    Jobs matched by several profiles are returned once, newest first, so the
+    filters and database writes downstream only ever see each job ID once.
+    Returns (jobs, watermarks) for save_and_enqueue().
+    """
+    semaphore = asyncio.Semaphore(max(1, SEARCH_CONCURRENCY))
+    
+    async def run_profile(profile):
+        async with semaphore:
+            return await fetch_jobs(profile)
+    
+    results = await asyncio.gather(*(run_profile(profile) for profile in SEARCH_PROFILES))
+    
+    merged = {}
+    watermarks = []
+    for profile, (jobs, watermark) in zip(SEARCH_PROFILES, results):
+        if len(SEARCH_PROFILES) > 1:
+            logger.info(f"ℹ [{profile['name']}] {len(jobs)} jobs")
+        for job in jobs:
+            merged.setdefault(job['id'], job)
+        if watermark:
+            watermarks.append(watermark)
+    
+    return sorted(merged.values(), key=lambda job: job.get('listingDate', ''), reverse=True), watermarks
 
 async def process_jobs():
     """Main job processing function."""
-    print(f"⚡ Starting job check at {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+    logger.info(f"⚡ Starting job check at {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
     
-    jobs = await fetch_jobs()
+    jobs, watermarks = await fetch_all_jobs()
     if not jobs:
-        print("✗ No jobs fetched or error occurred")
+        logger.warning("✗ No jobs fetched or error occurred")
         return
     
-    print(f"ℹ Found {len(jobs)} jobs")
+    logger.info(f"ℹ Found {len(jobs)} jobs")
     
-    async with aiosqlite.connect(DATABASE_PATH) as db:
-        new_jobs = 0
-        filtered_jobs = 0
-        for job in jobs:
-            if not await is_job_processed(db, job['id']):
-                if not should_process_job(job):
-                    filtered_jobs += 1
-                    continue
-                    
-                if await send_webhook(job):
-                    await save_job(db, job)
-                    new_jobs += 1
-                    print(f"✓ Posted new job: {job['title']} ({job['id']})")
-                else:
-                    print(f"✗ Failed to post job: {job['title']} ({job['id']})")
+    reset_write_stats()
+    async with database.reader() as db:
+        unseen_jobs = await filter_unprocessed_jobs(db, jobs)
+    
+    accepted_jobs = job_filter.filter(unseen_jobs)
+    filtered_jobs = len(unseen_jobs) - len(accepted_jobs)
+    accepted_jobs, duplicate_jobs = split_duplicates(accepted_jobs)
+    
+    # Save new jobs and queue them for the delivery worker in one transaction;
+    # suppressed duplicates are stored too so they are not reconsidered next cycle
+    await save_and_enqueue(accepted_jobs + duplicate_jobs, accepted_jobs, watermarks)
+    new_jobs = len(accepted_jobs)
+    
+    if new_jobs == 0 and filtered_jobs == 0 and not duplicate_jobs:
+        logger.info("ℹ No new jobs found")
+    else:
+        logger.info(f"✓ Queued {new_jobs} new jobs ({filtered_jobs} filtered out, {len(duplicate_jobs)} duplicates suppressed)")
+        logger.info(f"💾 Saved {write_stats['rows']} rows in {write_stats['commits']} commits")
         
-        if new_jobs == 0 and filtered_jobs == 0:
-            print("ℹ No new jobs found")
-        else:
-            print(f"✓ Posted {new_jobs} new jobs ({filtered_jobs} filtered out)")
-            
-        # Print job statistics
-        try:
-            stats = await get_job_stats()
-            print("\n📊 Job Statistics:")
-            print(f"Total jobs tracked: {stats['total_jobs']}")
-            print(f"Jobs in last 24h: {stats['jobs_last_24h']}")
-            print("\nTop Classifications:")
-            for row in stats['top_classifications']:
-                print(f"• {row['classification']}: {row['count']}")
-            print("\nMost Active Companies:")
-            for row in stats['top_companies']:
-                print(f"• {row['company']}: {row['count']}")
-            print("\nWork Type Distribution:")
-            for row in stats['work_types']:
-                print(f"• {row['work_type']}: {row['count']}")
-        except Exception as e:
-            print(f"⚠ Error getting statistics: {str(e)}")
-            # Print the full error traceback for debugging
-            import traceback
-            print(traceback.format_exc())
+    try:
+        await log_job_stats()
+    except Exception as e:
+        logger.warning(f"⚠ Error getting statistics: {str(e)}", exc_info=True)
 
 async def cleanup():
     """Perform cleanup operations."""
-    print("✓ Cleanup completed")
+    await seek_client.close()
+    await webhook_sender.close()
+    for sender in webhook_senders.values():
+        await sender.close()
+    await database.close()
+    logger.info("✓ Cleanup completed")
+
+def setup_logging():
+    """Write the monitor's log records to the terminal as plain lines."""
+    logging.basicConfig(stream=sys.stdout, format='%(message)s', level=logging.WARNING)
+    logging.getLogger('seekret').setLevel(LOG_LEVEL)
 
 async def main():
     """Main function."""
     global shutdown_flag
     
     print("\033[96m" + LOGO + "\033[0m")  # Print logo in cyan color
-    print("🚀 Powering up The Seekret")
-    print("ℹ Press Ctrl+C to exit gracefully")
+    logger.info("🚀 Powering up The Seekret")
+    logger.info("ℹ Press Ctrl+C to exit gracefully")
     await setup_database()
     
+    # Deliver queued jobs alongside the fetch loop, one worker per target
+    outbox_workers = create_outbox_workers(send_webhooks)
+    worker_tasks = [asyncio.create_task(worker.run()) for worker in outbox_workers]
+    if len(job_routes):
+        logger.info(f"🧭 Routing jobs to {len(job_routes)} extra destinations")
+    
     try:
         while not shutdown_flag:
             await process_jobs()
@@ -403,43 +1977,54 @@ async def main():
                 await asyncio.sleep(1)
                 
     except Exception as e:
-        print(f"\n❌ Error in main loop: {str(e)}")
+        logger.exception(f"❌ Error in main loop: {str(e)}")
     finally:
+        for worker in outbox_workers:
+            worker.stop()
+        await asyncio.gather(*worker_tasks)
         await cleanup()
-        print("👋 Goodbye!")
+        logger.info("👋 Goodbye!")
 
-def should_process_job(job):
-    """Determine if a job should be processed based on filters."""
-    # Get company name from advertiser description if available
-    company_name = job.get('advertiser', {}).get('description') or job.get('companyName', '')
-    
-    # Check excluded companies
-    if company_name in EXCLUDED_COMPANIES:
-        return False
-    
-    # Check salary if available
-    if job.get('salaryLabel'):
-        # Extract first number from salary string as a rough estimate
-        import re
-        salary_numbers = re.findall(r'\d+\.?\d*', job.get('salaryLabel', '0'))
-        if salary_numbers and float(salary_numbers[0]) < SALARY_MIN:
-            return False
-    
-    # Combine title and description for keyword checking
-    text_to_check = f"{job['title']} {job.get('teaser', '')}".lower()
-    
-    # Check required keywords
-    if REQUIRED_KEYWORDS and not any(keyword.lower() in text_to_check for keyword in REQUIRED_KEYWORDS):
-        return False
-    
-    # Check excluded keywords
-    if any(keyword.lower() in text_to_check for keyword in EXCLUDED_KEYWORDS):
-        return False
+async def search_command(text, page=1):
+    """Print one page of stored jobs matching a full-text search."""
+    await setup_database()
+    try:
+        started = time.monotonic()
+        total, results = await search_jobs(text, page - 1, highlight=('\033[1m', '\033[0m'))
+        elapsed = time.monotonic() - started
+        if not total:
+            print(f"ℹ No stored jobs match '{text}'")
+            return
+        
+        pages = -(-total // SEARCH_PAGE_SIZE)
+        print(f"\n🔎 {total} jobs match '{text}' (page {page} of {pages}, {elapsed * 1000:.1f}ms)\n")
+        for number, job in enumerate(results, start=(page - 1) * SEARCH_PAGE_SIZE + 1):
+            print(f"{number}. {job['title']} - {job['company']} ({job['location']})")
+            if job['salary']:
+                print(f"   {EMOTE_SALARY} {job['salary']}")
+            if job['snippet']:
+                print(f"   {job['snippet']}")
+            print(f"   https://www.seek.com.au/job/{job['id']}\n")
+    finally:
+        await cleanup()
+
+def cli_main(argv=None):
+    """Run the monitor, or a subcommand such as search."""
+    parser = argparse.ArgumentParser(description='Monitor SEEK for new jobs')
+    subcommands = parser.add_subparsers(dest='command')
+    search_parser = subcommands.add_parser('search', help='Full-text search over stored jobs')
+    search_parser.add_argument('query', nargs='+', help='Words to search for')
+    search_parser.add_argument('--page', type=int, default=1, help='Page of results to show')
+    args = parser.parse_args(argv)
     
-    return True
+    setup_logging()
+    if args.command == 'search':
+        asyncio.run(search_command(' '.join(args.query), max(1, args.page)))
+    else:
+        asyncio.run(main())
 
 if __name__ == "__main__":
     try:
-        asyncio.run(main())
+        cli_main()
     except KeyboardInterrupt:
         pass  # Handle Ctrl+C gracefully 
\ No newline at end of file
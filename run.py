@@ -7,6 +7,10 @@ from importlib.util import spec_from_file_location, module_from_spec
 
 def import_module_from_path(path, module_name):
     """Import a module from a file path."""
+    # Let the module import its sibling modules (e.g. database.py)
+    module_dir = os.path.dirname(os.path.abspath(path))
+    if module_dir not in sys.path:
+        sys.path.insert(0, module_dir)
     spec = spec_from_file_location(module_name, path)
     module = module_from_spec(spec)
     spec.loader.exec_module(module)
@@ -15,12 +19,13 @@ def import_module_from_path(path, module_name):
 def main():
     parser = argparse.ArgumentParser(description='Run The Seekret in either CLI or Bot mode')
     parser.add_argument('mode', choices=['cli', 'bot'], help='Run mode: cli or bot')
+    parser.add_argument('args', nargs=argparse.REMAINDER, help='CLI subcommand, e.g. search <terms>')
     args = parser.parse_args()
 
     if args.mode == 'cli':
         # Import and run CLI version
         cli_module = import_module_from_path(os.path.join('cli', 'seek_jobs_monitor.py'), 'seek_jobs_monitor')
-        asyncio.run(cli_module.main())
+        cli_module.cli_main(args.args)
     else:
         # Import and run Bot version
         bot_module = import_module_from_path(os.path.join('bot', 'bot.py'), 'bot')
@@ -0,0 +1,54 @@
+import os
+import sys
+import tempfile
+import importlib.util
+
+import pytest
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+BOT_DIR = os.path.join(ROOT_DIR, 'bot')
+CLI_DIR = os.path.join(ROOT_DIR, 'cli')
+
+# The monitor opens its database from DATABASE_PATH at import time, so point it somewhere disposable first
+os.environ.setdefault('DATABASE_PATH', os.path.join(tempfile.mkdtemp(prefix='seekret-tests-'), 'jobs.db'))
+sys.path.insert(0, BOT_DIR)
+
+def load_cli_module(name):
+    """Import the CLI copy of a module under its own module name."""
+    if f'cli_{name}' not in sys.modules:
+        spec = importlib.util.spec_from_file_location(f'cli_{name}', os.path.join(CLI_DIR, f'{name}.py'))
+        module = importlib.util.module_from_spec(spec)
+        sys.modules[spec.name] = module
+        spec.loader.exec_module(module)
+    return sys.modules[f'cli_{name}']
+
+@pytest.fixture
+def fresh_database(tmp_path, monkeypatch):
+    """Point the monitor's shared Database at an empty file for one test."""
+    import seek_jobs_monitor as seek
+    from database import Database
+    path = str(tmp_path / 'jobs.db')
+    monkeypatch.setattr(seek, 'DATABASE_PATH', path)
+    monkeypatch.setattr(seek, 'database', Database(path))
+    return path
+
+@pytest.fixture(params=['bot', 'cli'])
+def monitor(request, tmp_path, monkeypatch):
+    """Each copy of the monitor in turn, with its shared Database on an empty file."""
+    if request.param == 'bot':
+        import seek_jobs_monitor as module
+    else:
+        module = load_cli_module('seek_jobs_monitor')
+    from database import Database
+    path = str(tmp_path / 'jobs.db')
+    monkeypatch.setattr(module, 'DATABASE_PATH', path)
+    monkeypatch.setattr(module, 'database', Database(path))
+    return module
+
+@pytest.fixture(params=['bot', 'cli'])
+def ratelimit(request):
+    """Each copy of the rate limiter module in turn."""
+    if request.param == 'bot':
+        import ratelimit as module
+        return module
+    return load_cli_module('ratelimit')
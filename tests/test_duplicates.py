@@ -0,0 +1,63 @@
+import seek_jobs_monitor as seek
+
+def make_job(job_id, title, company, teaser, bullet_points=(), location='Sydney NSW',
+             classification='Information & Communication Technology', listing_date='2026-10-01T00:00:00Z'):
+    return {
+        'id': str(job_id),
+        'title': title,
+        'advertiser': {'description': company},
+        'teaser': teaser,
+        'bulletPoints': list(bullet_points),
+        'locations': [{'label': location}],
+        'classifications': [{'classification': {'description': classification}}],
+        'listingDate': listing_date
+    }
+
+ORIGINAL = make_job(
+    1, 'Senior Python Developer', 'Acme Software',
+    'Join a growing fintech team building payment APIs with Python and AWS',
+    ['Hybrid working', 'Competitive salary', 'Great culture']
+)
+
+def distance(first, second):
+    return bin(seek.job_simhash(first) ^ seek.job_simhash(second)).count('1')
+
+def index_of(*jobs):
+    index = seek.DuplicateIndex(max_distance=6, window_days=30)
+    for job in jobs:
+        index.add(job['id'], seek.job_simhash(job), seek.to_epoch(job['listingDate']), seek.job_scope(job))
+    return index
+
+def find(index, job):
+    return index.find(job['id'], seek.job_simhash(job), seek.to_epoch(job['listingDate']), seek.job_scope(job))
+
+def test_simhash_is_stable_and_fits_64_bits():
+    assert seek.job_simhash(ORIGINAL) == seek.job_simhash(dict(ORIGINAL, id='2'))
+    assert 0 < seek.job_simhash(ORIGINAL) < 1 << 64
+    assert seek.job_simhash({}) == 0
+
+def test_finds_reworded_agency_copy():
+    agency_copy = make_job(
+        2, 'Senior Python Developer', 'Hays Recruitment',
+        'Join a growing fintech team building payment APIs with Python and AWS today',
+        ['Hybrid working', 'Competitive salary', 'Great culture']
+    )
+    assert distance(ORIGINAL, agency_copy) <= 6
+    assert find(index_of(ORIGINAL), agency_copy) == ('1', distance(ORIGINAL, agency_copy))
+
+def test_short_generic_listings_from_different_companies_are_not_duplicates():
+    first = make_job(1, 'Retail Assistant', 'Coles', 'Casual role', classification='Retail & Consumer Products')
+    second = make_job(2, 'Retail Assistant', 'Kmart', 'Casual role available', classification='Retail & Consumer Products')
+    assert find(index_of(first), second) is None
+
+def test_same_listing_in_another_location_is_not_a_duplicate():
+    elsewhere = dict(ORIGINAL, id='2', locations=[{'label': 'Melbourne VIC'}])
+    assert distance(ORIGINAL, elsewhere) == 0
+    assert find(index_of(ORIGINAL), elsewhere) is None
+
+def test_listings_outside_the_window_are_ignored():
+    repost = dict(ORIGINAL, id='2', listingDate='2026-12-01T00:00:00Z')
+    assert find(index_of(ORIGINAL), repost) is None
+
+def test_a_job_never_matches_itself():
+    assert find(index_of(ORIGINAL), ORIGINAL) is None
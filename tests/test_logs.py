@@ -0,0 +1,85 @@
+import asyncio
+import io
+import logging
+import sys
+
+import pytest
+
+from logs import LogPipeline, TerminalSink, DiscordSink
+
+class FakeChannel:
+    def __init__(self):
+        self.sent = []
+
+    async def send(self, text):
+        self.sent.append(text)
+
+@pytest.fixture
+def logger():
+    logger = logging.getLogger('seekret.tests')
+    logger.setLevel(logging.DEBUG)
+    logger.propagate = False
+    yield logger
+    logger.handlers.clear()
+    logger.propagate = True
+
+def test_sinks_get_the_levels_they_ask_for(logger):
+    terminal, channel = io.StringIO(), FakeChannel()
+    pipeline = LogPipeline()
+    pipeline.add_sink(TerminalSink(logging.INFO, stream=terminal))
+    sink = DiscordSink(lambda channel_id: channel, 1, level=logging.WARNING, interval=0)
+    pipeline.add_sink(sink)
+    logger.addHandler(pipeline)
+
+    async def scenario():
+        pipeline.start()
+        logger.debug("cycle statistics")
+        logger.info("✓ Posted new job")
+        # The level comes from the call, not from how the message starts
+        logger.warning("Rate limited, waiting")
+        logger.info("Error rates are normal")
+        await pipeline.remove_sink(sink)
+        await pipeline.stop()
+
+    asyncio.run(scenario())
+    assert not isinstance(sys.stdout, LogPipeline)
+    assert terminal.getvalue().splitlines() == ["✓ Posted new job", "Rate limited, waiting", "Error rates are normal"]
+    assert channel.sent == ["```\nRate limited, waiting\n```"]
+
+def test_backpressure_samples_info_and_keeps_warnings(logger):
+    terminal = io.StringIO()
+    pipeline = LogPipeline(buffer_size=10, flush_size=100, flush_interval=60, sample_threshold=0.5, sample_rate=5)
+    pipeline.add_sink(TerminalSink(logging.DEBUG, stream=terminal))
+    logger.addHandler(pipeline)
+
+    async def scenario():
+        pipeline.start()
+        for number in range(30):
+            logger.info(f"info {number}")
+        logger.error("still delivered")
+        metrics = pipeline.metrics()
+        await pipeline.stop()
+        return metrics
+
+    metrics = asyncio.run(scenario())
+    lines = terminal.getvalue().splitlines()
+    # Past half full one in five info records is kept, and the error pushes out the oldest one
+    assert lines[:-1] == ["info 1", "info 2", "info 3", "info 4", "info 9", "info 14", "info 19", "info 24", "info 29", "still delivered"]
+    assert metrics['sampled'] == 20 and metrics['dropped'] == 1
+    assert lines[-1].startswith("⚠ Log buffer under pressure")
+
+def test_messages_keep_the_values_they_were_logged_with(logger):
+    terminal = io.StringIO()
+    pipeline = LogPipeline(flush_interval=60)
+    pipeline.add_sink(TerminalSink(logging.DEBUG, stream=terminal))
+    logger.addHandler(pipeline)
+
+    async def scenario():
+        pipeline.start()
+        jobs = ['1']
+        logger.info("queued %s", jobs)
+        jobs.append('2')
+        await pipeline.stop()
+
+    asyncio.run(scenario())
+    assert terminal.getvalue() == "queued ['1']\n"
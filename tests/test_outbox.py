@@ -0,0 +1,102 @@
+import asyncio
+
+def job(job_id):
+    return {'id': str(job_id), 'title': f'Job {job_id}'}
+
+async def queue(monitor, targets):
+    """Queue jobs for each target like a monitor cycle would."""
+    await monitor.setup_database()
+    async with monitor.database.writer() as db:
+        for target, jobs in targets.items():
+            await monitor.enqueue_deliveries(db, jobs, target)
+        await db.commit()
+
+async def queued(monitor):
+    async with monitor.database.reader() as db:
+        async with db.execute('SELECT target, job_id FROM outbox ORDER BY id') as cursor:
+            return [tuple(row) for row in await cursor.fetchall()]
+
+def test_family_worker_sends_each_target_its_own_jobs(monitor):
+    sent = []
+
+    async def send(jobs, target):
+        sent.append((target, [job['id'] for job in jobs]))
+        return jobs
+
+    async def scenario():
+        # The same job can be queued for several members of a family and for other targets
+        await queue(monitor, {'dm:1': [job(1), job(2)], 'dm:2': [job(1)], 'default': [job(1)], 'dmz': [job(3)]})
+        worker = monitor.OutboxWorker(send, 'dm:*', window=0)
+        delivered = await worker.drain_once()
+        return delivered, await queued(monitor)
+
+    delivered, remaining = asyncio.run(scenario())
+    assert delivered == 3
+    assert sent == [('dm:1', ['1', '2']), ('dm:2', ['1'])]
+    assert remaining == [('default', '1'), ('dmz', '3')]
+    assert monitor.outbox_event('dm:42') is monitor.outbox_event('dm:*')
+
+async def drain_until_settled(monitor, worker, rounds):
+    """Drain the worker rounds times, making every retry due first."""
+    for _ in range(rounds):
+        async with monitor.database.writer() as db:
+            await db.execute('UPDATE outbox SET next_attempt_ts = 0')
+            await db.commit()
+        await worker.drain_once()
+
+def test_failed_deliveries_are_retried_with_backoff(monitor, monkeypatch):
+    monkeypatch.setattr(monitor, 'OUTBOX_RETRY_BASE', 30)
+    attempts = []
+
+    async def send(jobs):
+        attempts.append([job['id'] for job in jobs])
+        # Job 2 fails the first time round only
+        return [job for job in jobs if job['id'] != '2' or len(attempts) > 1]
+
+    async def scenario():
+        await queue(monitor, {'default': [job(1), job(2), job(3)]})
+        worker = monitor.OutboxWorker(send, window=0)
+        delivered = await worker.drain_once()
+        async with monitor.database.reader() as db:
+            async with db.execute('SELECT job_id, attempts, next_attempt_ts, last_error FROM outbox') as cursor:
+                waiting = await cursor.fetchall()
+        # Not due yet, so nothing is sent
+        await worker.drain_once()
+        await drain_until_settled(monitor, worker, 1)
+        return delivered, waiting, await queued(monitor)
+
+    started = int(monitor.time.time())
+    delivered, waiting, remaining = asyncio.run(scenario())
+    assert delivered == 2
+    [(job_id, tries, next_attempt_ts, error)] = waiting
+    assert (job_id, tries, error) == ('2', 1, "Delivery failed")
+    assert next_attempt_ts >= started + 30
+    assert attempts == [['1', '2', '3'], ['2']]
+    assert remaining == []
+
+def test_deliveries_are_dead_lettered_after_max_attempts(monitor, monkeypatch):
+    monkeypatch.setattr(monitor, 'OUTBOX_MAX_ATTEMPTS', 3)
+    attempts = []
+
+    async def send(jobs):
+        attempts.append([job['id'] for job in jobs])
+        if any(job['id'] == '2' for job in jobs):
+            raise RuntimeError("channel not found")
+        return jobs
+
+    async def scenario():
+        await queue(monitor, {'default': [job(2)], 'other': [job(1)]})
+        worker = monitor.OutboxWorker(send, window=0)
+        await drain_until_settled(monitor, worker, 4)
+        async with monitor.database.reader() as db:
+            async with db.execute('SELECT job_id, target, attempts, last_error FROM outbox_dead_letter') as cursor:
+                dead = [tuple(row) for row in await cursor.fetchall()]
+        metrics = await monitor.get_outbox_metrics()
+        return dead, await queued(monitor), metrics
+
+    dead, remaining, metrics = asyncio.run(scenario())
+    # Three attempts and then no more; deliveries for other targets are left alone
+    assert attempts == [['2'], ['2'], ['2']]
+    assert dead == [('2', 'default', 3, "channel not found")]
+    assert remaining == [('other', '1')]
+    assert metrics['dead_letters'] == 1 and metrics['depth'] == 1
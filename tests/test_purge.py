@@ -0,0 +1,53 @@
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+import bot
+import seek_jobs_monitor as seek
+
+CHANNEL_ID = 42
+
+def make_job(job_id, title, location, work_types=('Full time',)):
+    return {
+        'id': str(job_id),
+        'title': title,
+        'teaser': 'Join our team',
+        'advertiser': {'description': 'Acme'},
+        'locations': [{'label': location}],
+        'workTypes': list(work_types),
+        'listingDate': '2026-10-01T00:00:00Z'
+    }
+
+def message(message_id):
+    return SimpleNamespace(
+        id=message_id,
+        channel=SimpleNamespace(id=CHANNEL_ID),
+        created_at=SimpleNamespace(timestamp=lambda: 1790000000)
+    )
+
+async def purge_matches(terms):
+    await seek.setup_database()
+    await seek.save_and_enqueue([
+        make_job(1, 'Chef', 'Hobart TAS'),
+        make_job(2, 'Barista', 'Sydney NSW', ['Casual/Vacation']),
+        make_job(3, 'Cook', 'Hobart TAS'),
+        make_job(4, 'Waiter', 'Perth WA'),
+    ], [])
+    await bot.setup_job_messages_table()
+    # Jobs 1 and 2 have their own posts; jobs 3 and 4 share a digest message
+    await bot.record_job_messages([('1', message(101)), ('2', message(102)), ('3', message(103)), ('4', message(103))])
+    results = [await bot.find_job_messages(CHANNEL_ID, term) for term in terms]
+    await seek.cleanup()
+    return results
+
+@pytest.mark.parametrize('search_available', [True, False])
+def test_purge_matches_location_and_work_type(fresh_database, monkeypatch, search_available):
+    monkeypatch.setattr(seek, 'search_available', search_available)
+    hobart, casual, perth, acme = asyncio.run(purge_matches(['Hobart', 'casual', 'perth', 'acme']))
+    # The digest lists a Perth job too, so only the Hobart job's own post goes
+    assert hobart == ([(101, 1790000000)], 1)
+    assert casual == ([(102, 1790000000)], 0)
+    assert perth == ([], 1)
+    # A digest goes once every job it lists matches
+    assert (sorted(acme[0]), acme[1]) == ([(101, 1790000000), (102, 1790000000), (103, 1790000000)], 0)
@@ -0,0 +1,55 @@
+import asyncio
+
+def grant_order(ratelimit, requests, limit=1, window=0.05):
+    """Queue (name, route, priority) requests behind a spent bucket and return the order they are granted in."""
+    async def scenario():
+        limiter = ratelimit.RateLimiter(global_rate=1000)
+        granted = []
+
+        async def request(name, route, priority):
+            await limiter.acquire(route, priority)
+            granted.append(name)
+
+        for route in {route for _, route, _ in requests}:
+            limiter._buckets[route] = ratelimit.RateLimitBucket(limit=limit, window=window)
+            await limiter.acquire(route)  # Spend the bucket so everything after it has to wait
+        await asyncio.gather(*(request(*entry) for entry in requests))
+        return granted
+
+    return asyncio.run(scenario())
+
+def test_higher_priority_requests_go_first(ratelimit):
+    order = grant_order(ratelimit, [
+        ('log', 'channel:1', ratelimit.PRIORITY_LOGS),
+        ('reminder', 'channel:1', ratelimit.PRIORITY_USER),
+        ('job', 'channel:1', ratelimit.PRIORITY_JOBS),
+        ('second reminder', 'channel:1', ratelimit.PRIORITY_USER)
+    ])
+    # Equal priorities keep their arrival order
+    assert order == ['job', 'reminder', 'second reminder', 'log']
+
+def test_a_waiting_route_does_not_hold_up_another(ratelimit):
+    async def scenario():
+        limiter = ratelimit.RateLimiter(global_rate=1000)
+        limiter._buckets['channel:1'] = ratelimit.RateLimitBucket(limit=1, window=60)
+        await limiter.acquire('channel:1')
+        blocked = asyncio.create_task(limiter.acquire('channel:1', ratelimit.PRIORITY_JOBS))
+        # A lower priority request on a free route is granted while the job post waits
+        await asyncio.wait_for(limiter.acquire('channel:2', ratelimit.PRIORITY_LOGS), 1)
+        done = blocked.done()
+        blocked.cancel()
+        return done
+
+    assert asyncio.run(scenario()) is False
+
+def test_rate_limit_headers_hold_the_route_until_reset(ratelimit):
+    async def scenario():
+        limiter = ratelimit.RateLimiter(global_rate=1000)
+        limiter.rate_limited('webhook:1', {'Retry-After': '0.1'})
+        started = asyncio.get_running_loop().time()
+        await limiter.acquire('webhook:1')
+        return asyncio.get_running_loop().time() - started, limiter.metrics()
+
+    waited, metrics = asyncio.run(scenario())
+    assert waited >= 0.09
+    assert metrics['rate_limited'] == 1 and metrics['requests'] == 1
@@ -0,0 +1,27 @@
+import json
+
+def job(job_id, location):
+    return {'id': str(job_id), 'locations': [{'label': location}], 'classifications': []}
+
+def routing_table(monitor, monkeypatch, routes):
+    monkeypatch.setenv('JOB_ROUTES', json.dumps(routes))
+    return monitor.RoutingTable(monitor.load_routes())
+
+def routed(table, jobs):
+    return {target: [job['id'] for job in target_jobs] for target, target_jobs in table.route(jobs).items()}
+
+def test_routed_jobs_still_go_to_the_default_target(monitor, monkeypatch):
+    table = routing_table(monitor, monkeypatch, [
+        {'name': 'sydney', 'webhook': 'https://discord.test/sydney', 'location': 'Sydney NSW'},
+        {'name': 'nsw', 'webhook': 'https://discord.test/nsw', 'location': 'NSW'}
+    ])
+    jobs = [job(1, 'Chatswood, Sydney NSW'), job(2, 'Newcastle NSW'), job(3, 'Hobart TAS')]
+    assert routed(table, jobs) == {'default': ['1', '2', '3'], 'sydney': ['1'], 'nsw': ['1', '2']}
+
+def test_exclusive_routes_keep_their_jobs_out_of_the_default_target(monitor, monkeypatch):
+    table = routing_table(monitor, monkeypatch, [
+        {'name': 'sydney', 'webhook': 'https://discord.test/sydney', 'location': 'Sydney NSW', 'exclusive': True},
+        {'name': 'nsw', 'webhook': 'https://discord.test/nsw', 'location': 'NSW'}
+    ])
+    jobs = [job(1, 'Chatswood, Sydney NSW'), job(2, 'Newcastle NSW'), job(3, 'Hobart TAS')]
+    assert routed(table, jobs) == {'default': ['2', '3'], 'sydney': ['1'], 'nsw': ['1', '2']}
@@ -0,0 +1,38 @@
+import pytest
+
+import seek_jobs_monitor as seek
+
+@pytest.mark.parametrize('label, expected', [
+    # Ranges, with and without the $ and k repeated on the upper end
+    ('$80k - $95k', (80000, 95000, 'year')),
+    ('$80 - 95k', (80000, 95000, 'year')),
+    ('$80k-95k', (80000, 95000, 'year')),
+    ('80 - 95k', (80000, 95000, 'year')),
+    ('$90,000 to 100,000 p.a.', (90000, 100000, 'year')),
+    ('$100,000 - $120,000', (100000, 120000, 'year')),
+    # k suffix on a single amount
+    ('$120k', (120000, 120000, 'year')),
+    # Hourly and daily rates are annualized
+    ('$45 per hour', (45 * 38 * 52, 45 * 38 * 52, 'hour')),
+    ('$45 - 50 p/h', (45 * 38 * 52, 50 * 38 * 52, 'hour')),
+    ('$600 - $700 per day', (600 * 5 * 52, 700 * 5 * 52, 'day')),
+    ('$650', (650 * 5 * 52, 650 * 5 * 52, 'day')),
+    # "+ super" is on top of the base; packages including super are reduced to base
+    ('$80k - $95k + super', (80000, 95000, 'year')),
+    ('$120k plus super', (120000, 120000, 'year')),
+])
+def test_parse_salary(label, expected):
+    salary = seek.parse_salary(label)
+    assert (salary.min, salary.max, salary.period) == expected
+
+def test_parse_salary_removes_included_super():
+    salary = seek.parse_salary('$112,000 including super')
+    assert salary.min == salary.max == round(112000 / (1 + seek.SALARY_SUPER_RATE))
+
+def test_parse_salary_ignores_bare_numbers_beside_dollar_amounts():
+    salary = seek.parse_salary('$30 p/h, 38 hours per week')
+    assert (salary.min, salary.max, salary.period) == (30 * 38 * 52, 30 * 38 * 52, 'hour')
+
+@pytest.mark.parametrize('label', [None, '', 'Competitive', 'Attractive package + super'])
+def test_parse_salary_without_amount(label):
+    assert seek.parse_salary(label) is None
@@ -0,0 +1,145 @@
+import asyncio
+import calendar
+import time
+
+import aiosqlite
+
+import bot
+import seek_jobs_monitor as seek
+
+# saved_jobs as it was created before saved jobs were per user
+BASELINE_SAVED_JOBS_SQL = '''
+    CREATE TABLE saved_jobs (
+        job_id TEXT PRIMARY KEY,
+        user_id TEXT,
+        saved_date TEXT,
+        last_reminder_date TEXT,
+        reminder_count INTEGER DEFAULT 0,
+        status TEXT DEFAULT 'saved',
+        message_id TEXT,
+        ai_compatibility_score REAL,
+        ai_compatibility_details TEXT,
+        last_analyzed_date TEXT,
+        FOREIGN KEY (job_id) REFERENCES jobs (id)
+    )
+'''
+
+async def migrate_baseline(path, rows):
+    async with aiosqlite.connect(path) as db:
+        await db.execute(BASELINE_SAVED_JOBS_SQL)
+        await db.executemany('''
+            INSERT INTO saved_jobs (job_id, user_id, saved_date, last_reminder_date, reminder_count, status,
+                                    message_id, ai_compatibility_score, ai_compatibility_details)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+        ''', rows)
+        await db.commit()
+        await bot.migrate_saved_jobs_table(db)
+        await bot.create_saved_jobs_indexes(db)
+        async with db.execute('PRAGMA table_info(saved_jobs)') as cursor:
+            columns = await cursor.fetchall()
+        primary_key = [column[1] for column in sorted(columns, key=lambda column: column[5]) if column[5]]
+        db.row_factory = aiosqlite.Row
+        async with db.execute('SELECT * FROM saved_jobs ORDER BY job_id') as cursor:
+            saved = [dict(row) for row in await cursor.fetchall()]
+        # Another user can now save a job that is already saved
+        await db.execute("INSERT INTO saved_jobs (job_id, user_id, saved_ts) VALUES ('1', '200', 0)")
+        await db.commit()
+        async with db.execute("SELECT user_id FROM saved_jobs WHERE job_id = '1' ORDER BY user_id") as cursor:
+            savers = [row['user_id'] for row in await cursor.fetchall()]
+    return primary_key, saved, savers
+
+def test_rebuild_rekeys_baseline_saved_jobs(tmp_path):
+    rows = [
+        ('1', '100', '2026-10-01 09:30:00', '2026-10-02 09:30:00', 1, 'saved', '555', 0.8, 'Good fit'),
+        ('2', '100', None, None, 0, 'applied', '556', None, None),
+        ('3', None, '2026-10-01 10:00:00', None, 0, 'saved', '557', None, None),
+    ]
+    primary_key, saved, savers = asyncio.run(migrate_baseline(str(tmp_path / 'jobs.db'), rows))
+
+    assert primary_key == ['user_id', 'job_id']
+    # Rows without an owner cannot be keyed and are dropped
+    assert [row['job_id'] for row in saved] == ['1', '2']
+    first, second = saved
+    assert (first['user_id'], first['status'], first['reminder_count'], first['message_id']) == ('100', 'saved', 1, '555')
+    assert (first['ai_compatibility_score'], first['ai_compatibility_details']) == (0.8, 'Good fit')
+    assert first['saved_ts'] == calendar.timegm(time.strptime('2026-10-01 09:30:00', '%Y-%m-%d %H:%M:%S'))
+    assert first['last_reminder_ts'] == first['saved_ts'] + 24 * 60 * 60
+    assert first['next_reminder_ts'] == first['last_reminder_ts'] + bot.REMINDER_INTERVAL
+    # Jobs without a save date sort last and applied jobs get no reminders
+    assert second['saved_ts'] == 0
+    assert second['next_reminder_ts'] is None
+    assert savers == ['100', '200']
+
+def test_rebuild_is_skipped_once_rekeyed(tmp_path):
+    async def scenario():
+        path = str(tmp_path / 'jobs.db')
+        await migrate_baseline(path, [('1', '100', '2026-10-01 09:30:00', None, 0, 'saved', '555', None, None)])
+        async with aiosqlite.connect(path) as db:
+            await bot.migrate_saved_jobs_table(db)
+            async with db.execute('SELECT COUNT(*) FROM saved_jobs') as cursor:
+                return (await cursor.fetchone())[0]
+
+    assert asyncio.run(scenario()) == 2
+
+def test_saved_jobs_pages_by_keyset(fresh_database):
+    jobs = [{
+        'id': str(job_id),
+        'title': f'Job {job_id}',
+        'advertiser': {'description': 'Acme'},
+        'locations': [{'label': 'Sydney NSW'}],
+        'listingDate': '2026-10-01T00:00:00Z'
+    } for job_id in range(1, 6)]
+
+    async def scenario():
+        await seek.setup_database()
+        await seek.save_and_enqueue(jobs, [])
+        await bot.setup_saved_jobs_table()
+        async with seek.database.writer() as db:
+            # Jobs 4 and 5 share a save time so the cursor has to break the tie on job_id
+            await db.executemany(
+                "INSERT INTO saved_jobs (job_id, user_id, status, saved_ts) VALUES (?, '100', 'saved', ?)",
+                [('1', 100), ('2', 200), ('3', 300), ('4', 400), ('5', 400)]
+            )
+            await db.execute("INSERT INTO saved_jobs (job_id, user_id, status, saved_ts) VALUES ('3', '200', 'saved', 500)")
+            await db.commit()
+        pages, after = [], None
+        while True:
+            rows, after = await bot.get_saved_jobs_page('100', after=after, page_size=2)
+            pages.append([row['job_id'] for row in rows])
+            if after is None:
+                break
+        total = await bot.count_saved_jobs('100')
+        await seek.cleanup()
+        return pages, total
+
+    pages, total = asyncio.run(scenario())
+    assert pages == [['5', '4'], ['3', '2'], ['1']]
+    assert total == 5
+
+def test_reminders_find_their_job_when_saved_from_a_digest(fresh_database):
+    from types import SimpleNamespace
+
+    def reminder(url=None, message_id='900'):
+        embed = bot.discord.Embed(title="Job Application Reminder", url=url)
+        embed.add_field(name="Job Details", value=f"[View Original Post](https://discord.com/channels/1/2/{message_id})")
+        return SimpleNamespace(message=SimpleNamespace(embeds=[embed]), user=SimpleNamespace(id=100))
+
+    async def scenario():
+        await seek.setup_database()
+        await bot.setup_saved_jobs_table()
+        # Two jobs saved from the same digest message share its message_id
+        await bot.save_job_for_user('1', 100, '900')
+        await bot.save_job_for_user('2', 100, '900')
+        found = [
+            await bot.get_reminder_job_id(reminder('https://www.seek.com.au/job/1')),
+            await bot.get_reminder_job_id(reminder('https://www.seek.com.au/job/2')),
+            await bot.get_reminder_job_id(reminder()),
+            await bot.get_reminder_job_id(reminder(message_id='901'))
+        ]
+        await seek.cleanup()
+        return found
+
+    by_url_1, by_url_2, legacy, unknown = asyncio.run(scenario())
+    assert (by_url_1, by_url_2) == ('1', '2')
+    # Older reminders only have the shared message link, so they fall back to one of the user's saves
+    assert legacy in ('1', '2') and unknown is None
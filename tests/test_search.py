@@ -0,0 +1,56 @@
+import asyncio
+
+import pytest
+
+import seek_jobs_monitor as seek
+
+@pytest.mark.parametrize('text, expected', [
+    ('python', '"python"*'),
+    ('Python Developer', '"python" "developer"*'),
+    ('  senior   python  dev ', '"senior" "python" "dev"*'),
+    # FTS5 syntax in user input is reduced to plain terms
+    ('c++ "dev" OR NEAR(x', '"c" "dev" "or" "near" "x"*'),
+    ('data-engineer', '"data" "engineer"*'),
+])
+def test_search_query(text, expected):
+    assert seek.search_query(text) == expected
+
+@pytest.mark.parametrize('text', ['', '   ', '"*()-+'])
+def test_search_query_without_terms(text):
+    assert seek.search_query(text) is None
+
+def make_job(job_id, title, teaser, company='Acme'):
+    return {
+        'id': str(job_id),
+        'title': title,
+        'teaser': teaser,
+        'advertiser': {'description': company},
+        'locations': [{'label': 'Sydney NSW'}],
+        'listingDate': '2026-10-01T00:00:00Z'
+    }
+
+def test_search_jobs_ranks_and_pages_results(fresh_database):
+    async def scenario():
+        await seek.setup_database()
+        await seek.save_and_enqueue([
+            make_job(1, 'Python Developer', 'Build APIs'),
+            make_job(2, 'Data Analyst', 'Reporting with Python and SQL'),
+            make_job(3, 'Java Developer', 'Spring services'),
+        ], [])
+        prefix = await seek.search_jobs('pyth')
+        first_page = await seek.search_jobs('python', page=0, page_size=1)
+        second_page = await seek.search_jobs('python', page=1, page_size=1)
+        # Deleting a job removes it from the index through the trigger
+        async with seek.database.writer() as db:
+            await db.execute("DELETE FROM jobs WHERE id = '1'")
+        after_delete = await seek.search_jobs('python')
+        await seek.cleanup()
+        return prefix, first_page, second_page, after_delete
+
+    prefix, first_page, second_page, after_delete = asyncio.run(scenario())
+    assert prefix[0] == 2
+    # Title matches outrank description matches
+    assert first_page[0] == 2 and [job['id'] for job in first_page[1]] == ['1']
+    assert [job['id'] for job in second_page[1]] == ['2']
+    assert '**Python**' in second_page[1][0]['snippet']
+    assert after_delete[0] == 1 and after_delete[1][0]['id'] == '2'
@@ -0,0 +1,112 @@
+import asyncio
+
+SEARCH = {'name': 'test'}
+
+def listing(job_id, day, featured=False):
+    return {
+        'id': str(job_id),
+        'title': f'Job {job_id}',
+        'advertiser': {'description': 'Acme'},
+        'locations': [{'label': 'Sydney NSW'}],
+        'listingDate': f'2026-10-{day:02d}T00:00:00Z',
+        'isFeatured': featured
+    }
+
+def serve(monitor, monkeypatch, listings, page_size=2, max_pages=3):
+    """Answer SEEK page requests from listings, recording the pages asked for."""
+    requested = []
+
+    async def fetch_jobs_page(params, page):
+        requested.append(page)
+        return listings[(page - 1) * page_size:page * page_size]
+
+    monkeypatch.setattr(monitor, 'fetch_jobs_page', fetch_jobs_page)
+    monkeypatch.setattr(monitor, 'SEEK_PAGE_SIZE', page_size)
+    monkeypatch.setattr(monitor, 'SEEK_MAX_PAGES', max_pages)
+    return requested
+
+async def poll(monitor):
+    """Fetch the test search and save what it found, like one monitor cycle."""
+    jobs, watermark = await monitor.fetch_jobs(SEARCH)
+    await monitor.save_and_enqueue(jobs, [], [watermark] if watermark else [])
+    async with monitor.database.reader() as db:
+        mark = await monitor.get_watermark(db, SEARCH['name'])
+    return [job['id'] for job in jobs], watermark, mark
+
+def run_polls(monitor, monkeypatch, *feeds):
+    """Run one poll per feed of SEEK listings. Returns the pages each poll asked for and its results."""
+    async def scenario():
+        await monitor.setup_database()
+        pages, results = [], []
+        for listings in feeds:
+            pages.append(serve(monitor, monkeypatch, listings))
+            results.append(await poll(monitor))
+        await monitor.cleanup()
+        return pages, results
+    return asyncio.run(scenario())
+
+def test_first_crawl_reads_one_page(monitor, monkeypatch):
+    [requested], [(jobs, watermark, mark)] = run_polls(monitor, monkeypatch, [listing(job_id, 20 - job_id) for job_id in range(1, 7)])
+    assert requested == [1]
+    assert jobs == ['1', '2']
+    assert mark == ('2026-10-19T00:00:00Z', '1')
+
+def test_walks_pages_down_to_the_mark(monitor, monkeypatch):
+    older = [listing(1, 9), listing(2, 8)]
+    feeds = [older, [listing(job_id, 30 - job_id) for job_id in range(11, 14)] + older]
+    pages, results = run_polls(monitor, monkeypatch, *feeds)
+    assert results[0][2] == ('2026-10-09T00:00:00Z', '1')
+    # Three new listings push the mark onto page 2, which is as far as the walk goes
+    assert pages[1] == [1, 2]
+    assert results[1][0] == ['11', '12', '13', '1']
+    assert results[1][2] == ('2026-10-19T00:00:00Z', '11')
+
+def test_featured_listings_do_not_stop_the_walk(monitor, monkeypatch):
+    feeds = [
+        [listing(1, 5)],
+        # A featured listing pinned to the top is older than the mark but says nothing about the pages below
+        [listing(9, 1, featured=True), listing(11, 9), listing(12, 8), listing(1, 5)],
+    ]
+    pages, results = run_polls(monitor, monkeypatch, *feeds)
+    assert pages[1] == [1, 2]
+    assert results[1][0] == ['9', '11', '12', '1']
+    assert results[1][2] == ('2026-10-09T00:00:00Z', '11')
+
+def test_page_limit_advances_the_mark(monitor, monkeypatch, caplog):
+    burst = [listing(job_id, 30 - job_id) for job_id in range(11, 21)] + [listing(1, 5)]
+    recovered = [listing(21, 29)] + burst
+    pages, results = run_polls(monitor, monkeypatch, [listing(1, 5)], burst, recovered)
+
+    # The burst is deeper than the page limit, so the walk stops short of the old mark...
+    assert pages[1] == [1, 2, 3]
+    assert results[1][0] == ['11', '12', '13', '14', '15', '16']
+    assert 'may have been missed' in caplog.text
+    # ...but the mark still moves to the newest job, so the next poll stops on page 1 again
+    assert results[1][2] == ('2026-10-19T00:00:00Z', '11')
+    assert pages[2] == [1]
+    assert results[2][2] == ('2026-10-29T00:00:00Z', '21')
+
+def test_failed_save_keeps_the_mark(monitor, monkeypatch):
+    async def scenario():
+        await monitor.setup_database()
+        serve(monitor, monkeypatch, [listing(1, 5)])
+        await poll(monitor)
+        serve(monitor, monkeypatch, [listing(2, 6), listing(1, 5)])
+        jobs, watermark = await monitor.fetch_jobs(SEARCH)
+
+        async def broken_enqueue(db, jobs, target=None):
+            raise RuntimeError('disk full')
+
+        monkeypatch.setattr(monitor, 'enqueue_deliveries', broken_enqueue)
+        try:
+            await monitor.save_and_enqueue(jobs, jobs, [watermark])
+        except RuntimeError:
+            pass
+        async with monitor.database.reader() as db:
+            mark = await monitor.get_watermark(db, SEARCH['name'])
+        await monitor.cleanup()
+        return watermark, mark
+
+    watermark, mark = asyncio.run(scenario())
+    assert watermark == ('test', '2026-10-06T00:00:00Z', '2')
+    assert mark == ('2026-10-05T00:00:00Z', '1')
@@ -0,0 +1,41 @@
+import asyncio
+
+def batches(jobs, size=2):
+    """Pack jobs into messages of size embeds, one job per embed."""
+    return [
+        ([[job] for job in jobs[start:start + size]], [job['id'] for job in jobs[start:start + size]])
+        for start in range(0, len(jobs), size)
+    ]
+
+def send(monitor, monkeypatch, outcomes, count=6):
+    """Send count jobs through a WebhookSender whose posts return outcomes[message embeds]."""
+    jobs = [{'id': str(job_id)} for job_id in range(1, count + 1)]
+    posted = []
+
+    async def post(embeds, max_retries=3):
+        # Later messages finish sooner, so sends that overlap would land out of order
+        await asyncio.sleep(0.01 / len(posted + [None]))
+        posted.append(embeds)
+        return outcomes.get(tuple(embeds), True)
+
+    monkeypatch.setattr(monitor, 'batch_embeds', batches)
+    sender = monitor.WebhookSender('https://discord.test/webhook')
+    monkeypatch.setattr(sender, 'post', post)
+    delivered = asyncio.run(sender.send_jobs(jobs))
+    return posted, [job['id'] for job in delivered]
+
+def test_messages_are_sent_in_order(monitor, monkeypatch):
+    posted, delivered = send(monitor, monkeypatch, {})
+    assert posted == [['1', '2'], ['3', '4'], ['5', '6']]
+    assert delivered == ['1', '2', '3', '4', '5', '6']
+
+def test_sending_stops_at_a_message_that_keeps_failing(monitor, monkeypatch):
+    posted, delivered = send(monitor, monkeypatch, {('3', '4'): None})
+    # The jobs after it stay queued so they cannot overtake it
+    assert posted == [['1', '2'], ['3', '4']]
+    assert delivered == ['1', '2']
+
+def test_rejected_message_is_resent_one_embed_at_a_time(monitor, monkeypatch):
+    posted, delivered = send(monitor, monkeypatch, {('3', '4'): False, ('4',): False})
+    assert posted == [['1', '2'], ['3', '4'], ['3'], ['4'], ['5', '6']]
+    assert delivered == ['1', '2', '3', '5', '6']